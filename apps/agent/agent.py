@@ -4,11 +4,17 @@ This is the entry point for the LiveKit Agents CLI.
 Run with: uv run agent.py [console|dev|start|download-files]
 """
 
+import asyncio
 from pathlib import Path
 
+import uvloop
 from dotenv import load_dotenv
 from livekit import agents
 
+# Set at import time so job processes, which re-import this module when
+# spawned, create uvloop event loops as well
+asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+
 # Load environment variables from project root
 project_root = Path(__file__).parent.parent.parent
 load_dotenv(project_root / ".env")
@@ -33,7 +33,6 @@ def upgrade() -> None:
         sa.Column("ended_at", sa.DateTime(timezone=True), nullable=True),
         sa.PrimaryKeyConstraint("id"),
     )
-    op.create_index(op.f("ix_sessions_room_name"), "sessions", ["room_name"], unique=False)
 
     # Create messages table
     op.create_table(
@@ -50,7 +49,26 @@ def upgrade() -> None:
         ),
         sa.PrimaryKeyConstraint("id"),
     )
-    op.create_index(op.f("ix_messages_session_id"), "messages", ["session_id"], unique=False)
+
+    # Build indexes concurrently, outside the migration transaction, so
+    # re-running against a populated database does not block writes
+    with op.get_context().autocommit_block():
+        op.create_index(
+            op.f("ix_sessions_room_name"),
+            "sessions",
+            ["room_name"],
+            unique=False,
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.create_index(
+            op.f("ix_messages_session_id"),
+            "messages",
+            ["session_id"],
+            unique=False,
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
 
 
 def downgrade() -> None:
@@ -57,10 +57,32 @@ def upgrade() -> None:
         sa.PrimaryKeyConstraint("id"),
     )
 
-    # Create indexes
-    op.create_index(op.f("ix_recordings_session_id"), "recordings", ["session_id"], unique=False)
-    op.create_index(op.f("ix_recordings_egress_id"), "recordings", ["egress_id"], unique=True)
-    op.create_index(op.f("ix_recordings_status"), "recordings", ["status"], unique=False)
+    # Create indexes concurrently, outside the migration transaction
+    with op.get_context().autocommit_block():
+        op.create_index(
+            op.f("ix_recordings_session_id"),
+            "recordings",
+            ["session_id"],
+            unique=False,
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.create_index(
+            op.f("ix_recordings_egress_id"),
+            "recordings",
+            ["egress_id"],
+            unique=True,
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.create_index(
+            op.f("ix_recordings_status"),
+            "recordings",
+            ["status"],
+            unique=False,
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
 
 
 def downgrade() -> None:
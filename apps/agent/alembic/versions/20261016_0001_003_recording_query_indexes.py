@@ -0,0 +1,76 @@
+"""Replace single-column recording indexes with query-shaped ones.
+
+Revision ID: 003
+Revises: 002
+Create Date: 2026-10-16
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "003"
+down_revision: str | None = "002"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+# Statuses of recordings that are still in flight
+_ACTIVE_STATUSES = "status IN ('starting', 'active')"
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        # Serves "latest recording for a session" (session_id filter, created_at DESC)
+        op.create_index(
+            "ix_recordings_session_created",
+            "recordings",
+            ["session_id", sa.text("created_at DESC")],
+            unique=False,
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        # Small partial index over the few recordings not yet in a terminal state
+        op.create_index(
+            "ix_recordings_active",
+            "recordings",
+            ["status"],
+            unique=False,
+            postgresql_where=sa.text(_ACTIVE_STATUSES),
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        # Superseded by the composite index's leading column
+        op.drop_index(
+            op.f("ix_recordings_session_id"),
+            table_name="recordings",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            op.f("ix_recordings_session_id"),
+            "recordings",
+            ["session_id"],
+            unique=False,
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.drop_index(
+            "ix_recordings_active",
+            table_name="recordings",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+        op.drop_index(
+            "ix_recordings_session_created",
+            table_name="recordings",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
@@ -0,0 +1,132 @@
+"""Store role and status columns as native PostgreSQL enums.
+
+Revision ID: 004
+Revises: 003
+Create Date: 2026-10-16
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "004"
+down_revision: str | None = "003"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+message_role = postgresql.ENUM(
+    "user", "assistant", "system", name="message_role", create_type=False
+)
+session_status = postgresql.ENUM(
+    "pending", "active", "completed", "failed", name="session_status", create_type=False
+)
+recording_status = postgresql.ENUM(
+    "starting",
+    "active",
+    "processing",
+    "completed",
+    "failed",
+    name="recording_status",
+    create_type=False,
+)
+
+# Partial index whose predicate references recordings.status
+_ACTIVE_STATUSES = "status IN ('starting', 'active')"
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    message_role.create(bind, checkfirst=True)
+    session_status.create(bind, checkfirst=True)
+    recording_status.create(bind, checkfirst=True)
+
+    op.alter_column(
+        "messages",
+        "role",
+        type_=message_role,
+        existing_type=sa.String(length=20),
+        existing_nullable=False,
+        postgresql_using="role::message_role",
+    )
+
+    # Defaults must be dropped before the type change and restored after
+    op.alter_column("sessions", "status", server_default=None)
+    op.alter_column(
+        "sessions",
+        "status",
+        type_=session_status,
+        existing_type=sa.String(length=50),
+        existing_nullable=False,
+        postgresql_using="status::session_status",
+    )
+    op.alter_column("sessions", "status", server_default="pending")
+
+    op.drop_index("ix_recordings_active", table_name="recordings")
+    op.alter_column("recordings", "status", server_default=None)
+    op.alter_column(
+        "recordings",
+        "status",
+        type_=recording_status,
+        existing_type=sa.String(length=50),
+        existing_nullable=False,
+        postgresql_using="status::recording_status",
+    )
+    op.alter_column("recordings", "status", server_default="starting")
+    op.create_index(
+        "ix_recordings_active",
+        "recordings",
+        ["status"],
+        unique=False,
+        postgresql_where=sa.text(_ACTIVE_STATUSES),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_recordings_active", table_name="recordings")
+    op.alter_column("recordings", "status", server_default=None)
+    op.alter_column(
+        "recordings",
+        "status",
+        type_=sa.String(length=50),
+        existing_type=recording_status,
+        existing_nullable=False,
+        postgresql_using="status::text",
+    )
+    op.alter_column("recordings", "status", server_default="starting")
+    op.create_index(
+        "ix_recordings_active",
+        "recordings",
+        ["status"],
+        unique=False,
+        postgresql_where=sa.text(_ACTIVE_STATUSES),
+    )
+
+    op.alter_column("sessions", "status", server_default=None)
+    op.alter_column(
+        "sessions",
+        "status",
+        type_=sa.String(length=50),
+        existing_type=session_status,
+        existing_nullable=False,
+        postgresql_using="status::text",
+    )
+    op.alter_column("sessions", "status", server_default="pending")
+
+    op.alter_column(
+        "messages",
+        "role",
+        type_=sa.String(length=20),
+        existing_type=message_role,
+        existing_nullable=False,
+        postgresql_using="role::text",
+    )
+
+    bind = op.get_bind()
+    recording_status.drop(bind, checkfirst=True)
+    session_status.drop(bind, checkfirst=True)
+    message_role.drop(bind, checkfirst=True)
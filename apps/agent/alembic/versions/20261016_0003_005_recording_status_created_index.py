@@ -0,0 +1,57 @@
+"""Index recordings by status and creation time.
+
+Revision ID: 005
+Revises: 004
+Create Date: 2026-10-16
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "005"
+down_revision: str | None = "004"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        # Serves status-filtered listings ordered newest first without a sort
+        op.create_index(
+            "ix_recordings_status_created",
+            "recordings",
+            ["status", sa.text("created_at DESC")],
+            unique=False,
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        # Superseded by the composite index's leading column
+        op.drop_index(
+            op.f("ix_recordings_status"),
+            table_name="recordings",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            op.f("ix_recordings_status"),
+            "recordings",
+            ["status"],
+            unique=False,
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.drop_index(
+            "ix_recordings_status_created",
+            table_name="recordings",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
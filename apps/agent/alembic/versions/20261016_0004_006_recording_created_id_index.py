@@ -0,0 +1,42 @@
+"""Index recordings by creation time and ID for keyset pagination.
+
+Revision ID: 006
+Revises: 005
+Create Date: 2026-10-16
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "006"
+down_revision: str | None = "005"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        # Serves (created_at, id) cursor pages newest first as a bounded index scan
+        op.create_index(
+            "ix_recordings_created_id",
+            "recordings",
+            [sa.text("created_at DESC"), sa.text("id DESC")],
+            unique=False,
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_recordings_created_id",
+            table_name="recordings",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
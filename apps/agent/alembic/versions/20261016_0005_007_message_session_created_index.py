@@ -0,0 +1,56 @@
+"""Index messages by session, creation time and ID for keyset reads.
+
+Revision ID: 007
+Revises: 006
+Create Date: 2026-10-16
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "007"
+down_revision: str | None = "006"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        # Serves (created_at, id) cursor pages and latest-N reads within a
+        # session as bounded index scans in either direction
+        op.create_index(
+            "ix_messages_session_created_id",
+            "messages",
+            ["session_id", "created_at", "id"],
+            unique=False,
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        # Superseded by the composite index's leading column
+        op.drop_index(
+            op.f("ix_messages_session_id"),
+            table_name="messages",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            op.f("ix_messages_session_id"),
+            "messages",
+            ["session_id"],
+            unique=False,
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.drop_index(
+            "ix_messages_session_created_id",
+            table_name="messages",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
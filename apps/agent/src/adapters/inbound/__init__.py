@@ -1,15 +1,24 @@
 """Inbound adapters - Entry points (LiveKit workers, API handlers)."""
 
+from typing import TYPE_CHECKING
+from typing import Any
+
 from src.adapters.inbound.http_server import create_app
 from src.adapters.inbound.http_server import run_server
-from src.adapters.inbound.livekit_worker import EchoSphereAssistant
-from src.adapters.inbound.livekit_worker import create_session
-from src.adapters.inbound.livekit_worker import entrypoint
-from src.adapters.inbound.livekit_worker import server
 from src.adapters.inbound.recording_api import create_recording_router
 from src.adapters.inbound.webhook_handler import WebhookHandler
 from src.adapters.inbound.webhook_handler import create_webhook_receiver
 
+if TYPE_CHECKING:
+    from src.adapters.inbound.livekit_worker import EchoSphereAssistant
+    from src.adapters.inbound.livekit_worker import create_session
+    from src.adapters.inbound.livekit_worker import entrypoint
+    from src.adapters.inbound.livekit_worker import server
+
+# Resolved on first access: importing the worker registers the LiveKit
+# plugins (ONNX Runtime, turn detector), which the HTTP API never needs
+_WORKER_EXPORTS = frozenset({"EchoSphereAssistant", "create_session", "entrypoint", "server"})
+
 __all__ = [
     "EchoSphereAssistant",
     "WebhookHandler",
@@ -21,3 +30,12 @@ __all__ = [
     "run_server",
     "server",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import LiveKit worker exports on first access."""
+    if name in _WORKER_EXPORTS:
+        from src.adapters.inbound import livekit_worker  # noqa: PLC0415
+
+        return getattr(livekit_worker, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
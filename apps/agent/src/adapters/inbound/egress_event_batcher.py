@@ -0,0 +1,105 @@
+"""Micro-batching queue for acknowledged egress webhook events.
+
+Egress webhooks tend to arrive in bursts (a room ends and all of its
+egresses finalize at once). Events are queued after verification and
+applied in batches, so a burst shares one database session instead of
+opening one per webhook.
+"""
+
+import asyncio
+from collections.abc import Awaitable
+from collections.abc import Callable
+
+import structlog
+
+from src.domain.value_objects import EgressInfo
+
+logger = structlog.get_logger()
+
+
+class EgressEventBatcher:
+    """Collects egress events and hands them to a batch processor."""
+
+    def __init__(
+        self,
+        process_batch: Callable[[list[EgressInfo]], Awaitable[None]],
+        max_batch_size: int = 64,
+        max_delay: float = 0.02,
+        max_queue_size: int = 1024,
+    ) -> None:
+        """Initialize the batcher.
+
+        Args:
+            process_batch: Coroutine function applying a batch of events.
+            max_batch_size: Maximum number of events per batch.
+            max_delay: Seconds to wait for more events after the first one.
+            max_queue_size: Maximum number of queued events.
+        """
+        self._process_batch = process_batch
+        self._max_batch_size = max_batch_size
+        self._max_delay = max_delay
+        # None is the shutdown sentinel
+        self._queue: asyncio.Queue[EgressInfo | None] = asyncio.Queue(maxsize=max_queue_size)
+        self._task: asyncio.Task[None] | None = None
+
+    def start(self) -> None:
+        """Start the background task draining the queue."""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    def submit(self, egress_info: EgressInfo) -> bool:
+        """Queue an event for batched processing.
+
+        Args:
+            egress_info: The egress event to apply.
+
+        Returns:
+            True if queued; False if the batcher is not running or the
+            queue is full, in which case the caller should apply it itself.
+        """
+        if self._task is None or self._task.done():
+            return False
+        try:
+            self._queue.put_nowait(egress_info)
+        except asyncio.QueueFull:
+            logger.warning("egress_event_queue_full", egress_id=egress_info.egress_id)
+            return False
+        return True
+
+    async def close(self) -> None:
+        """Process the events already queued, then stop."""
+        if self._task is None:
+            return
+        await self._queue.put(None)
+        await self._task
+        self._task = None
+
+    async def _run(self) -> None:
+        """Drain the queue in batches until the shutdown sentinel arrives."""
+        loop = asyncio.get_running_loop()
+        closed = False
+
+        while not closed:
+            first = await self._queue.get()
+            if first is None:
+                return
+
+            batch = [first]
+            deadline = loop.time() + self._max_delay
+            while len(batch) < self._max_batch_size:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    event = await asyncio.wait_for(self._queue.get(), timeout)
+                except TimeoutError:
+                    break
+                if event is None:
+                    closed = True
+                    break
+                batch.append(event)
+
+            try:
+                await self._process_batch(batch)
+            except Exception as e:
+                logger.error("egress_batch_failed", count=len(batch), error=str(e))
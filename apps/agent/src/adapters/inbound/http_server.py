@@ -5,8 +5,12 @@ This module provides the HTTP API server for:
 - Recording list and playback URL APIs
 """
 
+import asyncio
 from collections.abc import AsyncGenerator
+from collections.abc import Coroutine
 from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from typing import Any
 
 import structlog
 import uvicorn
@@ -15,21 +19,38 @@ from fastapi import Depends
 from fastapi import FastAPI
 from fastapi import Header
 from fastapi import Request
+from fastapi.responses import ORJSONResponse
 from sqlalchemy.ext.asyncio import AsyncSession
+from starlette.types import ASGIApp
+from starlette.types import Receive
+from starlette.types import Scope
+from starlette.types import Send
 
+from src.adapters.inbound.egress_event_batcher import EgressEventBatcher
 from src.adapters.inbound.recording_api import create_recording_router
 from src.adapters.inbound.webhook_handler import WebhookHandler
 from src.adapters.inbound.webhook_handler import create_webhook_receiver
+from src.adapters.outbound import CachedRecordingRepository
 from src.adapters.outbound import Database
 from src.adapters.outbound import LiveKitEgressAdapter
 from src.adapters.outbound import PostgresRecordingRepository
+from src.adapters.outbound import RecordingCache
 from src.adapters.outbound import S3StorageAdapter
+from src.application.ports import RecordingRepositoryPort
 from src.application.use_cases.recording_service import RecordingService
 from src.config.settings import Settings
 from src.config.settings import get_settings
+from src.domain.value_objects import EgressInfo
 
 logger = structlog.get_logger()
 
+# Pool connections opened at startup so the first requests skip the handshake
+_POOL_WARMUP_CONNECTIONS = 5
+
+# Per-session recording lookups are cached briefly to absorb polling bursts
+_RECORDING_CACHE_SIZE = 1024
+_RECORDING_CACHE_TTL_SECONDS = 5.0
+
 
 class AppState:
     """Application state holder for shared resources."""
@@ -37,6 +58,8 @@ class AppState:
     database: Database | None = None
     egress_adapter: LiveKitEgressAdapter | None = None
     storage_adapter: S3StorageAdapter | None = None
+    recording_cache: RecordingCache | None = None
+    egress_batcher: EgressEventBatcher | None = None
     settings: Settings | None = None
 
 
@@ -44,28 +67,62 @@ class AppState:
 _app_state = AppState()
 
 
-async def get_db_session() -> AsyncGenerator[AsyncSession, None]:
-    """Get database session dependency.
+# Database session bound to the current HTTP request
+_request_session: ContextVar[AsyncSession | None] = ContextVar("request_session", default=None)
+
 
-    Yields:
-        AsyncSession for database operations.
+class RequestSessionMiddleware:
+    """ASGI middleware that binds one database session to each HTTP request.
+
+    The session is published through a context variable, so dependencies
+    can look it up directly instead of resolving a ``Depends`` chain.
     """
-    if _app_state.database is None:
-        raise RuntimeError("Database not initialized")
-    async with _app_state.database.get_session() as session:
-        yield session
 
+    def __init__(self, app: ASGIApp) -> None:
+        """Initialize the middleware.
 
-async def get_recording_service(
-    session: AsyncSession = Depends(get_db_session),
-) -> RecordingService:
-    """Get RecordingService dependency with per-request session.
+        Args:
+            app: The wrapped ASGI application.
+        """
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Run the request with a bound database session."""
+        if scope["type"] != "http" or _app_state.database is None:
+            await self.app(scope, receive, send)
+            return
+
+        async with _app_state.database.get_session() as session:
+            token = _request_session.set(session)
+            try:
+                await self.app(scope, receive, send)
+            finally:
+                _request_session.reset(token)
+
+
+def _create_recording_repository(session: AsyncSession) -> RecordingRepositoryPort:
+    """Build the recording repository for a database session.
 
     Args:
-        session: Database session from dependency injection.
+        session: The database session to use.
 
     Returns:
-        RecordingService configured for this request.
+        Recording repository, backed by the shared lookup cache when enabled.
+    """
+    repository = PostgresRecordingRepository(session)
+    if _app_state.recording_cache is None:
+        return repository
+    return CachedRecordingRepository(repository, _app_state.recording_cache)
+
+
+def _create_recording_service(recording_repo: RecordingRepositoryPort) -> RecordingService:
+    """Build a RecordingService around a recording repository.
+
+    Args:
+        recording_repo: The recording repository to use.
+
+    Returns:
+        RecordingService using the shared adapters.
     """
     if (
         _app_state.settings is None
@@ -74,8 +131,6 @@ async def get_recording_service(
     ):
         raise RuntimeError("Application not initialized")
 
-    recording_repo = PostgresRecordingRepository(session)
-
     return RecordingService(
         recording_repository=recording_repo,
         egress_port=_app_state.egress_adapter,
@@ -88,6 +143,53 @@ async def get_recording_service(
     )
 
 
+async def get_recording_service() -> RecordingService:
+    """Get RecordingService dependency with per-request session.
+
+    Returns:
+        RecordingService configured for this request.
+    """
+    session = _request_session.get()
+    if session is None:
+        raise RuntimeError("Application not initialized")
+
+    return _create_recording_service(_create_recording_repository(session))
+
+
+async def _process_egress_batch(events: list[EgressInfo]) -> None:
+    """Apply a batch of acknowledged egress events with one write and transaction.
+
+    If the batch fails as a whole it is rolled back and replayed one event
+    per transaction, so a single bad event cannot discard the others.
+
+    Args:
+        events: The egress events, in arrival order.
+    """
+    if _app_state.database is None:
+        raise RuntimeError("Application not initialized")
+
+    async with _app_state.database.get_session() as session:
+        recording_repo = _create_recording_repository(session)
+        recording_service = _create_recording_service(recording_repo)
+        try:
+            async with recording_repo.transaction():
+                await recording_service.handle_egress_events(events)
+            return
+        except Exception as e:
+            logger.warning("egress_batch_replaying", count=len(events), error=str(e))
+
+        for egress_info in events:
+            try:
+                async with recording_repo.transaction():
+                    await recording_service.handle_egress_event(egress_info)
+            except Exception as e:
+                logger.error(
+                    "egress_event_processing_failed",
+                    egress_id=egress_info.egress_id,
+                    error=str(e),
+                )
+
+
 def create_app(settings: Settings | None = None) -> FastAPI:
     """Create and configure the FastAPI application.
 
@@ -102,6 +204,7 @@ def create_app(settings: Settings | None = None) -> FastAPI:
 
     # Store settings in global state
     _app_state.settings = settings
+    _app_state.egress_batcher = EgressEventBatcher(_process_egress_batch)
 
     @asynccontextmanager
     async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
@@ -109,9 +212,30 @@ def create_app(settings: Settings | None = None) -> FastAPI:
         logger.info("starting_http_server", host=settings.http_host, port=settings.http_port)
 
         # Initialize shared resources
-        _app_state.database = Database(settings.database_url)
+        _app_state.database = Database(
+            settings.database_url,
+            pool_size=settings.database_pool_size,
+            max_overflow=settings.database_max_overflow,
+            pool_recycle=settings.database_pool_recycle,
+            pool_pre_ping=settings.database_pool_pre_ping,
+            statement_cache_size=settings.database_statement_cache_size,
+            application_name=settings.app_name,
+        )
         _app_state.egress_adapter = LiveKitEgressAdapter(settings)
         _app_state.storage_adapter = S3StorageAdapter(settings)
+        # The cache is per process and writes only invalidate the worker that
+        # made them, so other workers would serve stale recordings
+        if settings.http_workers == 1:
+            _app_state.recording_cache = RecordingCache(
+                maxsize=_RECORDING_CACHE_SIZE,
+                ttl_seconds=_RECORDING_CACHE_TTL_SECONDS,
+            )
+
+        # Not fatal: failures are logged and connections open lazily on first use
+        await _app_state.database.warm_up(_POOL_WARMUP_CONNECTIONS)
+
+        if _app_state.egress_batcher:
+            _app_state.egress_batcher.start()
 
         logger.info("http_server_started")
 
@@ -119,10 +243,19 @@ def create_app(settings: Settings | None = None) -> FastAPI:
 
         # Cleanup
         logger.info("stopping_http_server")
+        if _app_state.egress_batcher:
+            await _app_state.egress_batcher.close()
+        # Independent of each other, so they shut down concurrently
+        closers: list[Coroutine[Any, Any, None]] = []
         if _app_state.egress_adapter:
-            await _app_state.egress_adapter.close()
+            closers.append(_app_state.egress_adapter.close())
+        if _app_state.storage_adapter:
+            closers.append(_app_state.storage_adapter.close())
         if _app_state.database:
-            await _app_state.database.close()
+            closers.append(_app_state.database.close())
+        for result in await asyncio.gather(*closers, return_exceptions=True):
+            if isinstance(result, Exception):
+                logger.warning("shutdown_close_failed", error=str(result))
         logger.info("http_server_stopped")
 
     app = FastAPI(
@@ -130,7 +263,9 @@ def create_app(settings: Settings | None = None) -> FastAPI:
         description="Recording management and webhook API for EchoSphere",
         version="0.1.0",
         lifespan=lifespan,
+        default_response_class=ORJSONResponse,
     )
+    app.add_middleware(RequestSessionMiddleware)
 
     # Register routes
     _register_routes(app, settings)
@@ -152,7 +287,7 @@ def _register_routes(app: FastAPI, settings: Settings) -> None:
     )
 
     # Create webhook handler with dependency injection
-    webhook_handler = WebhookHandler(webhook_receiver)
+    webhook_handler = WebhookHandler(webhook_receiver, event_batcher=_app_state.egress_batcher)
 
     # Register webhook routes
     webhook_router = APIRouter(prefix="/webhooks", tags=["webhooks"])
@@ -164,9 +299,8 @@ def _register_routes(app: FastAPI, settings: Settings) -> None:
         recording_service: RecordingService = Depends(get_recording_service),
     ) -> dict[str, str]:
         """Handle LiveKit webhook events."""
-        body = await request.body()
         return await webhook_handler.handle_webhook(
-            body.decode("utf-8"),
+            await request.body(),
             authorization,
             recording_service,
         )
@@ -186,18 +320,25 @@ def _register_routes(app: FastAPI, settings: Settings) -> None:
 def run_server(settings: Settings | None = None) -> None:
     """Run the HTTP server.
 
+    The app is built through the ``create_app`` factory in each worker
+    process, so it always uses settings loaded from the environment;
+    ``settings`` only controls the server options.
+
     Args:
         settings: Optional settings override.
     """
     if settings is None:
         settings = get_settings()
 
-    app = create_app(settings)
-
     uvicorn.run(
-        app,
+        "src.adapters.inbound.http_server:create_app",
+        factory=True,
         host=settings.http_host,
         port=settings.http_port,
+        workers=settings.http_workers,
+        http="httptools",
+        loop="uvloop",
+        timeout_keep_alive=settings.http_keepalive_timeout,
         log_level=settings.log_level.lower(),
     )
 
@@ -11,6 +11,7 @@ inbound adapter in the hexagonal architecture. It handles:
 from __future__ import annotations
 
 import asyncio
+import inspect
 import logging
 from dataclasses import dataclass
 from dataclasses import field
@@ -18,12 +19,14 @@ from functools import lru_cache
 from typing import TYPE_CHECKING
 from typing import Any
 
+import aioboto3
 from livekit.agents import Agent
 from livekit.agents import AgentServer
 from livekit.agents import AgentSession
 from livekit.agents import CloseEvent
 from livekit.agents import ConversationItemAddedEvent
 from livekit.agents import JobContext
+from livekit.agents import JobProcess
 from livekit.agents import metrics
 from livekit.plugins import aws
 from livekit.plugins import silero
@@ -31,6 +34,7 @@ from livekit.plugins.turn_detector.multilingual import MultilingualModel
 from opentelemetry import trace
 
 from src.adapters.outbound import Database
+from src.adapters.outbound import NullSessionRepository
 from src.adapters.outbound import PostgresSessionRepository
 from src.config.settings import get_settings
 from src.domain.entities import Message
@@ -39,14 +43,31 @@ from src.domain.entities import Session
 
 if TYPE_CHECKING:
     from livekit.agents.voice import MetricsCollectedEvent
+    from sqlalchemy.ext.asyncio import AsyncSession
 
+    from src.application.ports import SessionRepositoryPort
     from src.config.settings import Settings
 
 # Service name for custom spans
 _SERVICE_NAME = "echo-sphere-agent"
 
+# Upper bound on messages waiting to be persisted
+_MESSAGE_QUEUE_SIZE = 256
+
+# AWS services whose clients the LLM and TTS plugins create per request
+_AWS_SERVICES = ("bedrock-runtime", "polly")
+
+# Conversation item roles that are persisted as messages
+_ROLE_MAP: dict[str, MessageRole] = {
+    "user": MessageRole.USER,
+    "assistant": MessageRole.ASSISTANT,
+}
+
 logger = logging.getLogger(__name__)
 
+# Proxy tracer; resolves to the configured provider once tracing is set up
+_tracer = trace.get_tracer(_SERVICE_NAME)
+
 
 @dataclass
 class SessionContext:
@@ -54,8 +75,17 @@ class SessionContext:
 
     db: Database | None
     is_console_mode: bool
-    background_tasks: set[asyncio.Task[None]] = field(default_factory=set)
+    settings: Settings
+    # Long-lived DB session shared by all writes; guarded by db_lock
+    db_session: AsyncSession | None = None
+    db_lock: asyncio.Lock = field(default_factory=asyncio.Lock)
+    # Discards writes unless a database-backed repository is supplied
+    repo: SessionRepositoryPort = field(default_factory=NullSessionRepository)
     domain_session: Session | None = None
+    # None is the shutdown sentinel for the message flusher
+    message_queue: asyncio.Queue[Message | None] = field(
+        default_factory=lambda: asyncio.Queue(maxsize=_MESSAGE_QUEUE_SIZE)
+    )
 
 
 @lru_cache
@@ -66,7 +96,118 @@ def get_database() -> Database:
         Database instance.
     """
     settings = get_settings()
-    return Database(settings.database_url)
+    return Database(
+        settings.database_url,
+        pool_size=settings.database_pool_size,
+        max_overflow=settings.database_max_overflow,
+        pool_recycle=settings.database_pool_recycle,
+        pool_pre_ping=settings.database_pool_pre_ping,
+        statement_cache_size=settings.database_statement_cache_size,
+        application_name=settings.app_name,
+    )
+
+
+@lru_cache(maxsize=1)
+def get_vad() -> silero.VAD:
+    """Get or load the Silero VAD model.
+
+    The model is loaded once per process and shared by all sessions; each
+    session opens its own stream on it, so no per-session state is shared.
+
+    Returns:
+        Silero VAD instance.
+    """
+    return silero.VAD.load()
+
+
+@lru_cache(maxsize=1)
+def get_turn_detector() -> MultilingualModel:
+    """Get or create the multilingual turn detector.
+
+    Returns:
+        MultilingualModel instance shared by all sessions in the process.
+    """
+    return MultilingualModel()
+
+
+@lru_cache
+def get_aws_session(region: str) -> aioboto3.Session:
+    """Get the aioboto3 session shared by the Bedrock LLM and Polly TTS.
+
+    Creating a botocore session loads its service data files, so one
+    session per region is reused across agent sessions in the process.
+
+    Args:
+        region: AWS region name.
+
+    Returns:
+        Shared aioboto3 session.
+    """
+    return aioboto3.Session(region_name=region)
+
+
+async def _open_aws_clients(session: aioboto3.Session) -> None:
+    """Create and close one client per AWS service the plugins use.
+
+    Args:
+        session: The shared aioboto3 session.
+    """
+    for service in _AWS_SERVICES:
+        async with session.client(service):
+            pass
+
+
+def warm_aws_session(region: str) -> None:
+    """Load the Bedrock and Polly service models into the shared session.
+
+    The plugins open a new client for every request, and the first client
+    per service would otherwise parse the service model from disk while
+    the user waits for the first reply. Opening one client per service
+    caches the models and resolves credentials on the shared session.
+
+    Blocking; must be called outside a running event loop.
+
+    Args:
+        region: AWS region name.
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        pass
+    else:
+        logger.debug("AWS client warm-up skipped: event loop already running")
+        return
+
+    try:
+        asyncio.run(_open_aws_clients(get_aws_session(region)))
+    except Exception as e:
+        # The warm-up is optional; the first request loads the models instead
+        logger.debug("AWS client warm-up failed", extra={"region": region, "error": str(e)})
+
+
+def prefetch_models() -> None:
+    """Load the VAD and turn detector ahead of the first session.
+
+    Blocking; call once at process start so the first session does not
+    pay the model load cost.
+    """
+    get_vad()
+    get_turn_detector()
+
+
+def prewarm(_proc: JobProcess) -> None:
+    """Prepare a job process before it is handed any session.
+
+    Runs once per process, so every session in the process reuses the
+    models cached by ``get_vad`` and ``get_turn_detector`` and the AWS
+    session from ``get_aws_session``.
+
+    Args:
+        _proc: The job process being initialized; nothing is stored in its
+            userdata because sessions read the module-level caches.
+    """
+    prefetch_models()
+    warm_aws_session(get_settings().aws_region)
 
 
 class EchoSphereAssistant(Agent):
@@ -93,12 +234,14 @@ class EchoSphereAssistant(Agent):
             greeting_prompt: Prompt for generating initial greeting.
                 Defaults to settings value.
         """
-        settings = get_settings()
-        self._greeting_prompt = greeting_prompt or settings.agent_greeting_prompt
+        if not instructions or not greeting_prompt:
+            settings = get_settings()
+            instructions = instructions or settings.agent_instructions
+            greeting_prompt = greeting_prompt or settings.agent_greeting_prompt
 
-        super().__init__(
-            instructions=instructions or settings.agent_instructions,
-        )
+        self._greeting_prompt = greeting_prompt
+
+        super().__init__(instructions=instructions)
 
     async def on_enter(self) -> None:
         """Called when the agent enters a session.
@@ -120,6 +263,8 @@ def create_session(settings: Settings | None = None) -> AgentSession[Any]:
     if settings is None:
         settings = get_settings()
 
+    aws_session = get_aws_session(settings.aws_region)
+
     return AgentSession(
         # AWS AI Services for Japanese support
         stt=aws.STT(
@@ -128,16 +273,25 @@ def create_session(settings: Settings | None = None) -> AgentSession[Any]:
         llm=aws.LLM(
             model=settings.llm_model,
             region=settings.aws_region,
+            session=aws_session,
+            # The instructions are identical across sessions, so the prefix is reusable
+            cache_system=settings.llm_cache_system_prompt,
         ),
         tts=aws.TTS(
             voice=settings.tts_voice,
             language=settings.tts_language,
             speech_engine="neural",
+            session=aws_session,
         ),
         # Voice activity detection
-        vad=silero.VAD.load(),
+        vad=get_vad(),
         # Turn detection for natural conversation
-        turn_detection=MultilingualModel(),
+        turn_detection=get_turn_detector(),
+        # A discarded speculative reply costs one cancelled LLM call, which is
+        # cheaper than the latency it saves on every confirmed turn
+        preemptive_generation=settings.preemptive_generation,
+        min_endpointing_delay=settings.min_endpointing_delay,
+        max_endpointing_delay=settings.max_endpointing_delay,
     )
 
 
@@ -152,15 +306,29 @@ async def _resolve_room_sid(ctx: JobContext) -> str:
     Returns:
         Room SID string, or a fallback for console mode.
     """
+    sid = ctx.room.sid
+    if inspect.isawaitable(sid):
+        return await sid
+    # Console mode: use room name as fallback
+    return f"console-{ctx.room.name}"
+
+
+async def _rollback_safe(session_ctx: SessionContext) -> None:
+    """Roll back the shared DB session after a failed write.
+
+    Keeps the long-lived session usable for subsequent writes.
+
+    Args:
+        session_ctx: The session context containing the db session.
+    """
+    if session_ctx.db_session is None:
+        return
+
     try:
-        sid_coro = ctx.room.sid
-        if hasattr(sid_coro, "__await__"):
-            return await sid_coro
-        # Console mode: use room name as fallback
-        return f"console-{ctx.room.name}"
-    except (TypeError, AttributeError):
-        # Fallback for mock objects
-        return f"console-{ctx.room.name}"
+        async with session_ctx.db_lock:
+            await session_ctx.db_session.rollback()
+    except Exception as e:
+        logger.warning("Failed to roll back db session", extra={"error": str(e)})
 
 
 async def _save_session_safe(
@@ -170,16 +338,15 @@ async def _save_session_safe(
     """Save session to database with error handling.
 
     Args:
-        session_ctx: The session context containing db and domain_session.
+        session_ctx: The session context containing repo and domain_session.
         operation: Description of the operation for logging.
     """
-    if session_ctx.db is None or session_ctx.domain_session is None:
+    if session_ctx.domain_session is None:
         return
 
     try:
-        async with session_ctx.db.get_session() as db_session:
-            repo = PostgresSessionRepository(db_session)
-            await repo.save_session(session_ctx.domain_session)
+        async with session_ctx.db_lock:
+            await session_ctx.repo.save_session(session_ctx.domain_session)
         logger.debug(
             "Session saved",
             extra={
@@ -189,6 +356,7 @@ async def _save_session_safe(
             },
         )
     except Exception as e:
+        await _rollback_safe(session_ctx)
         logger.warning(
             "Failed to save session",
             extra={
@@ -220,45 +388,87 @@ def _setup_conversation_handler(
         if item.type != "message":
             return
 
-        # Determine role
-        if item.role == "user":
-            role = MessageRole.USER
-        elif item.role == "assistant":
-            role = MessageRole.ASSISTANT
-        else:
-            return
-
-        # Get text content
+        role = _ROLE_MAP.get(item.role)
         content = item.text_content
-        if not content:
+        if role is None or not content:
             return
 
-        # Save message asynchronously
-        async def save_message() -> None:
-            if session_ctx.db is None or session_ctx.domain_session is None:
-                return
-            try:
-                message = Message(
+        # Queue for batched persistence by the message flusher
+        try:
+            session_ctx.message_queue.put_nowait(
+                Message(
                     session_id=session_ctx.domain_session.id,
                     role=role,
                     content=content,
                 )
-                async with session_ctx.db.get_session() as db_session:
-                    repo = PostgresSessionRepository(db_session)
-                    await repo.save_message(message)
-                logger.debug(
-                    "Message saved",
-                    extra={"role": role.value, "content": content[:50] if content else ""},
-                )
-            except Exception as e:
-                logger.warning(
-                    "Failed to save message",
-                    extra={"error": str(e), "role": role.value},
-                )
+            )
+        except asyncio.QueueFull:
+            logger.warning(
+                "Message queue full, dropping message",
+                extra={"role": role.value, "queue_size": _MESSAGE_QUEUE_SIZE},
+            )
+
 
-        task = asyncio.create_task(save_message())
-        session_ctx.background_tasks.add(task)
-        task.add_done_callback(session_ctx.background_tasks.discard)
+async def _save_messages_safe(
+    session_ctx: SessionContext,
+    messages: list[Message],
+) -> None:
+    """Save a batch of messages to database with error handling.
+
+    Args:
+        session_ctx: The session context containing the repository.
+        messages: The messages to save.
+    """
+    try:
+        async with session_ctx.db_lock:
+            await session_ctx.repo.save_messages(messages)
+        logger.debug("Messages saved", extra={"count": len(messages)})
+    except Exception as e:
+        await _rollback_safe(session_ctx)
+        logger.warning(
+            "Failed to save messages",
+            extra={"error": str(e), "count": len(messages)},
+        )
+
+
+async def _flush_messages(session_ctx: SessionContext) -> None:
+    """Persist queued conversation messages in batches.
+
+    Drains up to ``settings.message_batch_size`` messages, or whatever arrived
+    within ``settings.message_flush_interval`` of the first one, and writes them
+    in a single round-trip. Returns once the ``None`` sentinel is received, after flushing
+    the messages queued before it.
+
+    Args:
+        session_ctx: The session context containing the message queue.
+    """
+    queue = session_ctx.message_queue
+    batch_size = session_ctx.settings.message_batch_size
+    flush_interval = session_ctx.settings.message_flush_interval
+    loop = asyncio.get_running_loop()
+    closed = False
+
+    while not closed:
+        first = await queue.get()
+        if first is None:
+            return
+
+        batch = [first]
+        deadline = loop.time() + flush_interval
+        while len(batch) < batch_size:
+            timeout = deadline - loop.time()
+            if timeout <= 0:
+                break
+            try:
+                message = await asyncio.wait_for(queue.get(), timeout)
+            except TimeoutError:
+                break
+            if message is None:
+                closed = True
+                break
+            batch.append(message)
+
+        await _save_messages_safe(session_ctx, batch)
 
 
 def _setup_close_handler(
@@ -301,26 +511,8 @@ def _setup_metrics_handler(agent_session: AgentSession[Any]) -> None:
         metrics.log_metrics(ev.metrics)
 
 
-async def _wait_for_background_tasks(session_ctx: SessionContext) -> None:
-    """Wait for pending background tasks to complete.
-
-    Args:
-        session_ctx: The session context containing background tasks.
-    """
-    if not session_ctx.background_tasks:
-        return
-
-    pending = [t for t in session_ctx.background_tasks if not t.done()]
-    if pending:
-        logger.debug(
-            "Waiting for pending background tasks",
-            extra={"count": len(pending)},
-        )
-        await asyncio.gather(*pending, return_exceptions=True)
-
-
 # Create server instance at module level for pickle compatibility
-server = AgentServer()
+server = AgentServer(setup_fnc=prewarm)
 
 
 @server.rtc_session()
@@ -334,83 +526,102 @@ async def entrypoint(ctx: JobContext) -> None:
     Args:
         ctx: The job context containing room information.
     """
-    tracer = trace.get_tracer(_SERVICE_NAME)
-
-    with tracer.start_as_current_span(
+    with _tracer.start_as_current_span(
         "agent_session",
         attributes={"room.name": ctx.room.name},
     ) as session_span:
         # Initialize session context
+        settings = get_settings()
         is_console_mode = ctx.room.name == "mock_room"
+        db = None if is_console_mode else get_database()
         session_ctx = SessionContext(
-            db=None if is_console_mode else get_database(),
+            db=db,
             is_console_mode=is_console_mode,
+            settings=settings,
         )
-
-        session_span.set_attribute("session.console_mode", is_console_mode)
-
-        logger.info(
-            "Entrypoint called",
-            extra={"room_name": ctx.room.name, "console_mode": is_console_mode},
-        )
-
-        if is_console_mode:
-            logger.info("Console mode: database operations disabled")
-
-        # Create agent session and close event
-        with tracer.start_as_current_span("create_agent_session"):
-            agent_session = create_session()
-            close_event = asyncio.Event()
-
-            # Set up event handlers
-            _setup_conversation_handler(agent_session, session_ctx)
-            _setup_close_handler(agent_session, session_ctx, close_event)
-            _setup_metrics_handler(agent_session)
-
-        # Start agent session
-        with tracer.start_as_current_span("start_agent_session"):
-            await agent_session.start(
-                room=ctx.room,
-                agent=EchoSphereAssistant(),
+        if db is not None:
+            session_ctx.db_session = db.session()
+            session_ctx.repo = PostgresSessionRepository(session_ctx.db_session)
+
+        try:
+            # Skip attribute bookkeeping when the span is not sampled/exported
+            span_recording = session_span.is_recording()
+            if span_recording:
+                session_span.set_attribute("session.console_mode", is_console_mode)
+
+            logger.info(
+                "Entrypoint called",
+                extra={"room_name": ctx.room.name, "console_mode": is_console_mode},
             )
 
-            # Resolve room SID and create domain session
-            room_sid = await _resolve_room_sid(ctx)
+            if is_console_mode:
+                logger.info("Console mode: database operations disabled")
+
+            # The task group owns background tasks and joins them on exit
+            async with asyncio.TaskGroup() as tg:
+                tg.create_task(_flush_messages(session_ctx))
+
+                # Create agent session and close event
+                agent_session = create_session(session_ctx.settings)
+                close_event = asyncio.Event()
+
+                # Set up event handlers
+                _setup_conversation_handler(agent_session, session_ctx)
+                _setup_close_handler(agent_session, session_ctx, close_event)
+                _setup_metrics_handler(agent_session)
+                if span_recording:
+                    session_span.add_event("agent_session_created")
+
+                # Start agent session
+                await agent_session.start(
+                    room=ctx.room,
+                    agent=EchoSphereAssistant(
+                        instructions=session_ctx.settings.agent_instructions,
+                        greeting_prompt=session_ctx.settings.agent_greeting_prompt,
+                    ),
+                )
 
-        session_span.set_attribute("room.sid", room_sid)
-        logger.info(
-            "Agent session started",
-            extra={"room_name": ctx.room.name, "room_sid": room_sid},
-        )
+                # Resolve room SID and create domain session
+                room_sid = await _resolve_room_sid(ctx)
 
-        # Create and initialize domain session
-        session_ctx.domain_session = Session(
-            room_name=ctx.room.name,
-            user_id=room_sid,
-        )
-        session_span.set_attribute("session.id", str(session_ctx.domain_session.id))
+                if span_recording:
+                    session_span.add_event("agent_session_started")
+                    session_span.set_attribute("room.sid", room_sid)
+                logger.info(
+                    "Agent session started",
+                    extra={"room_name": ctx.room.name, "room_sid": room_sid},
+                )
 
-        # Save initial session (pending status)
-        await _save_session_safe(session_ctx, "create")
+                # Create and initialize domain session
+                session_ctx.domain_session = Session(
+                    room_name=ctx.room.name,
+                    user_id=room_sid,
+                )
+                if span_recording:
+                    session_span.set_attribute("session.id", str(session_ctx.domain_session.id))
 
-        # Start the session (transition to active)
-        session_ctx.domain_session.start()
-        await _save_session_safe(session_ctx, "start")
+                # Start the session before the first write so it is inserted as active
+                session_ctx.domain_session.start()
+                await _save_session_safe(session_ctx, "create_and_start")
 
-        # Wait for the session to close
-        await close_event.wait()
+                # Wait for the session to close
+                await close_event.wait()
 
-        # Wait for pending background tasks before cleanup
-        await _wait_for_background_tasks(session_ctx)
+                # Signal the message flusher to drain the queue and exit
+                await session_ctx.message_queue.put(None)
 
-        # Mark session as complete and save
-        session_ctx.domain_session.complete()
-        await _save_session_safe(session_ctx, "complete")
+            # Mark session as complete and save
+            session_ctx.domain_session.complete()
+            await _save_session_safe(session_ctx, "complete")
+        finally:
+            if session_ctx.db_session is not None:
+                await session_ctx.db_session.close()
 
         # Record session duration
         duration = session_ctx.domain_session.duration_seconds
-        session_span.set_attribute("session.duration_seconds", duration or 0)
-        session_span.set_status(trace.StatusCode.OK)
+        if span_recording:
+            session_span.set_attribute("session.duration_seconds", duration or 0)
+            session_span.set_status(trace.StatusCode.OK)
 
         logger.info(
             "Agent session completed",
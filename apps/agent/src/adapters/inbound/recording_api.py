@@ -5,7 +5,10 @@ This module provides REST API endpoints for:
 - Generating playback URLs for recordings (#37)
 """
 
+import base64
+import binascii
 from collections.abc import Callable
+from datetime import datetime
 from typing import Any
 from uuid import UUID
 
@@ -15,6 +18,7 @@ from fastapi import Depends
 from fastapi import HTTPException
 from fastapi import Query
 from fastapi import status
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel
 
 from src.application.use_cases.recording_service import RecordingNotFoundError
@@ -39,20 +43,22 @@ class RecordingResponse(BaseModel):
     duration_seconds: int | None
     file_size_bytes: int | None
     error_message: str | None
-    created_at: str
-    updated_at: str
+    created_at: datetime
+    updated_at: datetime
 
     @classmethod
     def from_entity(cls, recording: Recording) -> "RecordingResponse":
         """Create response from Recording entity.
 
+        The entity is already validated by the domain, so validation is skipped.
+
         Args:
             recording: Recording domain entity.
 
         Returns:
             RecordingResponse instance.
         """
-        return cls(
+        return cls.model_construct(
             id=recording.id,
             session_id=recording.session_id,
             egress_id=recording.egress_id,
@@ -63,19 +69,25 @@ class RecordingResponse(BaseModel):
             duration_seconds=recording.duration_seconds,
             file_size_bytes=recording.file_size_bytes,
             error_message=recording.error_message,
-            created_at=recording.created_at.isoformat(),
-            updated_at=recording.updated_at.isoformat(),
+            created_at=recording.created_at,
+            updated_at=recording.updated_at,
         )
 
 
 class RecordingListResponse(BaseModel):
-    """Recording list response with pagination."""
+    """Recording list response with pagination.
+
+    Page-based requests fill in ``total``, ``page`` and ``total_pages``;
+    cursor-based requests leave them unset and skip the count query.
+    """
 
     items: list[RecordingResponse]
-    total: int
-    page: int
+    total: int | None
+    page: int | None
     page_size: int
-    total_pages: int
+    total_pages: int | None
+    next_cursor: str | None = None
+    has_more: bool = False
 
 
 class PlaybackUrlResponse(BaseModel):
@@ -86,6 +98,41 @@ class PlaybackUrlResponse(BaseModel):
     expires_in_seconds: int
 
 
+def _encode_cursor(recording: Recording) -> str:
+    """Encode a recording's keyset position as an opaque cursor.
+
+    Args:
+        recording: The last recording of a page.
+
+    Returns:
+        URL-safe cursor string.
+    """
+    raw = f"{recording.created_at.isoformat()}|{recording.id}"
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+
+def _decode_cursor(cursor: str) -> tuple[datetime, UUID]:
+    """Decode a cursor produced by ``_encode_cursor``.
+
+    Args:
+        cursor: Cursor string from a previous response.
+
+    Returns:
+        The ``(created_at, id)`` keyset position.
+
+    Raises:
+        HTTPException: If the cursor is malformed.
+    """
+    try:
+        created_at, recording_id = base64.urlsafe_b64decode(cursor).decode().split("|")
+        return datetime.fromisoformat(created_at), UUID(recording_id)
+    except (binascii.Error, UnicodeDecodeError, ValueError) as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid cursor",
+        ) from e
+
+
 def create_recording_router(
     get_recording_service: Callable[..., Any],
 ) -> APIRouter:
@@ -101,19 +148,34 @@ def create_recording_router(
 
     @router.get("", response_model=RecordingListResponse)
     async def list_recordings(
-        page: int = Query(1, ge=1, description="Page number (1-indexed)"),
+        page: int = Query(
+            1,
+            ge=1,
+            deprecated=True,
+            description="Page number (1-indexed); prefer cursor for deep pages",
+        ),
         page_size: int = Query(20, ge=1, le=100, description="Items per page"),
         status_filter: RecordingStatus | None = Query(
             None, alias="status", description="Filter by status"
         ),
+        cursor: str | None = Query(
+            None, description="next_cursor from a previous page; overrides page"
+        ),
         recording_service: RecordingService = Depends(get_recording_service),
-    ) -> RecordingListResponse:
+    ) -> ORJSONResponse:
         """List recordings with pagination.
 
+        With a cursor, the page is fetched by keyset and no total is counted,
+        so deep pages cost the same as the first one.
+
+        The response is built from trusted entities and returned directly, so
+        FastAPI does not validate it a second time against ``response_model``.
+
         Args:
             page: Page number (1-indexed).
             page_size: Number of items per page.
             status_filter: Optional status filter.
+            cursor: Opaque cursor from a previous response.
             recording_service: Injected recording service.
 
         Returns:
@@ -124,26 +186,44 @@ def create_recording_router(
             page=page,
             page_size=page_size,
             status=status_filter.value if status_filter else None,
+            cursor=cursor,
         )
 
-        try:
-            # Get recordings via service method
-            recordings, total = await recording_service.list_recordings(
-                page=page,
-                page_size=page_size,
-                status=status_filter,
-            )
-
-            # Calculate pagination info
-            total_pages = (total + page_size - 1) // page_size if total > 0 else 1
+        position = _decode_cursor(cursor) if cursor is not None else None
 
-            return RecordingListResponse(
+        try:
+            if position is not None:
+                recordings, has_more = await recording_service.list_recordings_after(
+                    cursor=position,
+                    page_size=page_size,
+                    status=status_filter,
+                )
+                total: int | None = None
+                current_page: int | None = None
+                total_pages: int | None = None
+            else:
+                # Get recordings via service method
+                recordings, total = await recording_service.list_recordings(
+                    page=page,
+                    page_size=page_size,
+                    status=status_filter,
+                )
+
+                # Calculate pagination info
+                current_page = page
+                total_pages = (total + page_size - 1) // page_size if total > 0 else 1
+                has_more = page < total_pages
+
+            response = RecordingListResponse.model_construct(
                 items=[RecordingResponse.from_entity(r) for r in recordings],
                 total=total,
-                page=page,
+                page=current_page,
                 page_size=page_size,
                 total_pages=total_pages,
+                next_cursor=_encode_cursor(recordings[-1]) if has_more and recordings else None,
+                has_more=has_more,
             )
+            return ORJSONResponse(content=response.model_dump())
 
         except Exception as e:
             logger.error("list_recordings_failed", error=str(e))
@@ -11,11 +11,15 @@ from livekit.api import TokenVerifier
 from livekit.api import WebhookReceiver
 from livekit.protocol.egress import EgressInfo as LiveKitEgressInfo
 
+from src.adapters.inbound.egress_event_batcher import EgressEventBatcher
 from src.adapters.shared.livekit_converters import convert_egress_info
 from src.application.use_cases.recording_service import RecordingService
 
 logger = structlog.get_logger()
 
+# Webhook events that update recording state
+_EGRESS_EVENTS = frozenset({"egress_started", "egress_ended"})
+
 
 def create_webhook_receiver(
     api_key: str,
@@ -40,24 +44,36 @@ class WebhookHandler:
     Processes egress events and updates recording status via RecordingService.
     """
 
-    def __init__(self, webhook_receiver: WebhookReceiver) -> None:
+    def __init__(
+        self,
+        webhook_receiver: WebhookReceiver,
+        event_batcher: EgressEventBatcher | None = None,
+    ) -> None:
         """Initialize the webhook handler.
 
         Args:
             webhook_receiver: LiveKit webhook receiver for verification.
+            event_batcher: Optional batcher that applies egress events after
+                the webhook is acknowledged.
         """
         self._webhook_receiver = webhook_receiver
+        self._event_batcher = event_batcher
 
     async def handle_webhook(
         self,
-        body: str,
+        body: bytes | str,
         auth_token: str,
         recording_service: RecordingService,
     ) -> dict[str, str]:
         """Handle incoming LiveKit webhook.
 
+        When an event batcher is configured, egress events are queued and the
+        webhook is acknowledged without waiting on the database; processing
+        errors are then logged, not returned. If the batcher cannot take the
+        event, it is applied inline with ``recording_service``.
+
         Args:
-            body: Raw request body.
+            body: Raw request body, as received or already decoded.
             auth_token: Authorization token from header.
             recording_service: Service for recording operations.
 
@@ -68,17 +84,21 @@ class WebhookHandler:
             HTTPException: If verification fails or event processing errors.
         """
         try:
+            # The receiver hashes and parses text, so decode exactly once here
+            if isinstance(body, bytes):
+                body = body.decode("utf-8")
+
             # Verify and parse the webhook
             event = self._webhook_receiver.receive(body, auth_token)
 
-            logger.info(
+            logger.debug(
                 "webhook_received",
                 event_type=event.event,
                 event_id=event.id,
             )
 
             # Handle egress events
-            if event.event in ("egress_started", "egress_ended"):
+            if event.event in _EGRESS_EVENTS:
                 await self._handle_egress_event(event.egress_info, recording_service)
 
             return {"status": "ok"}
@@ -107,7 +127,15 @@ class WebhookHandler:
         # Convert to domain EgressInfo
         egress_info = convert_egress_info(lk_egress_info)
 
-        logger.info(
+        if self._event_batcher is not None and self._event_batcher.submit(egress_info):
+            logger.debug(
+                "egress_event_queued",
+                egress_id=egress_info.egress_id,
+                status=egress_info.status.value,
+            )
+            return
+
+        logger.debug(
             "processing_egress_event",
             egress_id=egress_info.egress_id,
             status=egress_info.status.value,
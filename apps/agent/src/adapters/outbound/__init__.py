@@ -1,15 +1,21 @@
 """Outbound adapters - External service implementations."""
 
+from src.adapters.outbound.cached_recording import CachedRecordingRepository
+from src.adapters.outbound.cached_recording import RecordingCache
 from src.adapters.outbound.database import Database
 from src.adapters.outbound.livekit_egress import LiveKitEgressAdapter
+from src.adapters.outbound.null_session import NullSessionRepository
 from src.adapters.outbound.postgres_recording import PostgresRecordingRepository
 from src.adapters.outbound.postgres_session import PostgresSessionRepository
 from src.adapters.outbound.s3_storage import S3StorageAdapter
 
 __all__ = [
+    "CachedRecordingRepository",
     "Database",
     "LiveKitEgressAdapter",
+    "NullSessionRepository",
     "PostgresRecordingRepository",
     "PostgresSessionRepository",
+    "RecordingCache",
     "S3StorageAdapter",
 ]
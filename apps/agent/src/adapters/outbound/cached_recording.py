@@ -0,0 +1,284 @@
+"""Caching decorator for RecordingRepositoryPort."""
+
+import copy
+import time
+from collections.abc import AsyncIterator
+from collections.abc import Iterable
+from collections.abc import Sequence
+from contextlib import asynccontextmanager
+from datetime import datetime
+from uuid import UUID
+
+from src.application.ports import RecordingRepositoryPort
+from src.domain.entities import Recording
+from src.domain.entities import RecordingStatus
+
+
+class RecordingCache:
+    """Process-local TTL cache of the latest recording per session.
+
+    Shared across requests so repeated "recording for session X" lookups
+    (e.g. dashboard polling) are served from memory for a few seconds.
+    Invalidation only reaches the process that made the write, so use it
+    with a single server process.
+    Entries are private copies; callers always receive their own copy,
+    so mutating a returned recording never changes the cached one.
+    """
+
+    def __init__(self, maxsize: int = 1024, ttl_seconds: float = 5.0) -> None:
+        """Initialize the cache.
+
+        Args:
+            maxsize: Maximum number of sessions kept; oldest entries are evicted first.
+            ttl_seconds: How long an entry stays valid.
+        """
+        self._maxsize = maxsize
+        self._ttl = ttl_seconds
+        self._entries: dict[UUID, tuple[float, Recording]] = {}
+
+    def get(self, session_id: UUID) -> Recording | None:
+        """Return the cached recording for a session if still fresh.
+
+        Args:
+            session_id: The session ID.
+
+        Returns:
+            The cached recording, or None if missing or expired.
+        """
+        entry = self._entries.get(session_id)
+        if entry is None:
+            return None
+        expires_at, recording = entry
+        if expires_at <= time.monotonic():
+            del self._entries[session_id]
+            return None
+        return copy.copy(recording)
+
+    def put(self, session_id: UUID, recording: Recording) -> None:
+        """Cache the recording for a session.
+
+        Args:
+            session_id: The session ID.
+            recording: The recording to cache.
+        """
+        self._entries.pop(session_id, None)
+        if len(self._entries) >= self._maxsize:
+            # Dicts keep insertion order, so the first key is the oldest entry
+            del self._entries[next(iter(self._entries))]
+        self._entries[session_id] = (time.monotonic() + self._ttl, copy.copy(recording))
+
+    def pop(self, session_id: UUID) -> None:
+        """Drop the cached recording for a session, if any.
+
+        Args:
+            session_id: The session ID.
+        """
+        self._entries.pop(session_id, None)
+
+
+class CachedRecordingRepository(RecordingRepositoryPort):
+    """Recording repository that caches lookups by session ID.
+
+    Wraps another repository; writes go straight through and invalidate
+    the session's cache entry. Inside ``transaction()`` the entry is
+    dropped again once the transaction ends, so a concurrent reader cannot
+    keep the pre-commit row cached for the rest of the TTL.
+    """
+
+    def __init__(self, repository: RecordingRepositoryPort, cache: RecordingCache) -> None:
+        """Initialize the repository.
+
+        Args:
+            repository: The underlying repository.
+            cache: Cache shared across repository instances.
+        """
+        self._repository = repository
+        self._cache = cache
+        self._transaction_depth = 0
+        self._pending_invalidations: set[UUID] = set()
+
+    def _invalidate(self, session_ids: Iterable[UUID]) -> None:
+        """Drop cache entries now and, inside a transaction, again on exit.
+
+        Args:
+            session_ids: Sessions whose cached recording is stale.
+        """
+        for session_id in session_ids:
+            self._cache.pop(session_id)
+            if self._transaction_depth:
+                self._pending_invalidations.add(session_id)
+
+    async def save(self, recording: Recording) -> None:
+        """Save a recording and invalidate its session's cache entry.
+
+        Args:
+            recording: The recording to save.
+        """
+        try:
+            await self._repository.save(recording)
+        finally:
+            self._invalidate((recording.session_id,))
+
+    async def save_many(self, recordings: Sequence[Recording]) -> None:
+        """Save several recordings and invalidate their sessions' cache entries.
+
+        Args:
+            recordings: The recordings to save.
+        """
+        try:
+            await self._repository.save_many(recordings)
+        finally:
+            self._invalidate(recording.session_id for recording in recordings)
+
+    async def get_by_id(self, recording_id: UUID) -> Recording | None:
+        """Retrieve a recording by ID.
+
+        Args:
+            recording_id: The recording ID to look up.
+
+        Returns:
+            The recording if found, None otherwise.
+        """
+        return await self._repository.get_by_id(recording_id)
+
+    async def get_by_session_id(
+        self,
+        session_id: UUID,
+        for_update: bool = False,
+    ) -> Recording | None:
+        """Retrieve the latest recording for a session, using the cache.
+
+        Locking reads always go to the underlying repository.
+
+        Args:
+            session_id: The session ID to look up.
+            for_update: Lock the row until the current transaction ends.
+
+        Returns:
+            The recording if found, None otherwise.
+        """
+        if for_update:
+            return await self._repository.get_by_session_id(session_id, for_update=True)
+
+        recording = self._cache.get(session_id)
+        if recording is not None:
+            return recording
+
+        recording = await self._repository.get_by_session_id(session_id)
+        if recording is not None:
+            self._cache.put(session_id, recording)
+        return recording
+
+    async def exists_active(self, session_id: UUID) -> bool:
+        """Check whether a session has a recording that is not yet terminal.
+
+        Args:
+            session_id: The session ID to look up.
+
+        Returns:
+            True if a recording for the session is neither completed nor failed.
+        """
+        return await self._repository.exists_active(session_id)
+
+    async def get_by_egress_id(
+        self,
+        egress_id: str,
+        for_update: bool = False,
+    ) -> Recording | None:
+        """Retrieve a recording by egress ID.
+
+        Args:
+            egress_id: The LiveKit egress ID.
+            for_update: Lock the row until the current transaction ends.
+
+        Returns:
+            The recording if found, None otherwise.
+        """
+        return await self._repository.get_by_egress_id(egress_id, for_update=for_update)
+
+    async def list_by_status(
+        self,
+        status: RecordingStatus,
+        limit: int = 100,
+        offset: int = 0,
+    ) -> list[Recording]:
+        """List recordings by status.
+
+        Args:
+            status: The recording status to filter by.
+            limit: Maximum number of recordings to return.
+            offset: Number of recordings to skip.
+
+        Returns:
+            List of recordings with the specified status.
+        """
+        return await self._repository.list_by_status(status, limit=limit, offset=offset)
+
+    async def list_all(
+        self,
+        page: int = 1,
+        page_size: int = 20,
+        status: RecordingStatus | None = None,
+    ) -> tuple[list[Recording], int]:
+        """List all recordings with pagination.
+
+        Args:
+            page: Page number (1-indexed).
+            page_size: Number of items per page.
+            status: Optional status filter, applied to both the page and the total.
+
+        Returns:
+            Tuple of (recordings list, total count).
+        """
+        return await self._repository.list_all(page=page, page_size=page_size, status=status)
+
+    async def list_after(
+        self,
+        limit: int,
+        cursor: tuple[datetime, UUID] | None = None,
+        status: RecordingStatus | None = None,
+    ) -> list[Recording]:
+        """List recordings by keyset, newest first.
+
+        Args:
+            limit: Maximum number of recordings to return.
+            cursor: ``(created_at, id)`` of the last recording already seen,
+                or None to start from the newest.
+            status: Optional status filter.
+
+        Returns:
+            List of recordings following the cursor.
+        """
+        return await self._repository.list_after(limit, cursor=cursor, status=status)
+
+    async def count_by_status(self, status: RecordingStatus) -> int:
+        """Count recordings by status.
+
+        Args:
+            status: The recording status to filter by.
+
+        Returns:
+            Count of recordings with the specified status.
+        """
+        return await self._repository.count_by_status(status)
+
+    @asynccontextmanager
+    async def transaction(self) -> AsyncIterator[None]:
+        """Group writes into a single transaction of the underlying repository.
+
+        Cache entries for sessions written inside the block are dropped
+        again after the outermost transaction commits or rolls back.
+
+        Yields:
+            None; writes inside the block are committed together on exit.
+        """
+        self._transaction_depth += 1
+        try:
+            async with self._repository.transaction():
+                yield
+        finally:
+            self._transaction_depth -= 1
+            if self._transaction_depth == 0:
+                pending, self._pending_invalidations = self._pending_invalidations, set()
+                for session_id in pending:
+                    self._cache.pop(session_id)
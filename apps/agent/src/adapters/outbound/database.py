@@ -1,18 +1,29 @@
 """Database connection and SQLAlchemy models."""
 
+import asyncio
 from collections.abc import AsyncIterator
+from collections.abc import Callable
+from collections.abc import Iterable
 from contextlib import asynccontextmanager
 from datetime import datetime
+from typing import Any
 from uuid import UUID
 
+import structlog
 from sqlalchemy import BigInteger
 from sqlalchemy import DateTime
+from sqlalchemy import Enum
 from sqlalchemy import ForeignKey
+from sqlalchemy import Index
 from sqlalchemy import Integer
 from sqlalchemy import String
 from sqlalchemy import Text
 from sqlalchemy import Uuid
+from sqlalchemy import text
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.ext.asyncio import AsyncAttrs
+from sqlalchemy.ext.asyncio import AsyncConnection
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.ext.asyncio import async_sessionmaker
 from sqlalchemy.ext.asyncio import create_async_engine
@@ -21,6 +32,17 @@ from sqlalchemy.orm import Mapped
 from sqlalchemy.orm import mapped_column
 from sqlalchemy.orm import relationship
 
+from src.domain.entities import MessageRole
+from src.domain.entities import RecordingStatus
+from src.domain.entities import SessionStatus
+
+logger = structlog.get_logger()
+
+# Native PostgreSQL enum types; plain VARCHAR on other dialects
+_SESSION_STATUS_TYPE = Enum(*(s.value for s in SessionStatus), name="session_status")
+_MESSAGE_ROLE_TYPE = Enum(*(r.value for r in MessageRole), name="message_role")
+_RECORDING_STATUS_TYPE = Enum(*(s.value for s in RecordingStatus), name="recording_status")
+
 
 class Base(AsyncAttrs, DeclarativeBase):
     """Base class for all SQLAlchemy models."""
@@ -36,7 +58,7 @@ class SessionModel(Base):
     id: Mapped[UUID] = mapped_column(Uuid, primary_key=True)
     room_name: Mapped[str] = mapped_column(String(255), nullable=False, index=True)
     user_id: Mapped[str] = mapped_column(String(255), nullable=False)
-    status: Mapped[str] = mapped_column(String(50), nullable=False, default="pending")
+    status: Mapped[str] = mapped_column(_SESSION_STATUS_TYPE, nullable=False, default="pending")
     language: Mapped[str] = mapped_column(String(10), default="ja-JP")
     recording_enabled: Mapped[bool] = mapped_column(default=True)
     created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
@@ -52,12 +74,13 @@ class MessageModel(Base):
     """SQLAlchemy model for messages table."""
 
     __tablename__ = "messages"
+    __table_args__ = (Index("ix_messages_session_created_id", "session_id", "created_at", "id"),)
 
     id: Mapped[UUID] = mapped_column(Uuid, primary_key=True)
     session_id: Mapped[UUID] = mapped_column(
-        Uuid, ForeignKey("sessions.id", ondelete="CASCADE"), nullable=False, index=True
+        Uuid, ForeignKey("sessions.id", ondelete="CASCADE"), nullable=False
     )
-    role: Mapped[str] = mapped_column(String(20), nullable=False)
+    role: Mapped[str] = mapped_column(_MESSAGE_ROLE_TYPE, nullable=False)
     content: Mapped[str] = mapped_column(Text, nullable=False)
     timestamp_ms: Mapped[int | None] = mapped_column(nullable=True)
     created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
@@ -69,13 +92,24 @@ class RecordingModel(Base):
     """SQLAlchemy model for recordings table."""
 
     __tablename__ = "recordings"
+    __table_args__ = (
+        Index("ix_recordings_session_created", "session_id", text("created_at DESC")),
+        Index("ix_recordings_status_created", "status", text("created_at DESC")),
+        Index("ix_recordings_created_id", text("created_at DESC"), text("id DESC")),
+        Index(
+            "ix_recordings_active",
+            "status",
+            postgresql_where=text("status IN ('starting', 'active')"),
+            sqlite_where=text("status IN ('starting', 'active')"),
+        ),
+    )
 
     id: Mapped[UUID] = mapped_column(Uuid, primary_key=True)
     session_id: Mapped[UUID] = mapped_column(
-        Uuid, ForeignKey("sessions.id", ondelete="CASCADE"), nullable=False, index=True
+        Uuid, ForeignKey("sessions.id", ondelete="CASCADE"), nullable=False
     )
     egress_id: Mapped[str] = mapped_column(String(255), nullable=False, unique=True, index=True)
-    status: Mapped[str] = mapped_column(String(50), nullable=False, default="starting", index=True)
+    status: Mapped[str] = mapped_column(_RECORDING_STATUS_TYPE, nullable=False, default="starting")
     storage_bucket: Mapped[str] = mapped_column(String(255), nullable=False)
     storage_path: Mapped[str] = mapped_column(String(512), nullable=False)
     playlist_url: Mapped[str | None] = mapped_column(String(1024), nullable=True)
@@ -90,20 +124,154 @@ class RecordingModel(Base):
     session: Mapped["SessionModel"] = relationship()
 
 
+# INSERT constructs supporting ON CONFLICT, by dialect name
+_UPSERT_INSERTS: dict[str, Callable[..., Any]] = {"postgresql": pg_insert, "sqlite": sqlite_insert}
+
+
+async def upsert(
+    session: AsyncSession,
+    model: type[Base],
+    values: dict[str, Any] | list[dict[str, Any]],
+    update_columns: Iterable[str],
+) -> None:
+    """Insert rows, or update the given columns of those whose primary key exists.
+
+    Runs as a single ``INSERT ... ON CONFLICT DO UPDATE`` statement. The rows
+    are returned into the session so that instances already in its identity
+    map are refreshed rather than left stale.
+
+    Args:
+        session: SQLAlchemy async session.
+        model: The mapped model class.
+        values: Column values for one row, or a list of rows with distinct
+            primary keys.
+        update_columns: Columns overwritten when a row already exists.
+    """
+    connection = await session.connection()
+    stmt = _UPSERT_INSERTS[connection.dialect.name](model).values(values)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[column.name for column in model.__table__.primary_key],
+        set_={column: stmt.excluded[column] for column in update_columns},
+    ).returning(model)
+    result = await session.scalars(stmt, execution_options={"populate_existing": True})
+    result.all()
+
+
+class SqlAlchemyRepository:
+    """Base class for repositories writing through one AsyncSession.
+
+    Each write commits on its own unless it runs inside ``transaction()``,
+    in which case the outermost block commits once on exit.
+    """
+
+    def __init__(self, session: AsyncSession) -> None:
+        """Initialize the repository with a database session.
+
+        Args:
+            session: SQLAlchemy async session.
+        """
+        self._session = session
+        self._transaction_depth = 0
+
+    @asynccontextmanager
+    async def transaction(self) -> AsyncIterator[None]:
+        """Group writes into a single transaction.
+
+        Yields:
+            None; writes inside the block are committed together on exit
+            and rolled back if it raises.
+        """
+        self._transaction_depth += 1
+        try:
+            yield
+        except BaseException:
+            self._transaction_depth -= 1
+            if self._transaction_depth == 0:
+                await self._session.rollback()
+            raise
+        self._transaction_depth -= 1
+        await self._commit()
+
+    async def _commit(self) -> None:
+        """Commit pending writes unless an enclosing transaction will."""
+        if self._transaction_depth == 0:
+            await self._session.commit()
+
+
 class Database:
     """Database connection manager."""
 
-    def __init__(self, database_url: str) -> None:
+    def __init__(
+        self,
+        database_url: str,
+        *,
+        pool_size: int = 20,
+        max_overflow: int = 40,
+        pool_recycle: int = 1800,
+        pool_pre_ping: bool = True,
+        statement_cache_size: int = 500,
+        application_name: str = "echo-sphere",
+    ) -> None:
         """Initialize database connection.
 
         Args:
             database_url: PostgreSQL connection URL (async format).
+            pool_size: Connections kept open in the pool.
+            max_overflow: Extra connections allowed beyond the pool size.
+            pool_recycle: Seconds after which pooled connections are replaced.
+            pool_pre_ping: Check connections for liveness on checkout.
+            statement_cache_size: Prepared statements cached per connection,
+                both by asyncpg and by SQLAlchemy's asyncpg adapter.
+            application_name: Name reported to PostgreSQL for each connection.
         """
-        self._engine = create_async_engine(database_url, echo=False)
+        self._engine = create_async_engine(
+            database_url,
+            echo=False,
+            pool_size=pool_size,
+            max_overflow=max_overflow,
+            pool_recycle=pool_recycle,
+            pool_pre_ping=pool_pre_ping,
+            # LIFO reuse keeps a small set of connections hot under light load
+            pool_use_lifo=True,
+            connect_args={
+                "statement_cache_size": statement_cache_size,
+                "prepared_statement_cache_size": statement_cache_size,
+                "server_settings": {
+                    # JIT compilation only slows down the short queries issued here
+                    "jit": "off",
+                    "application_name": application_name,
+                },
+            },
+        )
         self._session_factory = async_sessionmaker(
             self._engine, class_=AsyncSession, expire_on_commit=False
         )
 
+    async def warm_up(self, connections: int) -> None:
+        """Open pool connections ahead of the first queries.
+
+        Best effort: failures are logged, and every connection that did open
+        is returned to the pool. Connections are otherwise opened lazily.
+
+        Args:
+            connections: Number of connections to establish and return to the pool.
+        """
+        results = await asyncio.gather(
+            *(self._engine.connect() for _ in range(connections)),
+            return_exceptions=True,
+        )
+        opened = [result for result in results if isinstance(result, AsyncConnection)]
+        await asyncio.gather(*(conn.close() for conn in opened), return_exceptions=True)
+
+        failures = [result for result in results if isinstance(result, BaseException)]
+        if failures:
+            logger.warning(
+                "database_warm_up_failed",
+                failed=len(failures),
+                opened=len(opened),
+                error=str(failures[0]),
+            )
+
     async def create_tables(self) -> None:
         """Create all tables in the database."""
         async with self._engine.begin() as conn:
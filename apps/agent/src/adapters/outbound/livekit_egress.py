@@ -4,8 +4,15 @@ This adapter implements the EgressPort interface using the LiveKit API
 for recording room composite egress with HLS output to S3.
 """
 
+import asyncio
+import re
+import time
+
+import aiohttp
 import structlog
 from livekit.api import LiveKitAPI
+from livekit.api.twirp_client import TwirpError
+from livekit.api.twirp_client import TwirpErrorCode
 from livekit.protocol.egress import ListEgressRequest
 from livekit.protocol.egress import RoomCompositeEgressRequest
 from livekit.protocol.egress import S3Upload
@@ -19,9 +26,25 @@ from src.application.ports.egress_port import EgressPort
 from src.config.settings import Settings
 from src.domain.value_objects import EgressConfig
 from src.domain.value_objects import EgressInfo
+from src.domain.value_objects import EgressStatus
 
 logger = structlog.get_logger()
 
+# Idle API connections are reused for this long (aiohttp defaults to 15 seconds),
+# so sporadic egress calls skip the TCP and TLS handshakes
+_API_KEEPALIVE_TIMEOUT = 60.0
+
+# Fallback for errors that only describe a missing egress in their message
+_NOT_FOUND_RE = re.compile(r"not found|does not exist", re.IGNORECASE)
+
+# get_egress_info results are reused for this many seconds; finished
+# egresses no longer change, so they are kept longer
+_EGRESS_INFO_TTL = 2.0
+_FINISHED_EGRESS_INFO_TTL = 30.0
+_FINISHED_EGRESS_STATUSES = frozenset({EgressStatus.COMPLETE, EgressStatus.FAILED})
+# Maximum number of cached egress lookups; oldest entries are evicted first
+_EGRESS_INFO_CACHE_SIZE = 256
+
 
 class LiveKitEgressAdapter(EgressPort):
     """LiveKit Egress API adapter.
@@ -37,7 +60,17 @@ class LiveKitEgressAdapter(EgressPort):
             settings: Application settings containing LiveKit credentials.
         """
         self._settings = settings
+        # Upload target for a custom endpoint (MinIO); the credentials never
+        # change, so it is built once and copied into each egress request
+        self._s3_upload: S3Upload | None = None
+        if settings.s3_endpoint_url:
+            self._s3_upload = _build_s3_upload_config(settings)
+        self._http: aiohttp.ClientSession | None = None
         self._api: LiveKitAPI | None = None
+        # egress_id -> (expiry on the monotonic clock, info)
+        self._info_cache: dict[str, tuple[float, EgressInfo]] = {}
+        # In-flight lookups, shared by concurrent callers for the same egress
+        self._info_lookups: dict[str, asyncio.Task[EgressInfo | None]] = {}
 
     async def _get_api(self) -> LiveKitAPI:
         """Get or create the LiveKit API client.
@@ -46,10 +79,17 @@ class LiveKitEgressAdapter(EgressPort):
             Initialized LiveKitAPI client.
         """
         if self._api is None:
+            self._http = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=self._settings.livekit_api_max_connections,
+                    keepalive_timeout=_API_KEEPALIVE_TIMEOUT,
+                ),
+            )
             self._api = LiveKitAPI(
                 url=self._settings.livekit_url,
                 api_key=self._settings.livekit_api_key,
                 api_secret=self._settings.livekit_api_secret.get_secret_value(),
+                session=self._http,
             )
         return self._api
 
@@ -75,16 +115,11 @@ class LiveKitEgressAdapter(EgressPort):
             s3_prefix = f"s3://{config.output_bucket}/{config.output_path}"
 
             # Configure segmented file output for HLS
-            # Include S3 upload config if using custom endpoint (MinIO)
-            s3_config = None
-            if self._settings.s3_endpoint_url:
-                s3_config = _build_s3_upload_config(self._settings)
-
             segment_output = SegmentedFileOutput(
                 filename_prefix=s3_prefix,
                 playlist_name="index.m3u8",
                 segment_duration=config.segment_duration,
-                s3=s3_config,
+                s3=self._s3_upload,
             )
 
             request = RoomCompositeEgressRequest(
@@ -150,8 +185,7 @@ class LiveKitEgressAdapter(EgressPort):
             return egress_info
 
         except Exception as e:
-            error_msg = str(e).lower()
-            if "not found" in error_msg or "does not exist" in error_msg:
+            if _is_not_found(e):
                 raise EgressNotFoundError(f"Egress {egress_id} not found") from e
 
             logger.error(
@@ -161,9 +195,40 @@ class LiveKitEgressAdapter(EgressPort):
             )
             raise EgressError(f"Failed to stop egress {egress_id}: {e}") from e
 
+        finally:
+            self._info_cache.pop(egress_id, None)
+
     async def get_egress_info(self, egress_id: str) -> EgressInfo | None:
         """Get information about an egress recording.
 
+        Results are cached briefly, so callers polling an egress share one
+        API call per few seconds. Concurrent lookups of the same egress share
+        a single in-flight call.
+
+        Args:
+            egress_id: The egress ID to query.
+
+        Returns:
+            EgressInfo with current status and metadata, or None if not found.
+
+        Raises:
+            EgressError: If the lookup fails.
+        """
+        cached = self._info_cache.get(egress_id)
+        if cached is not None and cached[0] > time.monotonic():
+            return cached[1]
+
+        lookup = self._info_lookups.get(egress_id)
+        if lookup is None:
+            lookup = asyncio.create_task(self._fetch_egress_info(egress_id))
+            self._info_lookups[egress_id] = lookup
+            lookup.add_done_callback(lambda _: self._info_lookups.pop(egress_id, None))
+        # Shielded so that one cancelled caller does not cancel the others' lookup
+        return await asyncio.shield(lookup)
+
+    async def _fetch_egress_info(self, egress_id: str) -> EgressInfo | None:
+        """Query the LiveKit API for an egress and cache the result.
+
         Args:
             egress_id: The egress ID to query.
 
@@ -184,7 +249,9 @@ class LiveKitEgressAdapter(EgressPort):
                 return None
 
             result = response.items[0]
-            return convert_egress_info(result, result.room_name)
+            egress_info = convert_egress_info(result, result.room_name)
+            self._cache_egress_info(egress_info)
+            return egress_info
 
         except Exception as e:
             logger.error(
@@ -194,11 +261,46 @@ class LiveKitEgressAdapter(EgressPort):
             )
             raise EgressError(f"Failed to get egress info {egress_id}: {e}") from e
 
+    def _cache_egress_info(self, egress_info: EgressInfo) -> None:
+        """Cache an egress lookup result.
+
+        Args:
+            egress_info: The egress info to cache.
+        """
+        self._info_cache.pop(egress_info.egress_id, None)
+        if len(self._info_cache) >= _EGRESS_INFO_CACHE_SIZE:
+            # Dicts keep insertion order, so the first key is the oldest entry
+            del self._info_cache[next(iter(self._info_cache))]
+
+        if egress_info.status in _FINISHED_EGRESS_STATUSES:
+            ttl = _FINISHED_EGRESS_INFO_TTL
+        else:
+            ttl = _EGRESS_INFO_TTL
+        self._info_cache[egress_info.egress_id] = (time.monotonic() + ttl, egress_info)
+
     async def close(self) -> None:
         """Close the adapter and release resources."""
         if self._api is not None:
             await self._api.aclose()  # type: ignore[no-untyped-call]
             self._api = None
+        # LiveKitAPI leaves a session it did not create open
+        if self._http is not None:
+            await self._http.close()
+            self._http = None
+
+
+def _is_not_found(error: Exception) -> bool:
+    """Check whether an API error means the egress does not exist.
+
+    Args:
+        error: The exception raised by the LiveKit API call.
+
+    Returns:
+        True if the error reports a missing egress.
+    """
+    if isinstance(error, TwirpError) and error.code == TwirpErrorCode.NOT_FOUND:
+        return True
+    return _NOT_FOUND_RE.search(str(error)) is not None
 
 
 def _build_s3_upload_config(settings: Settings) -> S3Upload:
@@ -0,0 +1,115 @@
+"""No-op implementation of SessionRepositoryPort."""
+
+from collections.abc import Sequence
+from contextlib import AbstractAsyncContextManager
+from contextlib import nullcontext
+from datetime import datetime
+from uuid import UUID
+
+from src.application.ports import SessionRepositoryPort
+from src.domain.entities import Message
+from src.domain.entities import Session
+
+
+class NullSessionRepository(SessionRepositoryPort):
+    """Session repository that discards all writes.
+
+    Used where persistence is disabled (e.g. console mode) so callers can
+    write unconditionally instead of checking for a database.
+    """
+
+    async def save_session(self, session: Session) -> None:
+        """Discard the session.
+
+        Args:
+            session: The session to save.
+        """
+
+    async def get_session(self, session_id: UUID) -> Session | None:  # noqa: ARG002
+        """Look up a session; nothing is ever stored.
+
+        Args:
+            session_id: The session ID to look up.
+
+        Returns:
+            Always None.
+        """
+        return None
+
+    async def get_session_by_room(self, room_name: str) -> Session | None:  # noqa: ARG002
+        """Look up a session by room; nothing is ever stored.
+
+        Args:
+            room_name: The LiveKit room name.
+
+        Returns:
+            Always None.
+        """
+        return None
+
+    async def save_message(self, message: Message) -> None:
+        """Discard the message.
+
+        Args:
+            message: The message to save.
+        """
+
+    async def save_messages(self, messages: Sequence[Message]) -> None:
+        """Discard the messages.
+
+        Args:
+            messages: The messages to save.
+        """
+
+    async def get_messages(self, session_id: UUID) -> list[Message]:  # noqa: ARG002
+        """Retrieve messages for a session; nothing is ever stored.
+
+        Args:
+            session_id: The session ID.
+
+        Returns:
+            Always an empty list.
+        """
+        return []
+
+    async def get_messages_after(
+        self,
+        session_id: UUID,  # noqa: ARG002
+        limit: int,  # noqa: ARG002
+        cursor: tuple[datetime, UUID] | None = None,  # noqa: ARG002
+    ) -> list[Message]:
+        """Retrieve a page of messages; nothing is ever stored.
+
+        Args:
+            session_id: The session ID.
+            limit: Maximum number of messages to return.
+            cursor: ``(created_at, id)`` of the last message already seen.
+
+        Returns:
+            Always an empty list.
+        """
+        return []
+
+    async def get_recent_messages(
+        self,
+        session_id: UUID,  # noqa: ARG002
+        limit: int,  # noqa: ARG002
+    ) -> list[Message]:
+        """Retrieve the latest messages; nothing is ever stored.
+
+        Args:
+            session_id: The session ID.
+            limit: Maximum number of messages to return.
+
+        Returns:
+            Always an empty list.
+        """
+        return []
+
+    def transaction(self) -> AbstractAsyncContextManager[None]:
+        """Group writes into a transaction; there is nothing to commit.
+
+        Returns:
+            An async context manager that does nothing.
+        """
+        return nullcontext()
@@ -1,76 +1,107 @@
 """PostgreSQL implementation of RecordingRepositoryPort."""
 
+from collections.abc import Sequence
+from datetime import datetime
+from typing import Any
 from uuid import UUID
 
 import structlog
+from sqlalchemy import bindparam
 from sqlalchemy import func
 from sqlalchemy import select
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import tuple_
 
 from src.adapters.outbound.database import RecordingModel
+from src.adapters.outbound.database import SqlAlchemyRepository
+from src.adapters.outbound.database import upsert
 from src.application.ports import RecordingRepositoryPort
 from src.domain.entities import Recording
 from src.domain.entities import RecordingStatus
 
 logger = structlog.get_logger()
 
-
-class PostgresRecordingRepository(RecordingRepositoryPort):
+# Columns that change over a recording's lifecycle; the rest are fixed at creation
+_RECORDING_UPDATE_COLUMNS = (
+    "status",
+    "playlist_url",
+    "duration_seconds",
+    "file_size_bytes",
+    "error_message",
+    "updated_at",
+    "started_at",
+    "ended_at",
+)
+
+# Hot lookups are built once; per call only the bound parameters change,
+# which skips statement construction and cache-key generation
+_SELECT_LATEST_BY_SESSION = (
+    select(RecordingModel)
+    .where(RecordingModel.session_id == bindparam("session_id"))
+    .order_by(RecordingModel.created_at.desc())
+    .limit(1)
+)
+_SELECT_BY_EGRESS = select(RecordingModel).where(RecordingModel.egress_id == bindparam("egress_id"))
+_SELECT_ACTIVE_ID_BY_SESSION = (
+    select(RecordingModel.id)
+    .where(
+        RecordingModel.session_id == bindparam("session_id"),
+        RecordingModel.status.not_in(
+            [RecordingStatus.COMPLETED.value, RecordingStatus.FAILED.value]
+        ),
+    )
+    .limit(1)
+)
+
+# Locking variants; populate_existing makes a row loaded earlier in the
+# session reflect the state read after acquiring the lock
+_SELECT_LATEST_BY_SESSION_FOR_UPDATE = (
+    _SELECT_LATEST_BY_SESSION.with_for_update().execution_options(populate_existing=True)
+)
+_SELECT_BY_EGRESS_FOR_UPDATE = _SELECT_BY_EGRESS.with_for_update().execution_options(
+    populate_existing=True
+)
+
+
+class PostgresRecordingRepository(SqlAlchemyRepository, RecordingRepositoryPort):
     """PostgreSQL implementation of recording repository.
 
     This adapter handles persistence of recordings to PostgreSQL.
     """
 
-    def __init__(self, session: AsyncSession) -> None:
-        """Initialize the repository with a database session.
-
-        Args:
-            session: SQLAlchemy async session.
-        """
-        self._session = session
-
     async def save(self, recording: Recording) -> None:
         """Save or update a recording.
 
         Args:
             recording: The recording to save.
         """
-        model = await self._session.get(RecordingModel, recording.id)
-        if model is None:
-            model = RecordingModel(
-                id=recording.id,
-                session_id=recording.session_id,
-                egress_id=recording.egress_id,
-                status=recording.status.value,
-                storage_bucket=recording.storage_bucket,
-                storage_path=recording.storage_path,
-                playlist_url=recording.playlist_url,
-                duration_seconds=recording.duration_seconds,
-                file_size_bytes=recording.file_size_bytes,
-                error_message=recording.error_message,
-                created_at=recording.created_at,
-                updated_at=recording.updated_at,
-                started_at=recording.started_at,
-                ended_at=recording.ended_at,
-            )
-            self._session.add(model)
-        else:
-            model.status = recording.status.value
-            model.playlist_url = recording.playlist_url
-            model.duration_seconds = recording.duration_seconds
-            model.file_size_bytes = recording.file_size_bytes
-            model.error_message = recording.error_message
-            model.updated_at = recording.updated_at
-            model.started_at = recording.started_at
-            model.ended_at = recording.ended_at
-
-        await self._session.commit()
+        await upsert(
+            self._session,
+            RecordingModel,
+            self._entity_to_values(recording),
+            _RECORDING_UPDATE_COLUMNS,
+        )
+        await self._commit()
         logger.debug(
             "recording_saved",
-            recording_id=str(recording.id),
+            recording_id=recording.id_str,
             status=recording.status.value,
         )
 
+    async def save_many(self, recordings: Sequence[Recording]) -> None:
+        """Save or update several recordings with a single statement.
+
+        Args:
+            recordings: The recordings to save; the last occurrence of a
+                recording wins.
+        """
+        if not recordings:
+            return
+        # One statement cannot upsert the same primary key twice
+        rows = {recording.id: self._entity_to_values(recording) for recording in recordings}
+        await upsert(self._session, RecordingModel, list(rows.values()), _RECORDING_UPDATE_COLUMNS)
+        await self._commit()
+        logger.debug("recordings_saved", count=len(rows))
+
     async def get_by_id(self, recording_id: UUID) -> Recording | None:
         """Retrieve a recording by ID.
 
@@ -85,38 +116,57 @@ class PostgresRecordingRepository(RecordingRepositoryPort):
             return None
         return self._model_to_entity(model)
 
-    async def get_by_session_id(self, session_id: UUID) -> Recording | None:
+    async def get_by_session_id(
+        self,
+        session_id: UUID,
+        for_update: bool = False,
+    ) -> Recording | None:
         """Retrieve a recording by session ID.
 
         Args:
             session_id: The session ID to look up.
+            for_update: Lock the row until the current transaction ends.
 
         Returns:
             The recording if found, None otherwise.
         """
-        stmt = (
-            select(RecordingModel)
-            .where(RecordingModel.session_id == session_id)
-            .order_by(RecordingModel.created_at.desc())
-            .limit(1)
-        )
-        result = await self._session.execute(stmt)
+        stmt = _SELECT_LATEST_BY_SESSION_FOR_UPDATE if for_update else _SELECT_LATEST_BY_SESSION
+        result = await self._session.execute(stmt, {"session_id": session_id})
         model = result.scalar_one_or_none()
         if model is None:
             return None
         return self._model_to_entity(model)
 
-    async def get_by_egress_id(self, egress_id: str) -> Recording | None:
+    async def exists_active(self, session_id: UUID) -> bool:
+        """Check whether a session has a recording that is not yet terminal.
+
+        Args:
+            session_id: The session ID to look up.
+
+        Returns:
+            True if a recording for the session is neither completed nor failed.
+        """
+        result = await self._session.execute(
+            _SELECT_ACTIVE_ID_BY_SESSION, {"session_id": session_id}
+        )
+        return result.first() is not None
+
+    async def get_by_egress_id(
+        self,
+        egress_id: str,
+        for_update: bool = False,
+    ) -> Recording | None:
         """Retrieve a recording by egress ID.
 
         Args:
             egress_id: The LiveKit egress ID.
+            for_update: Lock the row until the current transaction ends.
 
         Returns:
             The recording if found, None otherwise.
         """
-        stmt = select(RecordingModel).where(RecordingModel.egress_id == egress_id)
-        result = await self._session.execute(stmt)
+        stmt = _SELECT_BY_EGRESS_FOR_UPDATE if for_update else _SELECT_BY_EGRESS
+        result = await self._session.execute(stmt, {"egress_id": egress_id})
         model = result.scalar_one_or_none()
         if model is None:
             return None
@@ -141,44 +191,82 @@ class PostgresRecordingRepository(RecordingRepositoryPort):
         stmt = (
             select(RecordingModel)
             .where(RecordingModel.status == status.value)
-            .order_by(RecordingModel.created_at.desc())
+            .order_by(RecordingModel.created_at.desc(), RecordingModel.id.desc())
             .limit(limit)
             .offset(offset)
         )
         result = await self._session.execute(stmt)
-        models = result.scalars().all()
-        return [self._model_to_entity(m) for m in models]
+        return [self._model_to_entity(m) for m in result.scalars()]
 
     async def list_all(
         self,
         page: int = 1,
         page_size: int = 20,
+        status: RecordingStatus | None = None,
     ) -> tuple[list[Recording], int]:
         """List all recordings with pagination.
 
         Args:
             page: Page number (1-indexed).
             page_size: Number of items per page.
+            status: Optional status filter, applied to both the page and the total.
 
         Returns:
             Tuple of (recordings list, total count).
         """
-        # Count query
-        count_stmt = select(func.count()).select_from(RecordingModel)
-        count_result = await self._session.execute(count_stmt)
-        total = count_result.scalar_one()
+        # The total rides along on every row, so one query returns page and count
+        stmt = select(RecordingModel, func.count().over().label("total"))
+        if status is not None:
+            stmt = stmt.where(RecordingModel.status == status.value)
 
-        # Data query with pagination
         offset = (page - 1) * page_size
         stmt = (
-            select(RecordingModel)
-            .order_by(RecordingModel.created_at.desc())
+            stmt.order_by(RecordingModel.created_at.desc(), RecordingModel.id.desc())
             .limit(page_size)
             .offset(offset)
         )
         result = await self._session.execute(stmt)
-        models = result.scalars().all()
-        return [self._model_to_entity(m) for m in models], total
+        rows = result.all()
+        if rows:
+            return [self._model_to_entity(row[0]) for row in rows], rows[0].total
+
+        # A page past the end has no rows to carry the total
+        if offset == 0:
+            return [], 0
+        count_stmt = select(func.count()).select_from(RecordingModel)
+        if status is not None:
+            count_stmt = count_stmt.where(RecordingModel.status == status.value)
+        count_result = await self._session.execute(count_stmt)
+        return [], count_result.scalar_one()
+
+    async def list_after(
+        self,
+        limit: int,
+        cursor: tuple[datetime, UUID] | None = None,
+        status: RecordingStatus | None = None,
+    ) -> list[Recording]:
+        """List recordings by keyset, newest first.
+
+        Args:
+            limit: Maximum number of recordings to return.
+            cursor: ``(created_at, id)`` of the last recording already seen,
+                or None to start from the newest.
+            status: Optional status filter.
+
+        Returns:
+            List of recordings following the cursor.
+        """
+        stmt = select(RecordingModel)
+        if status is not None:
+            stmt = stmt.where(RecordingModel.status == status.value)
+        if cursor is not None:
+            stmt = stmt.where(tuple_(RecordingModel.created_at, RecordingModel.id) < cursor)
+        stmt = stmt.order_by(
+            RecordingModel.created_at.desc(),
+            RecordingModel.id.desc(),
+        ).limit(limit)
+        result = await self._session.execute(stmt)
+        return [self._model_to_entity(m) for m in result.scalars()]
 
     async def count_by_status(self, status: RecordingStatus) -> int:
         """Count recordings by status.
@@ -197,6 +285,32 @@ class PostgresRecordingRepository(RecordingRepositoryPort):
         result = await self._session.execute(stmt)
         return result.scalar_one()
 
+    def _entity_to_values(self, recording: Recording) -> dict[str, Any]:
+        """Convert domain entity to column values.
+
+        Args:
+            recording: The domain entity.
+
+        Returns:
+            Column values for the recordings table.
+        """
+        return {
+            "id": recording.id,
+            "session_id": recording.session_id,
+            "egress_id": recording.egress_id,
+            "status": recording.status.value,
+            "storage_bucket": recording.storage_bucket,
+            "storage_path": recording.storage_path,
+            "playlist_url": recording.playlist_url,
+            "duration_seconds": recording.duration_seconds,
+            "file_size_bytes": recording.file_size_bytes,
+            "error_message": recording.error_message,
+            "created_at": recording.created_at,
+            "updated_at": recording.updated_at,
+            "started_at": recording.started_at,
+            "ended_at": recording.ended_at,
+        }
+
     def _model_to_entity(self, model: RecordingModel) -> Recording:
         """Convert SQLAlchemy model to domain entity.
 
@@ -1,13 +1,20 @@
 """PostgreSQL implementation of SessionRepositoryPort."""
 
+from collections.abc import Sequence
+from datetime import datetime
 from uuid import UUID
 
 import structlog
+from sqlalchemy import bindparam
+from sqlalchemy import insert
 from sqlalchemy import select
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import tuple_
+from sqlalchemy.orm import load_only
 
 from src.adapters.outbound.database import MessageModel
 from src.adapters.outbound.database import SessionModel
+from src.adapters.outbound.database import SqlAlchemyRepository
+from src.adapters.outbound.database import upsert
 from src.application.ports import SessionRepositoryPort
 from src.domain.entities import Message
 from src.domain.entities import MessageRole
@@ -16,45 +23,80 @@ from src.domain.entities import SessionStatus
 
 logger = structlog.get_logger()
 
+# Columns that change over a session's lifecycle; the rest are fixed at creation
+_SESSION_UPDATE_COLUMNS = ("status", "started_at", "ended_at")
 
-class PostgresSessionRepository(SessionRepositoryPort):
+# Only the columns mapped onto domain entities are loaded
+_SESSION_ENTITY_COLUMNS = load_only(
+    SessionModel.id,
+    SessionModel.room_name,
+    SessionModel.user_id,
+    SessionModel.status,
+    SessionModel.created_at,
+    SessionModel.started_at,
+    SessionModel.ended_at,
+)
+_MESSAGE_ENTITY_COLUMNS = load_only(
+    MessageModel.id,
+    MessageModel.session_id,
+    MessageModel.role,
+    MessageModel.content,
+    MessageModel.created_at,
+)
+
+# Built once; per call only the bound parameters change
+_SELECT_LATEST_BY_ROOM = (
+    select(SessionModel)
+    .options(_SESSION_ENTITY_COLUMNS)
+    .where(SessionModel.room_name == bindparam("room_name"))
+    .order_by(SessionModel.created_at.desc())
+    .limit(1)
+)
+_SELECT_MESSAGES_BY_SESSION = (
+    select(MessageModel)
+    .options(_MESSAGE_ENTITY_COLUMNS)
+    .where(MessageModel.session_id == bindparam("session_id"))
+    .order_by(MessageModel.created_at)
+)
+_SELECT_RECENT_MESSAGES_BY_SESSION = (
+    select(MessageModel)
+    .options(_MESSAGE_ENTITY_COLUMNS)
+    .where(MessageModel.session_id == bindparam("session_id"))
+    .order_by(MessageModel.created_at.desc(), MessageModel.id.desc())
+    .limit(bindparam("limit"))
+)
+
+# Column order used for COPY-based bulk message inserts
+_MESSAGE_COPY_COLUMNS = ("id", "session_id", "role", "content", "timestamp_ms", "created_at")
+
+
+class PostgresSessionRepository(SqlAlchemyRepository, SessionRepositoryPort):
     """PostgreSQL implementation of session repository.
 
     This adapter handles persistence of sessions and messages to PostgreSQL.
     """
 
-    def __init__(self, session: AsyncSession) -> None:
-        """Initialize the repository with a database session.
-
-        Args:
-            session: SQLAlchemy async session.
-        """
-        self._session = session
-
     async def save_session(self, session: Session) -> None:
         """Save or update a session.
 
         Args:
             session: The session to save.
         """
-        model = await self._session.get(SessionModel, session.id)
-        if model is None:
-            model = SessionModel(
-                id=session.id,
-                room_name=session.room_name,
-                user_id=session.user_id,
-                status=session.status.value,
-                created_at=session.created_at,
-                started_at=session.started_at,
-                ended_at=session.ended_at,
-            )
-            self._session.add(model)
-        else:
-            model.status = session.status.value
-            model.started_at = session.started_at
-            model.ended_at = session.ended_at
-
-        await self._session.commit()
+        await upsert(
+            self._session,
+            SessionModel,
+            {
+                "id": session.id,
+                "room_name": session.room_name,
+                "user_id": session.user_id,
+                "status": session.status.value,
+                "created_at": session.created_at,
+                "started_at": session.started_at,
+                "ended_at": session.ended_at,
+            },
+            _SESSION_UPDATE_COLUMNS,
+        )
+        await self._commit()
         logger.debug("session_saved", session_id=str(session.id), status=session.status.value)
 
     async def get_session(self, session_id: UUID) -> Session | None:
@@ -66,7 +108,7 @@ class PostgresSessionRepository(SessionRepositoryPort):
         Returns:
             The session if found, None otherwise.
         """
-        model = await self._session.get(SessionModel, session_id)
+        model = await self._session.get(SessionModel, session_id, options=[_SESSION_ENTITY_COLUMNS])
         if model is None:
             return None
         return self._model_to_entity(model)
@@ -80,13 +122,7 @@ class PostgresSessionRepository(SessionRepositoryPort):
         Returns:
             The session if found, None otherwise.
         """
-        stmt = (
-            select(SessionModel)
-            .where(SessionModel.room_name == room_name)
-            .order_by(SessionModel.created_at.desc())
-            .limit(1)
-        )
-        result = await self._session.execute(stmt)
+        result = await self._session.execute(_SELECT_LATEST_BY_ROOM, {"room_name": room_name})
         model = result.scalar_one_or_none()
         if model is None:
             return None
@@ -106,7 +142,7 @@ class PostgresSessionRepository(SessionRepositoryPort):
             created_at=message.created_at,
         )
         self._session.add(model)
-        await self._session.commit()
+        await self._commit()
         logger.debug(
             "message_saved",
             message_id=str(message.id),
@@ -114,6 +150,51 @@ class PostgresSessionRepository(SessionRepositoryPort):
             role=message.role.value,
         )
 
+    async def save_messages(self, messages: Sequence[Message]) -> None:
+        """Save a batch of messages in a single round-trip.
+
+        On PostgreSQL (asyncpg) the rows are streamed with ``COPY``; other
+        dialects fall back to an ``executemany`` INSERT.
+
+        Args:
+            messages: The messages to save.
+        """
+        if not messages:
+            return
+
+        connection = await self._session.connection()
+        if connection.dialect.driver == "asyncpg":
+            raw_connection = await connection.get_raw_connection()
+            await raw_connection.driver_connection.copy_records_to_table(
+                "messages",
+                records=[
+                    (m.id, m.session_id, m.role.value, m.content, None, m.created_at)
+                    for m in messages
+                ],
+                columns=_MESSAGE_COPY_COLUMNS,
+            )
+        else:
+            await self._session.execute(
+                insert(MessageModel),
+                [
+                    {
+                        "id": m.id,
+                        "session_id": m.session_id,
+                        "role": m.role.value,
+                        "content": m.content,
+                        "created_at": m.created_at,
+                    }
+                    for m in messages
+                ],
+            )
+
+        await self._commit()
+        logger.debug(
+            "messages_saved",
+            session_id=str(messages[0].session_id),
+            count=len(messages),
+        )
+
     async def get_messages(self, session_id: UUID) -> list[Message]:
         """Retrieve all messages for a session.
 
@@ -123,14 +204,56 @@ class PostgresSessionRepository(SessionRepositoryPort):
         Returns:
             List of messages ordered by creation time.
         """
+        result = await self._session.execute(
+            _SELECT_MESSAGES_BY_SESSION, {"session_id": session_id}
+        )
+        return [self._message_model_to_entity(m) for m in result.scalars()]
+
+    async def get_messages_after(
+        self,
+        session_id: UUID,
+        limit: int,
+        cursor: tuple[datetime, UUID] | None = None,
+    ) -> list[Message]:
+        """Retrieve a page of a session's messages by keyset, oldest first.
+
+        Args:
+            session_id: The session ID.
+            limit: Maximum number of messages to return.
+            cursor: ``(created_at, id)`` of the last message already seen,
+                or None to start from the first.
+
+        Returns:
+            List of messages following the cursor.
+        """
         stmt = (
             select(MessageModel)
+            .options(_MESSAGE_ENTITY_COLUMNS)
             .where(MessageModel.session_id == session_id)
-            .order_by(MessageModel.created_at)
         )
+        if cursor is not None:
+            stmt = stmt.where(tuple_(MessageModel.created_at, MessageModel.id) > cursor)
+        stmt = stmt.order_by(MessageModel.created_at, MessageModel.id).limit(limit)
         result = await self._session.execute(stmt)
-        models = result.scalars().all()
-        return [self._message_model_to_entity(m) for m in models]
+        return [self._message_model_to_entity(m) for m in result.scalars()]
+
+    async def get_recent_messages(self, session_id: UUID, limit: int) -> list[Message]:
+        """Retrieve the latest messages of a session.
+
+        Args:
+            session_id: The session ID.
+            limit: Maximum number of messages to return.
+
+        Returns:
+            Up to ``limit`` most recent messages, ordered by creation time.
+        """
+        result = await self._session.execute(
+            _SELECT_RECENT_MESSAGES_BY_SESSION, {"session_id": session_id, "limit": limit}
+        )
+        # Read newest first so only the tail is scanned, then restore order
+        messages = [self._message_model_to_entity(m) for m in result.scalars()]
+        messages.reverse()
+        return messages
 
     def _model_to_entity(self, model: SessionModel) -> Session:
         """Convert SQLAlchemy model to domain entity.
@@ -4,9 +4,10 @@ This adapter implements the StoragePort interface using aioboto3
 for asynchronous S3 operations. Supports both AWS S3 and MinIO.
 """
 
-from collections.abc import AsyncIterator
-from contextlib import asynccontextmanager
-from datetime import UTC
+import asyncio
+import time
+from collections.abc import Sequence
+from contextlib import AsyncExitStack
 from typing import Any
 
 import aioboto3
@@ -21,12 +22,26 @@ from src.domain.value_objects import ObjectInfo
 
 logger = structlog.get_logger()
 
+# Maximum keys S3 returns per ListObjectsV2 request
+_LIST_PAGE_SIZE = 1000
+
+# Positive object_exists results are reused for this many seconds; objects
+# are only removed through delete_object, which drops the entry
+_EXISTS_CACHE_TTL = 30.0
+_EXISTS_CACHE_SIZE = 1024
+
+# Presigned URLs are reused during the first tenth of their lifetime, so a
+# caller always gets at least 90% of the validity it asked for
+_PRESIGNED_URL_REUSE_FRACTION = 0.1
+_PRESIGNED_URL_CACHE_SIZE = 1024
+
 
 class S3StorageAdapter(StoragePort):
     """S3-compatible storage adapter using aioboto3.
 
     Supports both AWS S3 and MinIO (via endpoint_url configuration).
-    Uses async context managers for proper resource management.
+    A single client, and with it its connection pool, is reused for all
+    operations until ``close()`` is called.
     """
 
     def __init__(self, settings: Settings) -> None:
@@ -40,24 +55,52 @@ class S3StorageAdapter(StoragePort):
         self._config = Config(
             signature_version="s3v4",
             s3={"addressing_style": "path"},  # Required for MinIO
+            # Sized for concurrent requests; botocore defaults to 10 and discards
+            # connections beyond that, forcing new handshakes
+            max_pool_connections=settings.s3_max_pool_connections,
+            tcp_keepalive=True,
+            retries={"max_attempts": 3, "mode": "standard"},
         )
+        self._client: Any = None
+        self._client_stack: AsyncExitStack | None = None
+        self._client_lock = asyncio.Lock()
+        # Buckets confirmed to exist; buckets are never deleted by this service
+        self._known_buckets: set[str] = set()
+        # (bucket, key) -> monotonic expiry of a positive object_exists result
+        self._exists_cache: dict[tuple[str, str], float] = {}
+        # (bucket, key, expiry_seconds) -> (monotonic reuse deadline, URL)
+        self._url_cache: dict[tuple[str, str, int], tuple[float, str]] = {}
+
+    async def _get_client(self) -> Any:
+        """Get the shared S3 client, creating it on first use.
 
-    @asynccontextmanager
-    async def _get_client(self) -> AsyncIterator[Any]:
-        """Get an S3 client context manager.
-
-        Yields:
+        Returns:
             Async S3 client for operations.
         """
-        async with self._session.client(
-            "s3",
-            endpoint_url=self._settings.s3_endpoint_url,
-            aws_access_key_id=self._settings.s3_access_key,
-            aws_secret_access_key=self._settings.s3_secret_key.get_secret_value(),
-            region_name=self._settings.s3_region,
-            config=self._config,
-        ) as client:
-            yield client
+        if self._client is None:
+            async with self._client_lock:
+                if self._client is None:
+                    stack = AsyncExitStack()
+                    self._client = await stack.enter_async_context(
+                        self._session.client(
+                            "s3",
+                            endpoint_url=self._settings.s3_endpoint_url,
+                            aws_access_key_id=self._settings.s3_access_key,
+                            aws_secret_access_key=self._settings.s3_secret_key.get_secret_value(),
+                            region_name=self._settings.s3_region,
+                            config=self._config,
+                        )
+                    )
+                    self._client_stack = stack
+        return self._client
+
+    async def close(self) -> None:
+        """Close the shared S3 client and its connections."""
+        if self._client_stack is not None:
+            stack = self._client_stack
+            self._client = None
+            self._client_stack = None
+            await stack.aclose()
 
     async def generate_presigned_url(
         self,
@@ -67,6 +110,9 @@ class S3StorageAdapter(StoragePort):
     ) -> str:
         """Generate a presigned URL for downloading an object.
 
+        A URL issued for the same object and expiry is reused while most of
+        its lifetime remains.
+
         Args:
             bucket: S3 bucket name.
             key: Object key (path) in the bucket.
@@ -78,22 +124,36 @@ class S3StorageAdapter(StoragePort):
         Raises:
             StorageError: If URL generation fails.
         """
+        cache_key = (bucket, key, expiry_seconds)
+        cached = self._url_cache.get(cache_key)
+        if cached is not None:
+            reuse_until, cached_url = cached
+            if reuse_until > time.monotonic():
+                return cached_url
+            del self._url_cache[cache_key]
+
         try:
-            async with self._get_client() as client:
-                url: str = await client.generate_presigned_url(
-                    "get_object",
-                    Params={"Bucket": bucket, "Key": key},
-                    ExpiresIn=expiry_seconds,
-                )
+            client = await self._get_client()
+            url: str = await client.generate_presigned_url(
+                "get_object",
+                Params={"Bucket": bucket, "Key": key},
+                ExpiresIn=expiry_seconds,
+            )
 
-                logger.debug(
-                    "presigned_url_generated",
-                    bucket=bucket,
-                    key=key,
-                    expiry_seconds=expiry_seconds,
-                )
+            logger.debug(
+                "presigned_url_generated",
+                bucket=bucket,
+                key=key,
+                expiry_seconds=expiry_seconds,
+            )
+
+            if len(self._url_cache) >= _PRESIGNED_URL_CACHE_SIZE:
+                # Dicts keep insertion order, so the first key is the oldest entry
+                del self._url_cache[next(iter(self._url_cache))]
+            reuse_for = expiry_seconds * _PRESIGNED_URL_REUSE_FRACTION
+            self._url_cache[cache_key] = (time.monotonic() + reuse_for, url)
 
-                return url
+            return url
 
         except ClientError as e:
             logger.error(
@@ -104,6 +164,33 @@ class S3StorageAdapter(StoragePort):
             )
             raise StorageError(f"Failed to generate presigned URL: {e}") from e
 
+    async def generate_presigned_urls(
+        self,
+        bucket: str,
+        keys: Sequence[str],
+        expiry_seconds: int = 3600,
+    ) -> list[str]:
+        """Generate presigned URLs for several objects.
+
+        Signing is local to the shared client, so no request limit is needed.
+
+        Args:
+            bucket: S3 bucket name.
+            keys: Object keys (paths) in the bucket.
+            expiry_seconds: URL expiration time in seconds.
+
+        Returns:
+            Presigned URL per key, in the order of ``keys``.
+
+        Raises:
+            StorageError: If URL generation fails.
+        """
+        return list(
+            await asyncio.gather(
+                *(self.generate_presigned_url(bucket, key, expiry_seconds) for key in keys)
+            )
+        )
+
     async def object_exists(
         self,
         bucket: str,
@@ -121,16 +208,17 @@ class S3StorageAdapter(StoragePort):
         Raises:
             StorageError: If the check fails.
         """
-        try:
-            async with self._get_client() as client:
-                await client.head_object(Bucket=bucket, Key=key)
+        cache_key = (bucket, key)
+        expires_at = self._exists_cache.get(cache_key)
+        if expires_at is not None:
+            if expires_at > time.monotonic():
                 return True
+            del self._exists_cache[cache_key]
 
-        except ClientError as e:
-            error_code = e.response.get("Error", {}).get("Code", "")
-            if error_code in ("404", "NoSuchKey"):
-                return False
+        try:
+            exists = await self._head(bucket, key) is not None
 
+        except ClientError as e:
             logger.error(
                 "object_exists_check_failed",
                 bucket=bucket,
@@ -139,6 +227,13 @@ class S3StorageAdapter(StoragePort):
             )
             raise StorageError(f"Failed to check object existence: {e}") from e
 
+        if exists:
+            if len(self._exists_cache) >= _EXISTS_CACHE_SIZE:
+                # Dicts keep insertion order, so the first key is the oldest entry
+                del self._exists_cache[next(iter(self._exists_cache))]
+            self._exists_cache[cache_key] = time.monotonic() + _EXISTS_CACHE_TTL
+        return exists
+
     async def list_objects(
         self,
         bucket: str,
@@ -147,6 +242,10 @@ class S3StorageAdapter(StoragePort):
     ) -> list[ObjectInfo]:
         """List objects in a bucket with a given prefix.
 
+        Built solely from the LIST response: no per-object HEAD is issued, so
+        ``content_type`` is always None. Use ``get_object_info`` for full
+        metadata of individual objects.
+
         Args:
             bucket: S3 bucket name.
             prefix: Key prefix to filter objects.
@@ -159,38 +258,41 @@ class S3StorageAdapter(StoragePort):
             StorageError: If listing fails.
         """
         try:
-            async with self._get_client() as client:
-                response = await client.list_objects_v2(
-                    Bucket=bucket,
-                    Prefix=prefix,
-                    MaxKeys=max_keys,
-                )
+            client = await self._get_client()
+            # S3 returns at most 1000 keys per request; the paginator follows
+            # continuation tokens until max_keys objects have been listed
+            paginator = client.get_paginator("list_objects_v2")
+            pages = paginator.paginate(
+                Bucket=bucket,
+                Prefix=prefix,
+                PaginationConfig={
+                    "MaxItems": max_keys,
+                    "PageSize": min(max_keys, _LIST_PAGE_SIZE),
+                },
+            )
 
-                objects = []
-                for obj in response.get("Contents", []):
-                    # Ensure last_modified is timezone-aware
-                    last_modified = obj["LastModified"]
-                    if last_modified.tzinfo is None:
-                        last_modified = last_modified.replace(tzinfo=UTC)
-
-                    objects.append(
-                        ObjectInfo(
-                            bucket=bucket,
-                            key=obj["Key"],
-                            size_bytes=obj["Size"],
-                            last_modified=last_modified,
-                            etag=obj.get("ETag", "").strip('"'),
-                        )
+            # botocore parses LastModified into timezone-aware datetimes
+            objects: list[ObjectInfo] = []
+            async for page in pages:
+                objects.extend(
+                    ObjectInfo(
+                        bucket=bucket,
+                        key=obj["Key"],
+                        size_bytes=obj["Size"],
+                        last_modified=obj["LastModified"],
+                        etag=obj.get("ETag", "").strip('"'),
                     )
-
-                logger.debug(
-                    "objects_listed",
-                    bucket=bucket,
-                    prefix=prefix,
-                    count=len(objects),
+                    for obj in page.get("Contents", ())
                 )
 
-                return objects
+            logger.debug(
+                "objects_listed",
+                bucket=bucket,
+                prefix=prefix,
+                count=len(objects),
+            )
+
+            return objects
 
         except ClientError as e:
             logger.error(
@@ -215,15 +317,16 @@ class S3StorageAdapter(StoragePort):
         Raises:
             StorageError: If deletion fails.
         """
+        self._exists_cache.pop((bucket, key), None)
         try:
-            async with self._get_client() as client:
-                await client.delete_object(Bucket=bucket, Key=key)
+            client = await self._get_client()
+            await client.delete_object(Bucket=bucket, Key=key)
 
-                logger.info(
-                    "object_deleted",
-                    bucket=bucket,
-                    key=key,
-                )
+            logger.info(
+                "object_deleted",
+                bucket=bucket,
+                key=key,
+            )
 
         except ClientError as e:
             logger.error(
@@ -252,28 +355,9 @@ class S3StorageAdapter(StoragePort):
             StorageError: If the operation fails.
         """
         try:
-            async with self._get_client() as client:
-                response = await client.head_object(Bucket=bucket, Key=key)
-
-                # Ensure last_modified is timezone-aware
-                last_modified = response["LastModified"]
-                if last_modified.tzinfo is None:
-                    last_modified = last_modified.replace(tzinfo=UTC)
-
-                return ObjectInfo(
-                    bucket=bucket,
-                    key=key,
-                    size_bytes=response["ContentLength"],
-                    last_modified=last_modified,
-                    etag=response.get("ETag", "").strip('"'),
-                    content_type=response.get("ContentType"),
-                )
+            response = await self._head(bucket, key)
 
         except ClientError as e:
-            error_code = e.response.get("Error", {}).get("Code", "")
-            if error_code in ("404", "NoSuchKey"):
-                return None
-
             logger.error(
                 "get_object_info_failed",
                 bucket=bucket,
@@ -282,6 +366,67 @@ class S3StorageAdapter(StoragePort):
             )
             raise StorageError(f"Failed to get object info: {e}") from e
 
+        if response is None:
+            return None
+
+        return ObjectInfo(
+            bucket=bucket,
+            key=key,
+            size_bytes=response["ContentLength"],
+            last_modified=response["LastModified"],
+            etag=response.get("ETag", "").strip('"'),
+            content_type=response.get("ContentType"),
+        )
+
+    async def get_many_object_info(
+        self,
+        bucket: str,
+        keys: Sequence[str],
+        concurrency: int = 16,
+    ) -> list[ObjectInfo | None]:
+        """Get metadata for several objects with concurrent HEAD requests.
+
+        Args:
+            bucket: S3 bucket name.
+            keys: Object keys (paths) in the bucket.
+            concurrency: Maximum number of HEAD requests in flight.
+
+        Returns:
+            ObjectInfo per key, in the order of ``keys``; None for missing objects.
+
+        Raises:
+            StorageError: If any lookup fails.
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def head(key: str) -> ObjectInfo | None:
+            async with semaphore:
+                return await self.get_object_info(bucket, key)
+
+        return list(await asyncio.gather(*(head(key) for key in keys)))
+
+    async def _head(self, bucket: str, key: str) -> dict[str, Any] | None:
+        """Fetch an object's metadata with a single HEAD request.
+
+        Args:
+            bucket: S3 bucket name.
+            key: Object key (path) in the bucket.
+
+        Returns:
+            The HEAD response, or None if the object does not exist.
+
+        Raises:
+            ClientError: If the request fails for any other reason.
+        """
+        client = await self._get_client()
+        try:
+            response: dict[str, Any] = await client.head_object(Bucket=bucket, Key=key)
+        except ClientError as e:
+            if e.response.get("Error", {}).get("Code", "") in ("404", "NoSuchKey"):
+                return None
+            raise
+        return response
+
     async def ensure_bucket_exists(self, bucket: str) -> None:
         """Ensure a bucket exists, creating it if necessary.
 
@@ -291,25 +436,28 @@ class S3StorageAdapter(StoragePort):
         Raises:
             StorageError: If bucket creation fails.
         """
+        if bucket in self._known_buckets:
+            return
+
         try:
-            async with self._get_client() as client:
-                try:
-                    await client.head_bucket(Bucket=bucket)
-                    logger.debug("bucket_exists", bucket=bucket)
-                except ClientError as e:
-                    error_code = e.response.get("Error", {}).get("Code", "")
-                    if error_code in ("404", "NoSuchBucket"):
-                        # Create the bucket
-                        create_config = {}
-                        if self._settings.s3_region != "us-east-1":
-                            create_config["CreateBucketConfiguration"] = {
-                                "LocationConstraint": self._settings.s3_region
-                            }
-
-                        await client.create_bucket(Bucket=bucket, **create_config)
-                        logger.info("bucket_created", bucket=bucket)
-                    else:
-                        raise
+            client = await self._get_client()
+            try:
+                await client.head_bucket(Bucket=bucket)
+                logger.debug("bucket_exists", bucket=bucket)
+            except ClientError as e:
+                error_code = e.response.get("Error", {}).get("Code", "")
+                if error_code in ("404", "NoSuchBucket"):
+                    # Create the bucket
+                    create_config = {}
+                    if self._settings.s3_region != "us-east-1":
+                        create_config["CreateBucketConfiguration"] = {
+                            "LocationConstraint": self._settings.s3_region
+                        }
+
+                    await client.create_bucket(Bucket=bucket, **create_config)
+                    logger.info("bucket_created", bucket=bucket)
+                else:
+                    raise
 
         except ClientError as e:
             logger.error(
@@ -318,3 +466,5 @@ class S3StorageAdapter(StoragePort):
                 error=str(e),
             )
             raise StorageError(f"Failed to ensure bucket exists: {e}") from e
+
+        self._known_buckets.add(bucket)
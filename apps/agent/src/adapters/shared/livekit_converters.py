@@ -6,6 +6,7 @@ LiveKit protocol objects into domain value objects.
 
 from datetime import UTC
 from datetime import datetime
+from datetime import timedelta
 
 from livekit.protocol.egress import EgressInfo as LiveKitEgressInfo
 from livekit.protocol.egress import EgressStatus as LiveKitEgressStatus
@@ -13,6 +14,20 @@ from livekit.protocol.egress import EgressStatus as LiveKitEgressStatus
 from src.domain.value_objects import EgressInfo
 from src.domain.value_objects import EgressStatus
 
+# LiveKit timestamps are integer nanoseconds since this instant
+_EPOCH = datetime(1970, 1, 1, tzinfo=UTC)
+
+# LiveKit egress status to domain status; unknown values map to STARTING
+_LK_STATUS_MAP: dict[LiveKitEgressStatus, EgressStatus] = {
+    LiveKitEgressStatus.EGRESS_STARTING: EgressStatus.STARTING,
+    LiveKitEgressStatus.EGRESS_ACTIVE: EgressStatus.ACTIVE,
+    LiveKitEgressStatus.EGRESS_ENDING: EgressStatus.ENDING,
+    LiveKitEgressStatus.EGRESS_COMPLETE: EgressStatus.COMPLETE,
+    LiveKitEgressStatus.EGRESS_FAILED: EgressStatus.FAILED,
+    LiveKitEgressStatus.EGRESS_ABORTED: EgressStatus.FAILED,
+    LiveKitEgressStatus.EGRESS_LIMIT_REACHED: EgressStatus.FAILED,
+}
+
 
 def convert_egress_info(
     lk_info: LiveKitEgressInfo,
@@ -30,35 +45,30 @@ def convert_egress_info(
     """
     status = convert_egress_status(lk_info.status)
 
-    # Convert timestamps from nanoseconds to datetime
+    # Convert timestamps from nanoseconds to datetime in integer arithmetic,
+    # which keeps full microsecond precision
     started_at = None
     if lk_info.started_at:
-        started_at = datetime.fromtimestamp(lk_info.started_at / 1e9, tz=UTC)
+        started_at = _EPOCH + timedelta(microseconds=lk_info.started_at // 1000)
 
     ended_at = None
     if lk_info.ended_at:
-        ended_at = datetime.fromtimestamp(lk_info.ended_at / 1e9, tz=UTC)
+        ended_at = _EPOCH + timedelta(microseconds=lk_info.ended_at // 1000)
 
-    # Extract playlist URL from segment outputs
+    # Single pass over segment outputs: first playlist URL, first duration
+    # and total size (None when there are no segment results at all)
     file_path = None
-    if lk_info.segment_results:
-        for segment in lk_info.segment_results:
-            if segment.playlist_location:
-                file_path = segment.playlist_location
-                break
-
-    # Calculate file size from segment results
-    file_size_bytes = None
-    if lk_info.segment_results:
-        file_size_bytes = sum(segment.size for segment in lk_info.segment_results if segment.size)
-
-    # Get duration from the egress info (convert to int)
     duration_seconds = None
-    if lk_info.segment_results:
-        for segment in lk_info.segment_results:
-            if segment.duration:
-                duration_seconds = int(segment.duration / 1e9)  # nanoseconds to seconds
-                break
+    file_size_bytes = None
+    segment_results = lk_info.segment_results
+    if segment_results:
+        file_size_bytes = 0
+        for segment in segment_results:
+            if file_path is None and segment.playlist_location:
+                file_path = segment.playlist_location
+            if duration_seconds is None and segment.duration:
+                duration_seconds = segment.duration // 1_000_000_000  # ns to seconds
+            file_size_bytes += segment.size
 
     return EgressInfo(
         egress_id=lk_info.egress_id,
@@ -82,13 +92,4 @@ def convert_egress_status(lk_status: LiveKitEgressStatus) -> EgressStatus:
     Returns:
         Domain EgressStatus enum value.
     """
-    status_map = {
-        LiveKitEgressStatus.EGRESS_STARTING: EgressStatus.STARTING,
-        LiveKitEgressStatus.EGRESS_ACTIVE: EgressStatus.ACTIVE,
-        LiveKitEgressStatus.EGRESS_ENDING: EgressStatus.ENDING,
-        LiveKitEgressStatus.EGRESS_COMPLETE: EgressStatus.COMPLETE,
-        LiveKitEgressStatus.EGRESS_FAILED: EgressStatus.FAILED,
-        LiveKitEgressStatus.EGRESS_ABORTED: EgressStatus.FAILED,
-        LiveKitEgressStatus.EGRESS_LIMIT_REACHED: EgressStatus.FAILED,
-    }
-    return status_map.get(lk_status, EgressStatus.STARTING)
+    return _LK_STATUS_MAP.get(lk_status, EgressStatus.STARTING)
@@ -7,7 +7,7 @@ from dataclasses import dataclass
 from dataclasses import field
 
 
-@dataclass
+@dataclass(slots=True)
 class Message:
     """A message in a conversation.
 
@@ -20,7 +20,7 @@ class Message:
     content: str
 
 
-@dataclass
+@dataclass(slots=True)
 class LLMResponse:
     """Response from LLM.
 
@@ -2,6 +2,9 @@
 
 from abc import ABC
 from abc import abstractmethod
+from collections.abc import Sequence
+from contextlib import AbstractAsyncContextManager
+from datetime import datetime
 from uuid import UUID
 
 from src.domain.entities import Recording
@@ -26,6 +29,18 @@ class RecordingRepositoryPort(ABC):
         """
         ...
 
+    @abstractmethod
+    async def save_many(self, recordings: Sequence[Recording]) -> None:
+        """Save or update several recordings in one write.
+
+        Args:
+            recordings: The recordings to save.
+
+        Raises:
+            RepositoryError: If the save operation fails.
+        """
+        ...
+
     @abstractmethod
     async def get_by_id(self, recording_id: UUID) -> Recording | None:
         """Retrieve a recording by ID.
@@ -42,11 +57,16 @@ class RecordingRepositoryPort(ABC):
         ...
 
     @abstractmethod
-    async def get_by_session_id(self, session_id: UUID) -> Recording | None:
+    async def get_by_session_id(
+        self,
+        session_id: UUID,
+        for_update: bool = False,
+    ) -> Recording | None:
         """Retrieve a recording by session ID.
 
         Args:
             session_id: The session ID to look up.
+            for_update: Lock the row until the current transaction ends.
 
         Returns:
             The recording if found, None otherwise.
@@ -57,11 +77,31 @@ class RecordingRepositoryPort(ABC):
         ...
 
     @abstractmethod
-    async def get_by_egress_id(self, egress_id: str) -> Recording | None:
+    async def exists_active(self, session_id: UUID) -> bool:
+        """Check whether a session has a recording that is not yet terminal.
+
+        Args:
+            session_id: The session ID to look up.
+
+        Returns:
+            True if a recording for the session is neither completed nor failed.
+
+        Raises:
+            RepositoryError: If the lookup fails.
+        """
+        ...
+
+    @abstractmethod
+    async def get_by_egress_id(
+        self,
+        egress_id: str,
+        for_update: bool = False,
+    ) -> Recording | None:
         """Retrieve a recording by egress ID.
 
         Args:
             egress_id: The LiveKit egress ID.
+            for_update: Lock the row until the current transaction ends.
 
         Returns:
             The recording if found, None otherwise.
@@ -98,12 +138,14 @@ class RecordingRepositoryPort(ABC):
         self,
         page: int = 1,
         page_size: int = 20,
+        status: RecordingStatus | None = None,
     ) -> tuple[list[Recording], int]:
         """List all recordings with pagination.
 
         Args:
             page: Page number (1-indexed).
             page_size: Number of items per page.
+            status: Optional status filter, applied to both the page and the total.
 
         Returns:
             Tuple of (recordings list, total count).
@@ -113,6 +155,33 @@ class RecordingRepositoryPort(ABC):
         """
         ...
 
+    @abstractmethod
+    async def list_after(
+        self,
+        limit: int,
+        cursor: tuple[datetime, UUID] | None = None,
+        status: RecordingStatus | None = None,
+    ) -> list[Recording]:
+        """List recordings by keyset, newest first.
+
+        Recordings are ordered by ``(created_at, id)`` descending, so a page
+        starts right after the last row of the previous one regardless of
+        how deep it is.
+
+        Args:
+            limit: Maximum number of recordings to return.
+            cursor: ``(created_at, id)`` of the last recording already seen,
+                or None to start from the newest.
+            status: Optional status filter.
+
+        Returns:
+            List of recordings following the cursor.
+
+        Raises:
+            RepositoryError: If the retrieval fails.
+        """
+        ...
+
     @abstractmethod
     async def count_by_status(self, status: RecordingStatus) -> int:
         """Count recordings by status.
@@ -127,3 +196,16 @@ class RecordingRepositoryPort(ABC):
             RepositoryError: If the count operation fails.
         """
         ...
+
+    @abstractmethod
+    def transaction(self) -> AbstractAsyncContextManager[None]:
+        """Group writes into a single transaction.
+
+        Writes made inside the block are committed together when it exits,
+        or rolled back if it raises. Outside a block each write commits on
+        its own.
+
+        Returns:
+            Async context manager delimiting the transaction.
+        """
+        ...
@@ -2,6 +2,9 @@
 
 from abc import ABC
 from abc import abstractmethod
+from collections.abc import Sequence
+from contextlib import AbstractAsyncContextManager
+from datetime import datetime
 from uuid import UUID
 
 from src.domain.entities import Message
@@ -68,6 +71,18 @@ class SessionRepositoryPort(ABC):
         """
         ...
 
+    @abstractmethod
+    async def save_messages(self, messages: Sequence[Message]) -> None:
+        """Save a batch of messages in a single write.
+
+        Args:
+            messages: The messages to save.
+
+        Raises:
+            RepositoryError: If the save operation fails.
+        """
+        ...
+
     @abstractmethod
     async def get_messages(self, session_id: UUID) -> list[Message]:
         """Retrieve all messages for a session.
@@ -82,3 +97,55 @@ class SessionRepositoryPort(ABC):
             RepositoryError: If the retrieval fails.
         """
         ...
+
+    @abstractmethod
+    async def get_messages_after(
+        self,
+        session_id: UUID,
+        limit: int,
+        cursor: tuple[datetime, UUID] | None = None,
+    ) -> list[Message]:
+        """Retrieve a page of a session's messages by keyset, oldest first.
+
+        Args:
+            session_id: The session ID.
+            limit: Maximum number of messages to return.
+            cursor: ``(created_at, id)`` of the last message already seen,
+                or None to start from the first.
+
+        Returns:
+            List of messages following the cursor.
+
+        Raises:
+            RepositoryError: If the retrieval fails.
+        """
+        ...
+
+    @abstractmethod
+    async def get_recent_messages(self, session_id: UUID, limit: int) -> list[Message]:
+        """Retrieve the latest messages of a session.
+
+        Args:
+            session_id: The session ID.
+            limit: Maximum number of messages to return.
+
+        Returns:
+            Up to ``limit`` most recent messages, ordered by creation time.
+
+        Raises:
+            RepositoryError: If the retrieval fails.
+        """
+        ...
+
+    @abstractmethod
+    def transaction(self) -> AbstractAsyncContextManager[None]:
+        """Group writes into a single transaction.
+
+        Writes made inside the block are committed together when it exits,
+        or rolled back if it raises. Outside a block each write commits on
+        its own.
+
+        Returns:
+            Async context manager delimiting the transaction.
+        """
+        ...
@@ -2,6 +2,7 @@
 
 from abc import ABC
 from abc import abstractmethod
+from collections.abc import Sequence
 
 from src.domain.value_objects import ObjectInfo
 
@@ -46,6 +47,28 @@ class StoragePort(ABC):
         """
         ...
 
+    @abstractmethod
+    async def generate_presigned_urls(
+        self,
+        bucket: str,
+        keys: Sequence[str],
+        expiry_seconds: int = 3600,
+    ) -> list[str]:
+        """Generate presigned URLs for several objects.
+
+        Args:
+            bucket: S3 bucket name.
+            keys: Object keys/paths.
+            expiry_seconds: URL expiry time in seconds.
+
+        Returns:
+            Presigned URL per key, in order.
+
+        Raises:
+            StorageError: If URL generation fails.
+        """
+        ...
+
     @abstractmethod
     async def get_object_info(self, bucket: str, key: str) -> ObjectInfo | None:
         """Get information about a stored object.
@@ -62,6 +85,28 @@ class StoragePort(ABC):
         """
         ...
 
+    @abstractmethod
+    async def get_many_object_info(
+        self,
+        bucket: str,
+        keys: Sequence[str],
+        concurrency: int = 16,
+    ) -> list[ObjectInfo | None]:
+        """Get information about several stored objects concurrently.
+
+        Args:
+            bucket: S3 bucket name.
+            keys: Object keys/paths.
+            concurrency: Maximum number of lookups in flight.
+
+        Returns:
+            Object information per key, in order; None for missing objects.
+
+        Raises:
+            StorageError: If any lookup fails.
+        """
+        ...
+
     @abstractmethod
     async def object_exists(self, bucket: str, key: str) -> bool:
         """Check if an object exists.
@@ -5,7 +5,7 @@ from abc import abstractmethod
 from dataclasses import dataclass
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TranscriptionResult:
     """Result of speech-to-text transcription.
 
@@ -6,17 +6,19 @@ from collections.abc import AsyncIterator
 from dataclasses import dataclass
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class AudioChunk:
     """A chunk of synthesized audio.
 
     Attributes:
-        data: Raw audio bytes.
+        data: Raw audio bytes. May be a view into a buffer owned by the
+            adapter, so consumers must not modify it and must copy it to
+            keep it beyond the current iteration.
         sample_rate: Audio sample rate in Hz.
         duration_ms: Chunk duration in milliseconds.
     """
 
-    data: bytes
+    data: bytes | memoryview
     sample_rate: int = 24000
     duration_ms: int | None = None
 
@@ -1,5 +1,9 @@
 """Recording service use case for orchestrating recording lifecycle."""
 
+import asyncio
+import logging
+from collections.abc import Sequence
+from datetime import datetime
 from uuid import UUID
 
 import structlog
@@ -15,6 +19,10 @@ from src.domain.entities import RecordingStatus
 
 logger = structlog.get_logger()
 
+# The stdlib logger that structlog's filter_by_level consults for this module;
+# checking it first skips building the arguments of disabled debug calls
+_level_logger = logging.getLogger(__name__)
+
 
 class RecordingServiceError(Exception):
     """Base exception for recording service errors."""
@@ -94,8 +102,7 @@ class RecordingService:
             RecordingServiceError: If starting the recording fails.
         """
         # Check for existing recording
-        existing = await self._recording_repo.get_by_session_id(session_id)
-        if existing and not existing.is_terminal:
+        if await self._recording_repo.exists_active(session_id):
             raise RecordingAlreadyExistsError(
                 f"Active recording already exists for session {session_id}"
             )
@@ -113,7 +120,7 @@ class RecordingService:
 
         logger.info(
             "starting_recording",
-            recording_id=str(recording.id),
+            recording_id=recording.id_str,
             session_id=str(session_id),
             room_name=room_name,
         )
@@ -138,7 +145,7 @@ class RecordingService:
 
             logger.info(
                 "recording_started",
-                recording_id=str(recording.id),
+                recording_id=recording.id_str,
                 egress_id=egress_info.egress_id,
             )
 
@@ -150,7 +157,7 @@ class RecordingService:
             await self._recording_repo.save(recording)
             logger.error(
                 "recording_start_failed",
-                recording_id=str(recording.id),
+                recording_id=recording.id_str,
                 error=str(e),
             )
             raise RecordingServiceError(f"Failed to start recording: {e}") from e
@@ -168,54 +175,76 @@ class RecordingService:
             RecordingNotFoundError: If no active recording found.
             RecordingServiceError: If stopping the recording fails.
         """
-        recording = await self._recording_repo.get_by_session_id(session_id)
-        if recording is None:
-            raise RecordingNotFoundError(f"No recording found for session {session_id}")
+        # Egress is stopped outside the row lock so a slow LiveKit call does
+        # not hold up egress webhooks; the state is re-checked under the lock
+        async with self._recording_repo.transaction():
+            recording = await self._recording_repo.get_by_session_id(session_id, for_update=True)
+            if recording is None:
+                raise RecordingNotFoundError(f"No recording found for session {session_id}")
+
+            if recording.is_terminal:
+                logger.warning(
+                    "recording_already_stopped",
+                    recording_id=recording.id_str,
+                    status=recording.status.value,
+                )
+                return recording
 
-        if recording.is_terminal:
-            logger.warning(
-                "recording_already_stopped",
-                recording_id=str(recording.id),
-                status=recording.status.value,
+            logger.info(
+                "stopping_recording",
+                recording_id=recording.id_str,
+                session_id=str(session_id),
             )
-            return recording
 
-        logger.info(
-            "stopping_recording",
-            recording_id=str(recording.id),
-            session_id=str(session_id),
-        )
-
-        try:
             # Handle STARTING state - egress never started, fail the recording
             if recording.status == RecordingStatus.STARTING:
                 recording.fail("Recording stopped before egress started")
                 await self._recording_repo.save(recording)
                 logger.info(
                     "recording_failed_before_start",
-                    recording_id=str(recording.id),
+                    recording_id=recording.id_str,
                 )
                 return recording
 
+        try:
             # Stop egress
             await self._egress.stop_egress(recording.egress_id)
 
-            # Transition to processing state
-            recording.start_processing()
-            await self._recording_repo.save(recording)
+            async with self._recording_repo.transaction():
+                current = await self._recording_repo.get_by_session_id(
+                    session_id,
+                    for_update=True,
+                )
+                if current is None or current.id != recording.id:
+                    raise RecordingNotFoundError(f"No recording found for session {session_id}")
+
+                # A webhook or a concurrent stop may have moved it on meanwhile
+                if current.status != RecordingStatus.ACTIVE:
+                    logger.warning(
+                        "recording_already_stopped",
+                        recording_id=current.id_str,
+                        status=current.status.value,
+                    )
+                    return current
+
+                # Transition to processing state
+                current.start_processing()
+                await self._recording_repo.save(current)
 
             logger.info(
                 "recording_stopped",
-                recording_id=str(recording.id),
-                status=recording.status.value,
+                recording_id=current.id_str,
+                status=current.status.value,
             )
 
-            return recording
+            return current
 
+        except RecordingNotFoundError:
+            raise
         except Exception as e:
             logger.error(
                 "recording_stop_failed",
-                recording_id=str(recording.id),
+                recording_id=recording.id_str,
                 error=str(e),
             )
             raise RecordingServiceError(f"Failed to stop recording: {e}") from e
@@ -229,17 +258,71 @@ class RecordingService:
         Returns:
             Updated Recording entity, or None if not found.
         """
-        recording = await self._recording_repo.get_by_egress_id(egress_info.egress_id)
-        if recording is None:
-            logger.warning(
-                "recording_not_found_for_egress",
-                egress_id=egress_info.egress_id,
+        async with self._recording_repo.transaction():
+            recording = await self._recording_repo.get_by_egress_id(
+                egress_info.egress_id,
+                for_update=True,
             )
-            return None
+            if recording is None:
+                logger.warning(
+                    "recording_not_found_for_egress",
+                    egress_id=egress_info.egress_id,
+                )
+                return None
+
+            if await self._apply_egress_event(recording, egress_info):
+                await self._recording_repo.save(recording)
+            return recording
+
+    async def handle_egress_events(self, events: Sequence[EgressInfo]) -> list[Recording | None]:
+        """Handle a batch of egress webhook events with a single write.
+
+        Events are applied in order. A recording touched by several events is
+        loaded once and saved once, in its final state.
+
+        Args:
+            events: Information from egress events, in arrival order.
+
+        Returns:
+            Updated Recording entity per event, or None where not found.
+        """
+        recordings: dict[str, Recording | None] = {}
+        changed: dict[UUID, Recording] = {}
+        results: list[Recording | None] = []
+
+        async with self._recording_repo.transaction():
+            for egress_info in events:
+                egress_id = egress_info.egress_id
+                if egress_id not in recordings:
+                    recordings[egress_id] = await self._recording_repo.get_by_egress_id(
+                        egress_id,
+                        for_update=True,
+                    )
+                recording = recordings[egress_id]
+
+                if recording is None:
+                    logger.warning("recording_not_found_for_egress", egress_id=egress_id)
+                elif await self._apply_egress_event(recording, egress_info):
+                    changed[recording.id] = recording
+                results.append(recording)
+
+            if changed:
+                await self._recording_repo.save_many(list(changed.values()))
+        return results
+
+    async def _apply_egress_event(self, recording: Recording, egress_info: EgressInfo) -> bool:
+        """Apply an egress event to a recording without saving it.
 
+        Args:
+            recording: The recording the egress belongs to.
+            egress_info: Information from egress event.
+
+        Returns:
+            True if the recording changed and needs saving.
+        """
         logger.info(
             "handling_egress_event",
-            recording_id=str(recording.id),
+            recording_id=recording.id_str,
             egress_id=egress_info.egress_id,
             egress_status=egress_info.status.value,
         )
@@ -249,41 +332,41 @@ class RecordingService:
                 # Egress has started
                 if recording.status == RecordingStatus.STARTING:
                     recording.activate()
-                    await self._recording_repo.save(recording)
+                    return True
 
             elif egress_info.status == EgressStatus.COMPLETE:
                 # Egress completed - get file info and complete recording
                 await self._complete_recording(recording, egress_info)
+                return True
 
             elif egress_info.status == EgressStatus.FAILED:
                 # Egress failed
                 error_msg = egress_info.error or "Unknown egress error"
                 recording.fail(error_msg)
-                await self._recording_repo.save(recording)
                 logger.error(
                     "egress_failed",
-                    recording_id=str(recording.id),
+                    recording_id=recording.id_str,
                     error=error_msg,
                 )
+                return True
 
-            return recording
+            return False
 
         except Exception as e:
             logger.error(
                 "egress_event_handling_failed",
-                recording_id=str(recording.id),
+                recording_id=recording.id_str,
                 error=str(e),
             )
             recording.fail(str(e))
-            await self._recording_repo.save(recording)
-            return recording
+            return True
 
     async def _complete_recording(
         self,
         recording: Recording,
         egress_info: EgressInfo,
     ) -> None:
-        """Complete a recording after egress finishes.
+        """Complete a recording after egress finishes, without saving it.
 
         Args:
             recording: The recording to complete.
@@ -293,9 +376,8 @@ class RecordingService:
         if recording.status == RecordingStatus.ACTIVE:
             recording.start_processing()
 
-        # Get playlist URL
         playlist_key = f"{recording.storage_path}/index.m3u8"
-        playlist_url = await self._storage.generate_presigned_url(
+        presign = self._storage.generate_presigned_url(
             bucket=recording.storage_bucket,
             key=playlist_key,
             expiry_seconds=self._presigned_url_expiry,
@@ -306,23 +388,28 @@ class RecordingService:
         file_size = egress_info.file_size_bytes
 
         if file_size is None:
-            # Fallback: get file size from storage if not in egress_info
-            obj_info = await self._storage.get_object_info(
-                bucket=recording.storage_bucket,
-                key=playlist_key,
+            # Fallback: get file size from storage if not in egress_info,
+            # concurrently with the playlist URL
+            playlist_url, obj_info = await asyncio.gather(
+                presign,
+                self._storage.get_object_info(
+                    bucket=recording.storage_bucket,
+                    key=playlist_key,
+                ),
             )
             file_size = obj_info.size_bytes if obj_info else 0
+        else:
+            playlist_url = await presign
 
         recording.complete(
             playlist_url=playlist_url,
             duration_seconds=duration_seconds,
             file_size_bytes=file_size,
         )
-        await self._recording_repo.save(recording)
 
         logger.info(
             "recording_completed",
-            recording_id=str(recording.id),
+            recording_id=recording.id_str,
             playlist_url=playlist_url,
             duration_seconds=duration_seconds,
             file_size_bytes=file_size,
@@ -364,11 +451,12 @@ class RecordingService:
             expiry_seconds=expiry,
         )
 
-        logger.debug(
-            "playback_url_generated",
-            recording_id=str(recording_id),
-            expiry_seconds=expiry,
-        )
+        if _level_logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "playback_url_generated",
+                recording_id=str(recording_id),
+                expiry_seconds=expiry,
+            )
 
         return url
 
@@ -410,14 +498,31 @@ class RecordingService:
         Returns:
             Tuple of (recordings list, total count).
         """
-        if status is None:
-            return await self._recording_repo.list_all(page=page, page_size=page_size)
-        else:
-            offset = (page - 1) * page_size
-            recordings = await self._recording_repo.list_by_status(
-                status=status,
-                limit=page_size,
-                offset=offset,
-            )
-            total = await self._recording_repo.count_by_status(status)
-            return recordings, total
+        return await self._recording_repo.list_all(page=page, page_size=page_size, status=status)
+
+    async def list_recordings_after(
+        self,
+        cursor: tuple[datetime, UUID] | None,
+        page_size: int = 20,
+        status: RecordingStatus | None = None,
+    ) -> tuple[list[Recording], bool]:
+        """List recordings with keyset pagination and optional status filter.
+
+        No total is computed, so the cost does not grow with the table size.
+
+        Args:
+            cursor: ``(created_at, id)`` of the last recording already seen,
+                or None to start from the newest.
+            page_size: Number of items per page.
+            status: Optional status filter.
+
+        Returns:
+            Tuple of (recordings list, whether more recordings follow).
+        """
+        # One extra row tells whether another page exists
+        recordings = await self._recording_repo.list_after(
+            page_size + 1,
+            cursor=cursor,
+            status=status,
+        )
+        return recordings[:page_size], len(recordings) > page_size
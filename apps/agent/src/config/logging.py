@@ -7,40 +7,85 @@ from __future__ import annotations
 
 import logging
 import sys
+from functools import lru_cache
 from typing import TYPE_CHECKING
 from typing import Any
 
+import orjson
 import structlog
 
 if TYPE_CHECKING:
     from structlog.types import Processor
 
 
-def setup_logging(log_level: str = "INFO", json_logs: bool = True) -> None:
-    """Configure structured logging.
+def _orjson_dumps(obj: Any, **kwargs: Any) -> str:
+    """Serialize a log event with orjson for ``JSONRenderer``.
 
     Args:
-        log_level: Logging level (DEBUG, INFO, WARNING, ERROR).
-        json_logs: If True, output JSON formatted logs.
+        obj: The event dict to serialize.
+        **kwargs: Keyword arguments from the renderer (``default``).
+
+    Returns:
+        The JSON document as a string, as the stdlib formatter expects.
     """
-    shared_processors: list[Processor] = [
-        structlog.contextvars.merge_contextvars,
-        structlog.stdlib.add_log_level,
-        structlog.stdlib.add_logger_name,
-        structlog.stdlib.PositionalArgumentsFormatter(),
-        structlog.processors.TimeStamper(fmt="iso"),
-        structlog.processors.StackInfoRenderer(),
-        structlog.processors.UnicodeDecoder(),
-    ]
+    return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS, **kwargs).decode()
+
+
+# Shared by structlog events and records from stdlib loggers
+_SHARED_PROCESSORS: tuple[Processor, ...] = (
+    structlog.contextvars.merge_contextvars,
+    structlog.stdlib.add_log_level,
+    structlog.stdlib.add_logger_name,
+    structlog.stdlib.PositionalArgumentsFormatter(),
+    structlog.processors.TimeStamper(fmt="iso"),
+    structlog.processors.StackInfoRenderer(),
+    structlog.processors.UnicodeDecoder(),
+)
+
+# Handler installed on the root logger by setup_logging, replaced on reconfiguration
+_handler: logging.Handler | None = None
+
 
+@lru_cache(maxsize=2)
+def _make_formatter(json_logs: bool) -> structlog.stdlib.ProcessorFormatter:
+    """Build the formatter rendering every log record.
+
+    Args:
+        json_logs: If True, render JSON; otherwise colored console output.
+
+    Returns:
+        The formatter, shared across calls with the same arguments.
+    """
     if json_logs:
-        renderer: Processor = structlog.processors.JSONRenderer()
+        renderer: Processor = structlog.processors.JSONRenderer(serializer=_orjson_dumps)
     else:
         renderer = structlog.dev.ConsoleRenderer(colors=True)
 
+    return structlog.stdlib.ProcessorFormatter(
+        foreign_pre_chain=list(_SHARED_PROCESSORS),
+        processors=[
+            structlog.stdlib.ProcessorFormatter.remove_processors_meta,
+            renderer,
+        ],
+    )
+
+
+def setup_logging(log_level: str = "INFO", json_logs: bool = True) -> None:
+    """Configure structured logging.
+
+    Safe to call again: the handler installed by a previous call is replaced.
+
+    Args:
+        log_level: Logging level (DEBUG, INFO, WARNING, ERROR).
+        json_logs: If True, output JSON formatted logs.
+    """
+    global _handler  # noqa: PLW0603
+
     structlog.configure(
         processors=[
-            *shared_processors,
+            # Drop disabled levels before any other processor runs
+            structlog.stdlib.filter_by_level,
+            *_SHARED_PROCESSORS,
             structlog.stdlib.ProcessorFormatter.wrap_for_formatter,
         ],
         logger_factory=structlog.stdlib.LoggerFactory(),
@@ -48,20 +93,15 @@ def setup_logging(log_level: str = "INFO", json_logs: bool = True) -> None:
         cache_logger_on_first_use=True,
     )
 
-    formatter = structlog.stdlib.ProcessorFormatter(
-        foreign_pre_chain=shared_processors,
-        processors=[
-            structlog.stdlib.ProcessorFormatter.remove_processors_meta,
-            renderer,
-        ],
-    )
-
     handler = logging.StreamHandler(sys.stdout)
-    handler.setFormatter(formatter)
+    handler.setFormatter(_make_formatter(json_logs))
 
     root_logger = logging.getLogger()
+    if _handler is not None:
+        root_logger.removeHandler(_handler)
     root_logger.addHandler(handler)
     root_logger.setLevel(log_level.upper())
+    _handler = handler
 
     # Silence noisy loggers
     logging.getLogger("httpx").setLevel(logging.WARNING)
@@ -21,25 +21,38 @@ class Settings(BaseSettings):
         livekit_url: LiveKit server URL.
         livekit_api_key: LiveKit API key.
         livekit_api_secret: LiveKit API secret.
+        livekit_api_max_connections: Concurrent connections to the LiveKit server API.
         aws_region: AWS region for AI services.
         stt_language: Language for speech-to-text (Amazon Transcribe).
         llm_model: Model ID for LLM (Amazon Bedrock).
+        llm_cache_system_prompt: Cache the system prompt with Bedrock prompt caching.
         tts_voice: Voice name for text-to-speech (Amazon Polly).
         tts_language: Language for text-to-speech.
         agent_instructions: System prompt for the AI agent.
         agent_greeting_prompt: Prompt for generating agent greeting.
         max_response_tokens: Maximum tokens for LLM response.
+        preemptive_generation: Start the LLM reply before the user's turn is confirmed.
+        min_endpointing_delay: Seconds to wait after a likely end of turn.
+        max_endpointing_delay: Seconds to wait when the user may keep speaking.
         log_level: Logging level.
         database_host: PostgreSQL host.
         database_port: PostgreSQL port.
         database_user: PostgreSQL user.
         database_password: PostgreSQL password.
         database_name: PostgreSQL database name.
+        database_pool_size: Connections kept open in the pool.
+        database_max_overflow: Extra connections allowed beyond the pool size.
+        database_pool_recycle: Seconds after which pooled connections are replaced.
+        database_pool_pre_ping: Check connections for liveness on checkout.
+        database_statement_cache_size: Prepared statements cached per connection.
+        message_batch_size: Maximum conversation messages persisted per write.
+        message_flush_interval: Seconds a queued message may wait before a write.
         s3_endpoint_url: S3/MinIO endpoint URL (None for AWS S3).
         s3_access_key: S3 access key.
         s3_secret_key: S3 secret key.
         s3_bucket_recordings: S3 bucket for recordings.
         s3_region: S3 region.
+        s3_max_pool_connections: Connections kept in the S3 client's pool.
         egress_output_width: Egress video output width.
         egress_output_height: Egress video output height.
         egress_segment_duration: HLS segment duration in seconds.
@@ -47,6 +60,9 @@ class Settings(BaseSettings):
         presigned_url_expiry_seconds: Presigned URL expiry time in seconds.
         http_host: HTTP server host.
         http_port: HTTP server port.
+        http_workers: Number of HTTP server worker processes; the in-process
+            recording lookup cache is disabled when above 1.
+        http_keepalive_timeout: Seconds to keep idle HTTP connections open.
     """
 
     model_config = SettingsConfigDict(
@@ -64,6 +80,10 @@ class Settings(BaseSettings):
     livekit_url: str = Field(default="ws://localhost:7880")
     livekit_api_key: str = Field(default="devkey")
     livekit_api_secret: SecretStr = Field(default_factory=lambda: SecretStr("secret"))
+    livekit_api_max_connections: int = Field(
+        default=20,
+        description="Concurrent egress API calls before further calls queue for a connection",
+    )
 
     # AWS Configuration
     aws_region: str = Field(default="ap-northeast-1")
@@ -77,6 +97,10 @@ class Settings(BaseSettings):
         default="jp.anthropic.claude-sonnet-4-5-20250929-v1:0",
         description="Model ID for Amazon Bedrock LLM",
     )
+    llm_cache_system_prompt: bool = Field(
+        default=True,
+        description="Add a Bedrock cache point after the system prompt",
+    )
     tts_voice: str = Field(
         default="Kazuha",
         description="Voice name for Amazon Polly TTS (Japanese neural voice)",
@@ -104,6 +128,18 @@ class Settings(BaseSettings):
         default=256,
         description="Maximum tokens for LLM response",
     )
+    preemptive_generation: bool = Field(
+        default=True,
+        description="Generate the reply speculatively while the turn is being finalized",
+    )
+    min_endpointing_delay: float = Field(
+        default=0.05,
+        description="Seconds to wait before ending the user's turn",
+    )
+    max_endpointing_delay: float = Field(
+        default=3.0,
+        description="Upper bound on the end-of-turn wait when the turn detector is unsure",
+    )
 
     # Database
     database_host: str = Field(default="localhost")
@@ -111,6 +147,25 @@ class Settings(BaseSettings):
     database_user: str = Field(default="echosphere")
     database_password: SecretStr = Field(default_factory=lambda: SecretStr("echosphere_dev"))
     database_name: str = Field(default="echosphere")
+    database_pool_size: int = Field(default=20)
+    database_max_overflow: int = Field(default=40)
+    database_pool_recycle: int = Field(
+        default=1800,
+        description="Replace pooled connections older than this many seconds",
+    )
+    database_pool_pre_ping: bool = Field(default=True)
+    database_statement_cache_size: int = Field(
+        default=500,
+        description="Prepared statements cached per connection (0 disables, e.g. for PgBouncer)",
+    )
+    message_batch_size: int = Field(
+        default=50,
+        description="Maximum conversation messages written in one round-trip",
+    )
+    message_flush_interval: float = Field(
+        default=0.1,
+        description="Seconds to collect further messages before writing a batch",
+    )
 
     # S3/MinIO Storage
     s3_endpoint_url: str | None = Field(
@@ -121,6 +176,10 @@ class Settings(BaseSettings):
     s3_secret_key: SecretStr = Field(default_factory=lambda: SecretStr("minioadmin"))
     s3_bucket_recordings: str = Field(default="echosphere-recordings")
     s3_region: str = Field(default="us-east-1")
+    s3_max_pool_connections: int = Field(
+        default=64,
+        description="Concurrent S3 requests before the client waits for a free connection",
+    )
 
     # Egress Configuration
     egress_output_width: int = Field(default=1280)
@@ -134,6 +193,14 @@ class Settings(BaseSettings):
     # HTTP Server
     http_host: str = Field(default="0.0.0.0")
     http_port: int = Field(default=8080)
+    http_workers: int = Field(
+        default=1,
+        description="Worker processes; above 1 disables the in-process recording cache",
+    )
+    http_keepalive_timeout: int = Field(
+        default=75,
+        description="Idle keep-alive timeout; keep above the upstream proxy's (e.g. ALB 60s)",
+    )
 
     # Logging
     log_level: str = Field(default="INFO")
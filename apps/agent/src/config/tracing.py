@@ -35,6 +35,8 @@ def setup_tracing(
 
     This function sets up tracing that integrates with LiveKit's internal
     tracer, enabling automatic spans for STT, LLM, and TTS operations.
+    Calling it again in the same process (e.g. when the entry module is
+    re-imported by a worker process) returns the existing provider.
 
     Args:
         settings: Application settings containing OTEL configuration.
@@ -45,6 +47,9 @@ def setup_tracing(
     """
     global _tracer_provider  # noqa: PLW0603
 
+    if _tracer_provider is not None:
+        return _tracer_provider
+
     if not settings.otel_enabled:
         logger.info("OpenTelemetry tracing is disabled")
         return None
@@ -5,6 +5,7 @@ from dataclasses import field
 from datetime import UTC
 from datetime import datetime
 from enum import StrEnum
+from functools import cached_property
 from uuid import UUID
 from uuid import uuid4
 
@@ -77,6 +78,15 @@ class Recording:
     started_at: datetime | None = None
     ended_at: datetime | None = None
 
+    @cached_property
+    def id_str(self) -> str:
+        """Recording ID as a string, formatted once for repeated logging.
+
+        Returns:
+            The canonical hyphenated form of ``id``.
+        """
+        return str(self.id)
+
     def _can_transition_to(self, new_status: RecordingStatus) -> bool:
         """Check if transition to new status is valid.
 
@@ -23,7 +23,7 @@ class EgressStatus(StrEnum):
     FAILED = "failed"  # Error occurred
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class EgressConfig:
     """Configuration for starting an egress recording.
 
@@ -44,7 +44,7 @@ class EgressConfig:
     segment_duration: int = 4
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class EgressInfo:
     """Information about an egress recording.
 
@@ -0,0 +1,69 @@
+"""Tests for EgressEventBatcher."""
+
+import asyncio
+from unittest.mock import AsyncMock
+
+import pytest
+
+from src.adapters.inbound.egress_event_batcher import EgressEventBatcher
+from src.domain.value_objects import EgressInfo
+from tests.factories import EgressInfoFactory
+
+
+class TestEgressEventBatcher:
+    """Tests for batching and shutdown behavior."""
+
+    @pytest.mark.asyncio
+    async def test_burst_is_processed_as_one_batch(self) -> None:
+        """Events submitted together should reach the processor in one call."""
+        process_batch = AsyncMock()
+        batcher = EgressEventBatcher(process_batch, max_delay=0.05)
+        batcher.start()
+        events = [EgressInfoFactory.build_complete() for _ in range(3)]
+
+        for event in events:
+            assert batcher.submit(event)
+        await batcher.close()
+
+        process_batch.assert_awaited_once_with(events)
+
+    @pytest.mark.asyncio
+    async def test_batches_are_capped_at_max_size(self) -> None:
+        """A burst larger than max_batch_size should be split."""
+        batches: list[list[EgressInfo]] = []
+
+        async def record(batch: list[EgressInfo]) -> None:
+            batches.append(batch)
+
+        batcher = EgressEventBatcher(record, max_batch_size=2, max_delay=0.05)
+        batcher.start()
+        for _ in range(5):
+            batcher.submit(EgressInfoFactory.build_active())
+        await batcher.close()
+
+        assert [len(b) for b in batches] == [2, 2, 1]
+
+    @pytest.mark.asyncio
+    async def test_submit_rejected_when_not_started_or_full(self) -> None:
+        """submit should report events it cannot queue."""
+        batcher = EgressEventBatcher(AsyncMock(), max_queue_size=1)
+        assert not batcher.submit(EgressInfoFactory.build_active())
+
+        batcher.start()
+        assert batcher.submit(EgressInfoFactory.build_active())
+        assert not batcher.submit(EgressInfoFactory.build_active())
+        await batcher.close()
+
+    @pytest.mark.asyncio
+    async def test_processor_failure_does_not_stop_batcher(self) -> None:
+        """A failing batch should be logged and later batches still processed."""
+        process_batch = AsyncMock(side_effect=[Exception("DB down"), None])
+        batcher = EgressEventBatcher(process_batch, max_delay=0.01)
+        batcher.start()
+
+        batcher.submit(EgressInfoFactory.build_failed())
+        await asyncio.sleep(0.05)
+        batcher.submit(EgressInfoFactory.build_complete())
+        await batcher.close()
+
+        assert process_batch.await_count == 2
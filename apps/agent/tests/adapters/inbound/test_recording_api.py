@@ -123,6 +123,43 @@ class TestListRecordings:
         assert len(data["items"]) == 2
         assert data["total_pages"] == 3
 
+    @pytest.mark.asyncio
+    async def test_list_recordings_cursor_pagination(
+        self,
+        test_client: AsyncClient,
+        recording_repository: PostgresRecordingRepository,
+    ) -> None:
+        """Following next_cursor should walk all recordings without repeats."""
+        for _ in range(5):
+            await recording_repository.save(RecordingFactory.build_completed())
+
+        response = await test_client.get("/api/v1/recordings?page_size=2")
+        data = response.json()
+        seen = [item["id"] for item in data["items"]]
+        assert data["has_more"] is True
+
+        while data["has_more"]:
+            response = await test_client.get(
+                "/api/v1/recordings",
+                params={"page_size": 2, "cursor": data["next_cursor"]},
+            )
+            assert response.status_code == 200
+            data = response.json()
+            assert data["total"] is None
+            seen.extend(item["id"] for item in data["items"])
+
+        assert len(seen) == 5
+        assert len(set(seen)) == 5
+        assert data["next_cursor"] is None
+
+    @pytest.mark.asyncio
+    async def test_list_recordings_invalid_cursor(self, test_client: AsyncClient) -> None:
+        """A malformed cursor should return 400."""
+        response = await test_client.get("/api/v1/recordings?cursor=not-a-cursor")
+
+        assert response.status_code == 400
+        assert response.json()["detail"] == "Invalid cursor"
+
 
 class TestGetRecording:
     """Tests for GET /api/v1/recordings/{recording_id} endpoint."""
@@ -14,6 +14,7 @@ from livekit.protocol.egress import EgressInfo as LiveKitEgressInfo
 from livekit.protocol.egress import EgressStatus as LiveKitEgressStatus
 from livekit.protocol.webhook import WebhookEvent
 
+from src.adapters.inbound.egress_event_batcher import EgressEventBatcher
 from src.adapters.inbound.webhook_handler import WebhookHandler
 from src.adapters.inbound.webhook_handler import create_webhook_receiver
 from src.application.use_cases import RecordingService
@@ -164,6 +165,72 @@ class TestWebhookHandler:
         assert result == {"status": "ok"}
         mock_recording_service.handle_egress_event.assert_not_called()
 
+    @pytest.mark.asyncio
+    async def test_handle_webhook_bytes_body(
+        self,
+        webhook_handler: WebhookHandler,
+        mock_webhook_receiver: MagicMock,
+        mock_recording_service: AsyncMock,
+    ) -> None:
+        """Raw bytes body should be decoded before verification."""
+        mock_webhook_receiver.receive.return_value = self._create_mock_webhook_event("room_started")
+
+        result = await webhook_handler.handle_webhook(
+            body=b'{"event": "room_started"}',
+            auth_token="test-token",
+            recording_service=mock_recording_service,
+        )
+
+        assert result == {"status": "ok"}
+        mock_webhook_receiver.receive.assert_called_once_with(
+            '{"event": "room_started"}', "test-token"
+        )
+
+    @pytest.mark.asyncio
+    async def test_handle_webhook_queues_egress_event(
+        self,
+        mock_webhook_receiver: MagicMock,
+        mock_recording_service: AsyncMock,
+    ) -> None:
+        """With a batcher, egress events are queued instead of applied inline."""
+        batcher = MagicMock(spec=EgressEventBatcher)
+        batcher.submit.return_value = True
+        handler = WebhookHandler(mock_webhook_receiver, event_batcher=batcher)
+        mock_webhook_receiver.receive.return_value = self._create_mock_webhook_event(
+            "egress_started"
+        )
+
+        result = await handler.handle_webhook(
+            body="{}",
+            auth_token="test-token",
+            recording_service=mock_recording_service,
+        )
+
+        assert result == {"status": "ok"}
+        batcher.submit.assert_called_once()
+        assert batcher.submit.call_args.args[0].egress_id == "egress-123"
+        mock_recording_service.handle_egress_event.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_handle_webhook_applies_inline_when_queue_rejects(
+        self,
+        mock_webhook_receiver: MagicMock,
+        mock_recording_service: AsyncMock,
+    ) -> None:
+        """Events the batcher cannot take are applied within the request."""
+        batcher = MagicMock(spec=EgressEventBatcher)
+        batcher.submit.return_value = False
+        handler = WebhookHandler(mock_webhook_receiver, event_batcher=batcher)
+        mock_webhook_receiver.receive.return_value = self._create_mock_webhook_event("egress_ended")
+
+        await handler.handle_webhook(
+            body="{}",
+            auth_token="test-token",
+            recording_service=mock_recording_service,
+        )
+
+        mock_recording_service.handle_egress_event.assert_called_once()
+
     @pytest.mark.asyncio
     async def test_handle_webhook_verification_failure(
         self,
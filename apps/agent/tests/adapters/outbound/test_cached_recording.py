@@ -0,0 +1,162 @@
+"""Unit tests for CachedRecordingRepository."""
+
+from unittest.mock import AsyncMock
+from unittest.mock import patch
+from uuid import uuid4
+
+import pytest
+
+from src.adapters.outbound.cached_recording import CachedRecordingRepository
+from src.adapters.outbound.cached_recording import RecordingCache
+from src.application.ports import RecordingRepositoryPort
+from src.domain.entities import RecordingStatus
+from tests.factories import RecordingFactory
+
+
+@pytest.fixture
+def inner() -> AsyncMock:
+    """Create a mock underlying repository."""
+    return AsyncMock(spec=RecordingRepositoryPort)
+
+
+@pytest.fixture
+def cache() -> RecordingCache:
+    """Create a recording cache."""
+    return RecordingCache(maxsize=2, ttl_seconds=5.0)
+
+
+@pytest.fixture
+def repo(inner: AsyncMock, cache: RecordingCache) -> CachedRecordingRepository:
+    """Create a caching repository around the mock."""
+    return CachedRecordingRepository(inner, cache)
+
+
+class TestGetBySessionId:
+    """Tests for cached session lookups."""
+
+    async def test_second_lookup_is_served_from_cache(
+        self,
+        repo: CachedRecordingRepository,
+        inner: AsyncMock,
+    ) -> None:
+        """Repeated lookups should hit the underlying repository once."""
+        recording = RecordingFactory.build()
+        inner.get_by_session_id.return_value = recording
+
+        first = await repo.get_by_session_id(recording.session_id)
+        second = await repo.get_by_session_id(recording.session_id)
+
+        assert first is recording
+        assert second == recording
+        inner.get_by_session_id.assert_awaited_once_with(recording.session_id)
+
+    async def test_cached_recording_is_a_copy(
+        self,
+        repo: CachedRecordingRepository,
+        inner: AsyncMock,
+    ) -> None:
+        """Mutating a returned recording should not change the cached entry."""
+        recording = RecordingFactory.build_starting()
+        inner.get_by_session_id.return_value = recording
+
+        await repo.get_by_session_id(recording.session_id)
+        cached = await repo.get_by_session_id(recording.session_id)
+        assert cached is not None
+        cached.activate()
+
+        again = await repo.get_by_session_id(recording.session_id)
+        assert again is not None
+        assert again.status == RecordingStatus.STARTING
+
+    async def test_missing_recording_is_not_cached(
+        self,
+        repo: CachedRecordingRepository,
+        inner: AsyncMock,
+    ) -> None:
+        """A lookup that finds nothing should be retried next time."""
+        inner.get_by_session_id.return_value = None
+        session_id = uuid4()
+
+        assert await repo.get_by_session_id(session_id) is None
+        assert await repo.get_by_session_id(session_id) is None
+        assert inner.get_by_session_id.await_count == 2
+
+    async def test_expired_entry_is_refetched(
+        self,
+        repo: CachedRecordingRepository,
+        inner: AsyncMock,
+    ) -> None:
+        """Entries older than the TTL should be reloaded."""
+        recording = RecordingFactory.build()
+        inner.get_by_session_id.return_value = recording
+
+        with patch("src.adapters.outbound.cached_recording.time.monotonic") as monotonic:
+            monotonic.return_value = 100.0
+            await repo.get_by_session_id(recording.session_id)
+            monotonic.return_value = 106.0
+            await repo.get_by_session_id(recording.session_id)
+
+        assert inner.get_by_session_id.await_count == 2
+
+    async def test_save_invalidates_session_entry(
+        self,
+        repo: CachedRecordingRepository,
+        inner: AsyncMock,
+    ) -> None:
+        """Saving a recording should drop its session's cached entry."""
+        recording = RecordingFactory.build()
+        inner.get_by_session_id.return_value = recording
+
+        await repo.get_by_session_id(recording.session_id)
+        await repo.save(recording)
+        await repo.get_by_session_id(recording.session_id)
+
+        inner.save.assert_awaited_once_with(recording)
+        assert inner.get_by_session_id.await_count == 2
+
+    async def test_save_in_transaction_invalidates_again_on_exit(
+        self,
+        repo: CachedRecordingRepository,
+        inner: AsyncMock,
+    ) -> None:
+        """A read cached before commit should be dropped when the transaction ends."""
+        recording = RecordingFactory.build()
+        inner.get_by_session_id.return_value = recording
+
+        async with repo.transaction():
+            await repo.save(recording)
+            # Another request reads the pre-commit row in the meantime
+            await repo.get_by_session_id(recording.session_id)
+        await repo.get_by_session_id(recording.session_id)
+
+        inner.transaction.assert_called_once_with()
+        assert inner.get_by_session_id.await_count == 2
+
+    async def test_locking_lookup_bypasses_cache(
+        self,
+        repo: CachedRecordingRepository,
+        inner: AsyncMock,
+    ) -> None:
+        """A locking lookup should always read from the underlying repository."""
+        recording = RecordingFactory.build()
+        inner.get_by_session_id.return_value = recording
+
+        await repo.get_by_session_id(recording.session_id)
+        await repo.get_by_session_id(recording.session_id, for_update=True)
+
+        inner.get_by_session_id.assert_awaited_with(recording.session_id, for_update=True)
+        assert inner.get_by_session_id.await_count == 2
+
+
+class TestRecordingCache:
+    """Tests for RecordingCache eviction."""
+
+    def test_evicts_oldest_entry_when_full(self, cache: RecordingCache) -> None:
+        """The oldest session should be evicted once maxsize is reached."""
+        recordings = [RecordingFactory.build() for _ in range(3)]
+        for recording in recordings:
+            cache.put(recording.session_id, recording)
+
+        assert cache.get(recordings[0].session_id) is None
+        assert cache.get(recordings[1].session_id) == recordings[1]
+        assert cache.get(recordings[2].session_id) == recordings[2]
@@ -1,10 +1,13 @@
 """Unit tests for LiveKitEgressAdapter."""
 
+import asyncio
 from unittest.mock import AsyncMock
 from unittest.mock import MagicMock
 from unittest.mock import patch
 
 import pytest
+from livekit.api.twirp_client import TwirpError
+from livekit.api.twirp_client import TwirpErrorCode
 from livekit.protocol.egress import EgressStatus as LKStatus
 
 from src.adapters.outbound.livekit_egress import LiveKitEgressAdapter
@@ -24,6 +27,7 @@ def mock_settings() -> Settings:
     settings.livekit_api_key = "devkey"
     settings.livekit_api_secret = MagicMock()
     settings.livekit_api_secret.get_secret_value.return_value = "secret"
+    settings.livekit_api_max_connections = 20
     settings.s3_endpoint_url = "http://localhost:9000"
     settings.s3_access_key = "minioadmin"
     settings.s3_secret_key = MagicMock()
@@ -128,6 +132,20 @@ class TestStopEgress:
             with pytest.raises(EgressNotFoundError, match="not found"):
                 await adapter.stop_egress("missing-egress")
 
+    async def test_raises_not_found_error_for_twirp_code(
+        self, adapter: LiveKitEgressAdapter
+    ) -> None:
+        """Should raise EgressNotFoundError when the API returns a not_found code."""
+        with patch.object(adapter, "_get_api") as mock_get_api:
+            mock_api = AsyncMock()
+            mock_api.egress.stop_egress.side_effect = TwirpError(
+                TwirpErrorCode.NOT_FOUND, "no such egress"
+            )
+            mock_get_api.return_value = mock_api
+
+            with pytest.raises(EgressNotFoundError):
+                await adapter.stop_egress("missing-egress")
+
 
 class TestGetEgressInfo:
     """Tests for get_egress_info method."""
@@ -170,6 +188,75 @@ class TestGetEgressInfo:
             result = await adapter.get_egress_info("missing-egress")
             assert result is None
 
+    async def test_reuses_recent_lookup(self, adapter: LiveKitEgressAdapter) -> None:
+        """Should serve a repeated lookup from the cache."""
+        mock_egress_info = MagicMock()
+        mock_egress_info.egress_id = "egress-123"
+        mock_egress_info.room_name = "test-room"
+        mock_egress_info.status = 1  # EGRESS_ACTIVE
+        mock_egress_info.started_at = 1000000000000000000
+        mock_egress_info.ended_at = 0
+        mock_egress_info.error = ""
+        mock_egress_info.segment_results = []
+
+        mock_response = MagicMock()
+        mock_response.items = [mock_egress_info]
+
+        with patch.object(adapter, "_get_api") as mock_get_api:
+            mock_api = AsyncMock()
+            mock_api.egress.list_egress.return_value = mock_response
+            mock_get_api.return_value = mock_api
+
+            first = await adapter.get_egress_info("egress-123")
+            second = await adapter.get_egress_info("egress-123")
+
+            assert second == first
+            mock_api.egress.list_egress.assert_awaited_once()
+
+    async def test_stop_invalidates_cached_lookup(self, adapter: LiveKitEgressAdapter) -> None:
+        """Should query the API again after the egress is stopped."""
+        mock_egress_info = MagicMock()
+        mock_egress_info.egress_id = "egress-123"
+        mock_egress_info.room_name = "test-room"
+        mock_egress_info.status = 1  # EGRESS_ACTIVE
+        mock_egress_info.started_at = 1000000000000000000
+        mock_egress_info.ended_at = 0
+        mock_egress_info.error = ""
+        mock_egress_info.segment_results = []
+
+        mock_response = MagicMock()
+        mock_response.items = [mock_egress_info]
+
+        with patch.object(adapter, "_get_api") as mock_get_api:
+            mock_api = AsyncMock()
+            mock_api.egress.list_egress.return_value = mock_response
+            mock_api.egress.stop_egress.return_value = mock_egress_info
+            mock_get_api.return_value = mock_api
+
+            await adapter.get_egress_info("egress-123")
+            await adapter.stop_egress("egress-123")
+            await adapter.get_egress_info("egress-123")
+
+            assert mock_api.egress.list_egress.await_count == 2
+
+    async def test_concurrent_lookups_share_one_call(self, adapter: LiveKitEgressAdapter) -> None:
+        """Should issue one API call for concurrent lookups of the same egress."""
+        mock_response = MagicMock()
+        mock_response.items = []
+
+        with patch.object(adapter, "_get_api") as mock_get_api:
+            mock_api = AsyncMock()
+            mock_api.egress.list_egress.return_value = mock_response
+            mock_get_api.return_value = mock_api
+
+            results = await asyncio.gather(
+                adapter.get_egress_info("egress-123"),
+                adapter.get_egress_info("egress-123"),
+            )
+
+            assert results == [None, None]
+            mock_api.egress.list_egress.assert_awaited_once()
+
 
 class TestClose:
     """Tests for close method."""
@@ -184,6 +271,17 @@ class TestClose:
         mock_api.aclose.assert_called_once()
         assert adapter._api is None
 
+    async def test_closes_shared_http_session(self, adapter: LiveKitEgressAdapter) -> None:
+        """Should close the HTTP session the API client was given."""
+        await adapter._get_api()
+        http = adapter._http
+        assert http is not None
+
+        await adapter.close()
+
+        assert http.closed
+        assert adapter._http is None
+
     async def test_handles_none_api(self, adapter: LiveKitEgressAdapter) -> None:
         """Should handle case when API was never initialized."""
         assert adapter._api is None
@@ -49,6 +49,77 @@ class TestSave:
         assert result.status == RecordingStatus.ACTIVE
         assert result.started_at is not None
 
+    @pytest.mark.asyncio
+    async def test_save_refreshes_loaded_recording(
+        self, recording_repository: PostgresRecordingRepository
+    ) -> None:
+        """Should not serve a stale row after updating a recording already loaded."""
+        recording = RecordingFactory.build_starting()
+        await recording_repository.save(recording)
+        await recording_repository.get_by_id(recording.id)
+
+        recording.activate()
+        await recording_repository.save(recording)
+
+        result = await recording_repository.get_by_id(recording.id)
+        assert result is not None
+        assert result.status == RecordingStatus.ACTIVE
+
+
+class TestSaveMany:
+    """Tests for save_many method."""
+
+    @pytest.mark.asyncio
+    async def test_save_many_inserts_and_updates(
+        self, recording_repository: PostgresRecordingRepository
+    ) -> None:
+        """Should upsert all recordings, keeping the last state of duplicates."""
+        existing = RecordingFactory.build_starting()
+        await recording_repository.save(existing)
+        new = RecordingFactory.build_starting()
+
+        await recording_repository.save_many([existing, new])
+        existing.activate()
+        await recording_repository.save_many([new, existing, existing])
+
+        updated = await recording_repository.get_by_id(existing.id)
+        inserted = await recording_repository.get_by_id(new.id)
+        assert updated is not None
+        assert updated.status == RecordingStatus.ACTIVE
+        assert inserted is not None
+
+
+class TestTransaction:
+    """Tests for transaction method."""
+
+    @pytest.mark.asyncio
+    async def test_commits_writes_on_exit(
+        self, recording_repository: PostgresRecordingRepository
+    ) -> None:
+        """Should keep all writes made inside the block."""
+        recordings = [RecordingFactory.build_starting() for _ in range(2)]
+
+        async with recording_repository.transaction():
+            for recording in recordings:
+                await recording_repository.save(recording)
+
+        for recording in recordings:
+            assert await recording_repository.get_by_id(recording.id) is not None
+
+    @pytest.mark.asyncio
+    async def test_rolls_back_writes_on_error(
+        self, recording_repository: PostgresRecordingRepository
+    ) -> None:
+        """Should discard writes made inside a block that raises."""
+        recording = RecordingFactory.build_starting()
+
+        with pytest.raises(RuntimeError):
+            async with recording_repository.transaction():
+                await recording_repository.save(recording)
+                raise RuntimeError("boom")
+
+        assert await recording_repository.get_by_id(recording.id) is None
+
 
 class TestGetById:
     """Tests for get_by_id method."""
@@ -125,6 +196,25 @@ class TestGetBySessionId:
         assert result is None
 
 
+class TestExistsActive:
+    """Tests for exists_active method."""
+
+    @pytest.mark.asyncio
+    async def test_exists_active_ignores_terminal_recordings(
+        self, recording_repository: PostgresRecordingRepository
+    ) -> None:
+        """Should only report sessions with a non-terminal recording."""
+        session_id = uuid4()
+        await recording_repository.save(RecordingFactory.build_completed(session_id=session_id))
+        await recording_repository.save(RecordingFactory.build_failed(session_id=session_id))
+
+        assert await recording_repository.exists_active(session_id) is False
+
+        await recording_repository.save(RecordingFactory.build_processing(session_id=session_id))
+
+        assert await recording_repository.exists_active(session_id) is True
+
+
 class TestGetByEgressId:
     """Tests for get_by_egress_id method."""
 
@@ -265,6 +355,36 @@ class TestListAll:
         assert total == 5
         assert len(recordings) == 2
 
+    @pytest.mark.asyncio
+    async def test_list_all_page_past_end_reports_total(
+        self, recording_repository: PostgresRecordingRepository
+    ) -> None:
+        """Should still report the total when the page has no rows."""
+        for _ in range(3):
+            await recording_repository.save(RecordingFactory.build_completed())
+
+        recordings, total = await recording_repository.list_all(page=5, page_size=2)
+
+        assert total == 3
+        assert recordings == []
+
+    @pytest.mark.asyncio
+    async def test_list_all_filters_by_status(
+        self, recording_repository: PostgresRecordingRepository
+    ) -> None:
+        """Status filter should apply to both the page and the total."""
+        for _ in range(3):
+            await recording_repository.save(RecordingFactory.build_completed())
+        await recording_repository.save(RecordingFactory.build_active())
+
+        recordings, total = await recording_repository.list_all(
+            page=1, page_size=2, status=RecordingStatus.COMPLETED
+        )
+
+        assert total == 3
+        assert len(recordings) == 2
+        assert all(r.status == RecordingStatus.COMPLETED for r in recordings)
+
     @pytest.mark.asyncio
     async def test_list_all_empty(self, recording_repository: PostgresRecordingRepository) -> None:
         """Should return empty list with zero total when no recordings."""
@@ -295,3 +415,38 @@ class TestListAll:
         # Most recent should be first
         assert recordings[0].id == r3.id
         assert recordings[2].id == r1.id
+
+
+class TestListAfter:
+    """Tests for list_after method."""
+
+    @pytest.mark.asyncio
+    async def test_list_after_continues_from_cursor(
+        self, recording_repository: PostgresRecordingRepository
+    ) -> None:
+        """Should return the recordings older than the cursor, newest first."""
+        for _ in range(4):
+            await recording_repository.save(RecordingFactory.build_completed())
+            await asyncio.sleep(0.01)
+
+        first = await recording_repository.list_after(2)
+        last = first[-1]
+        rest = await recording_repository.list_after(2, cursor=(last.created_at, last.id))
+
+        assert len(first) == 2
+        assert len(rest) == 2
+        assert {r.id for r in first}.isdisjoint(r.id for r in rest)
+        assert rest[0].created_at <= last.created_at
+
+    @pytest.mark.asyncio
+    async def test_list_after_filters_by_status(
+        self, recording_repository: PostgresRecordingRepository
+    ) -> None:
+        """Should only return recordings with the requested status."""
+        await recording_repository.save(RecordingFactory.build_completed())
+        await recording_repository.save(RecordingFactory.build_active())
+
+        recordings = await recording_repository.list_after(10, status=RecordingStatus.ACTIVE)
+
+        assert len(recordings) == 1
+        assert recordings[0].status == RecordingStatus.ACTIVE
@@ -2,6 +2,7 @@
 
 from datetime import UTC
 from datetime import datetime
+from typing import Any
 from unittest.mock import AsyncMock
 from unittest.mock import MagicMock
 from unittest.mock import patch
@@ -23,9 +24,18 @@ def mock_settings() -> Settings:
     settings.s3_secret_key = MagicMock()
     settings.s3_secret_key.get_secret_value.return_value = "test-secret-key"
     settings.s3_region = "us-east-1"
+    settings.s3_max_pool_connections = 64
     return settings
 
 
+def _client_with_pages(pages: list[dict[str, Any]]) -> AsyncMock:
+    """Create a mock S3 client whose list_objects_v2 paginator yields pages."""
+    mock_client = AsyncMock()
+    mock_client.get_paginator = MagicMock()
+    mock_client.get_paginator.return_value.paginate.return_value.__aiter__.return_value = pages
+    return mock_client
+
+
 @pytest.fixture
 def adapter(mock_settings: Settings) -> S3StorageAdapter:
     """Create S3StorageAdapter instance for testing."""
@@ -42,7 +52,7 @@ class TestGeneratePresignedUrl:
         with patch.object(adapter, "_get_client") as mock_get_client:
             mock_client = AsyncMock()
             mock_client.generate_presigned_url.return_value = expected_url
-            mock_get_client.return_value.__aenter__.return_value = mock_client
+            mock_get_client.return_value = mock_client
 
             url = await adapter.generate_presigned_url(
                 bucket="test-bucket",
@@ -65,7 +75,7 @@ class TestGeneratePresignedUrl:
                 {"Error": {"Code": "500", "Message": "Internal error"}},
                 "generate_presigned_url",
             )
-            mock_get_client.return_value.__aenter__.return_value = mock_client
+            mock_get_client.return_value = mock_client
 
             with pytest.raises(StorageError, match="Failed to generate presigned URL"):
                 await adapter.generate_presigned_url(
@@ -73,6 +83,48 @@ class TestGeneratePresignedUrl:
                     key="path/to/file.m3u8",
                 )
 
+    async def test_reuses_recent_url(self, adapter: S3StorageAdapter) -> None:
+        """Should reuse a URL only during the first tenth of its lifetime."""
+        with (
+            patch.object(adapter, "_get_client") as mock_get_client,
+            patch("src.adapters.outbound.s3_storage.time.monotonic") as monotonic,
+        ):
+            mock_client = AsyncMock()
+            mock_client.generate_presigned_url.side_effect = ["url-1", "url-2"]
+            mock_get_client.return_value = mock_client
+
+            monotonic.return_value = 100.0
+            first = await adapter.generate_presigned_url("test-bucket", "a.m3u8", 3600)
+            monotonic.return_value = 400.0
+            second = await adapter.generate_presigned_url("test-bucket", "a.m3u8", 3600)
+            monotonic.return_value = 461.0
+            third = await adapter.generate_presigned_url("test-bucket", "a.m3u8", 3600)
+
+            assert (first, second, third) == ("url-1", "url-1", "url-2")
+
+    async def test_generates_urls_in_key_order(self, adapter: S3StorageAdapter) -> None:
+        """Should return one URL per key, in order."""
+
+        async def presign(_operation: str, **kwargs: Any) -> str:
+            params = kwargs["Params"]
+            return f"https://localhost:9000/{params['Bucket']}/{params['Key']}?expires=60"
+
+        with patch.object(adapter, "_get_client") as mock_get_client:
+            mock_client = AsyncMock()
+            mock_client.generate_presigned_url.side_effect = presign
+            mock_get_client.return_value = mock_client
+
+            urls = await adapter.generate_presigned_urls(
+                bucket="test-bucket",
+                keys=["a.ts", "b.ts"],
+                expiry_seconds=60,
+            )
+
+            assert urls == [
+                "https://localhost:9000/test-bucket/a.ts?expires=60",
+                "https://localhost:9000/test-bucket/b.ts?expires=60",
+            ]
+
 
 class TestObjectExists:
     """Tests for object_exists method."""
@@ -82,7 +134,7 @@ class TestObjectExists:
         with patch.object(adapter, "_get_client") as mock_get_client:
             mock_client = AsyncMock()
             mock_client.head_object.return_value = {"ContentLength": 1024}
-            mock_get_client.return_value.__aenter__.return_value = mock_client
+            mock_get_client.return_value = mock_client
 
             exists = await adapter.object_exists(
                 bucket="test-bucket",
@@ -103,7 +155,7 @@ class TestObjectExists:
                 {"Error": {"Code": "404", "Message": "Not Found"}},
                 "head_object",
             )
-            mock_get_client.return_value.__aenter__.return_value = mock_client
+            mock_get_client.return_value = mock_client
 
             exists = await adapter.object_exists(
                 bucket="test-bucket",
@@ -120,7 +172,7 @@ class TestObjectExists:
                 {"Error": {"Code": "500", "Message": "Server error"}},
                 "head_object",
             )
-            mock_get_client.return_value.__aenter__.return_value = mock_client
+            mock_get_client.return_value = mock_client
 
             with pytest.raises(StorageError, match="Failed to check object existence"):
                 await adapter.object_exists(
@@ -128,6 +180,22 @@ class TestObjectExists:
                     key="file.txt",
                 )
 
+    async def test_caches_positive_result_until_deleted(self, adapter: S3StorageAdapter) -> None:
+        """Should reuse a positive result until the object is deleted."""
+        with patch.object(adapter, "_get_client") as mock_get_client:
+            mock_client = AsyncMock()
+            mock_client.head_object.return_value = {"ContentLength": 1024}
+            mock_get_client.return_value = mock_client
+
+            assert await adapter.object_exists("test-bucket", "file.txt") is True
+            assert await adapter.object_exists("test-bucket", "file.txt") is True
+            assert mock_client.head_object.await_count == 1
+
+            await adapter.delete_object("test-bucket", "file.txt")
+            await adapter.object_exists("test-bucket", "file.txt")
+
+            assert mock_client.head_object.await_count == 2
+
 
 class TestListObjects:
     """Tests for list_objects method."""
@@ -153,9 +221,8 @@ class TestListObjects:
         }
 
         with patch.object(adapter, "_get_client") as mock_get_client:
-            mock_client = AsyncMock()
-            mock_client.list_objects_v2.return_value = mock_response
-            mock_get_client.return_value.__aenter__.return_value = mock_client
+            mock_client = _client_with_pages([mock_response])
+            mock_get_client.return_value = mock_client
 
             objects = await adapter.list_objects(
                 bucket="test-bucket",
@@ -171,13 +238,14 @@ class TestListObjects:
             assert objects[1].bucket == "test-bucket"
             assert objects[1].key == "prefix/file2.txt"
             assert objects[1].size_bytes == 2048
+            # Metadata comes from the LIST response alone, never one HEAD per object
+            mock_client.head_object.assert_not_awaited()
 
     async def test_returns_empty_list_when_no_objects(self, adapter: S3StorageAdapter) -> None:
         """Should return empty list when no objects match prefix."""
         with patch.object(adapter, "_get_client") as mock_get_client:
-            mock_client = AsyncMock()
-            mock_client.list_objects_v2.return_value = {}
-            mock_get_client.return_value.__aenter__.return_value = mock_client
+            mock_client = _client_with_pages([{}])
+            mock_get_client.return_value = mock_client
 
             objects = await adapter.list_objects(
                 bucket="test-bucket",
@@ -186,6 +254,31 @@ class TestListObjects:
 
             assert objects == []
 
+    async def test_collects_objects_across_pages(self, adapter: S3StorageAdapter) -> None:
+        """Should list objects from every page up to max_keys."""
+        now = datetime.now(tz=UTC)
+        pages = [
+            {"Contents": [{"Key": "prefix/first", "Size": 1, "LastModified": now}]},
+            {"Contents": [{"Key": "prefix/second", "Size": 1, "LastModified": now}]},
+        ]
+
+        with patch.object(adapter, "_get_client") as mock_get_client:
+            mock_client = _client_with_pages(pages)
+            mock_get_client.return_value = mock_client
+
+            objects = await adapter.list_objects(
+                bucket="test-bucket",
+                prefix="prefix/",
+                max_keys=2500,
+            )
+
+            assert [o.key for o in objects] == ["prefix/first", "prefix/second"]
+            mock_client.get_paginator.return_value.paginate.assert_called_once_with(
+                Bucket="test-bucket",
+                Prefix="prefix/",
+                PaginationConfig={"MaxItems": 2500, "PageSize": 1000},
+            )
+
 
 class TestDeleteObject:
     """Tests for delete_object method."""
@@ -195,7 +288,7 @@ class TestDeleteObject:
         with patch.object(adapter, "_get_client") as mock_get_client:
             mock_client = AsyncMock()
             mock_client.delete_object.return_value = {}
-            mock_get_client.return_value.__aenter__.return_value = mock_client
+            mock_get_client.return_value = mock_client
 
             # Should not raise
             await adapter.delete_object(
@@ -216,7 +309,7 @@ class TestDeleteObject:
                 {"Error": {"Code": "500", "Message": "Error"}},
                 "delete_object",
             )
-            mock_get_client.return_value.__aenter__.return_value = mock_client
+            mock_get_client.return_value = mock_client
 
             with pytest.raises(StorageError, match="Failed to delete object"):
                 await adapter.delete_object(
@@ -241,7 +334,7 @@ class TestGetObjectInfo:
         with patch.object(adapter, "_get_client") as mock_get_client:
             mock_client = AsyncMock()
             mock_client.head_object.return_value = mock_response
-            mock_get_client.return_value.__aenter__.return_value = mock_client
+            mock_get_client.return_value = mock_client
 
             info = await adapter.get_object_info(
                 bucket="test-bucket",
@@ -263,7 +356,7 @@ class TestGetObjectInfo:
                 {"Error": {"Code": "404", "Message": "Not Found"}},
                 "head_object",
             )
-            mock_get_client.return_value.__aenter__.return_value = mock_client
+            mock_get_client.return_value = mock_client
 
             info = await adapter.get_object_info(
                 bucket="test-bucket",
@@ -273,6 +366,33 @@ class TestGetObjectInfo:
             assert info is None
 
 
+class TestGetManyObjectInfo:
+    """Tests for get_many_object_info method."""
+
+    async def test_returns_info_in_key_order(self, adapter: S3StorageAdapter) -> None:
+        """Should return one result per key, None for missing objects."""
+        now = datetime.now(tz=UTC)
+
+        async def head_object(**kwargs: Any) -> dict[str, Any]:
+            if kwargs["Key"] == "missing.bin":
+                raise ClientError({"Error": {"Code": "404", "Message": "Not Found"}}, "head_object")
+            return {"ContentLength": 1024, "LastModified": now, "ETag": '"abc"'}
+
+        with patch.object(adapter, "_get_client") as mock_get_client:
+            mock_client = AsyncMock()
+            mock_client.head_object.side_effect = head_object
+            mock_get_client.return_value = mock_client
+
+            infos = await adapter.get_many_object_info(
+                bucket="test-bucket",
+                keys=["a.bin", "missing.bin", "bb.bin"],
+                concurrency=2,
+            )
+
+            assert [info.key if info else None for info in infos] == ["a.bin", None, "bb.bin"]
+            assert mock_client.head_object.await_count == 3
+
+
 class TestEnsureBucketExists:
     """Tests for ensure_bucket_exists method."""
 
@@ -281,7 +401,7 @@ class TestEnsureBucketExists:
         with patch.object(adapter, "_get_client") as mock_get_client:
             mock_client = AsyncMock()
             mock_client.head_bucket.return_value = {}
-            mock_get_client.return_value.__aenter__.return_value = mock_client
+            mock_get_client.return_value = mock_client
 
             await adapter.ensure_bucket_exists("existing-bucket")
 
@@ -297,8 +417,48 @@ class TestEnsureBucketExists:
                 "head_bucket",
             )
             mock_client.create_bucket.return_value = {}
-            mock_get_client.return_value.__aenter__.return_value = mock_client
+            mock_get_client.return_value = mock_client
 
             await adapter.ensure_bucket_exists("new-bucket")
 
             mock_client.create_bucket.assert_called_once_with(Bucket="new-bucket")
+
+    async def test_skips_check_for_known_bucket(self, adapter: S3StorageAdapter) -> None:
+        """Should only check a bucket once it is known to exist."""
+        with patch.object(adapter, "_get_client") as mock_get_client:
+            mock_client = AsyncMock()
+            mock_client.head_bucket.return_value = {}
+            mock_get_client.return_value = mock_client
+
+            await adapter.ensure_bucket_exists("existing-bucket")
+            await adapter.ensure_bucket_exists("existing-bucket")
+
+            mock_client.head_bucket.assert_awaited_once_with(Bucket="existing-bucket")
+
+
+class TestClientLifecycle:
+    """Tests for the shared S3 client."""
+
+    async def test_reuses_client_until_closed(self, adapter: S3StorageAdapter) -> None:
+        """Should create one client for all operations and close it once."""
+        mock_client = AsyncMock()
+        client_context = MagicMock()
+        client_context.__aenter__ = AsyncMock(return_value=mock_client)
+        client_context.__aexit__ = AsyncMock(return_value=None)
+
+        with patch.object(adapter, "_session") as mock_session:
+            mock_session.client.return_value = client_context
+
+            first = await adapter._get_client()
+            second = await adapter._get_client()
+            await adapter.close()
+
+            assert first is mock_client
+            assert second is mock_client
+            mock_session.client.assert_called_once()
+            client_context.__aexit__.assert_awaited_once()
+
+    async def test_close_without_client(self, adapter: S3StorageAdapter) -> None:
+        """Should do nothing when no client was created."""
+        # Should not raise
+        await adapter.close()
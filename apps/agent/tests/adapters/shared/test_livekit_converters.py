@@ -3,6 +3,8 @@
 Tests the conversion of LiveKit protocol objects to domain value objects.
 """
 
+from datetime import UTC
+from datetime import datetime
 from typing import Any
 from unittest.mock import MagicMock
 
@@ -120,6 +122,14 @@ class TestConvertEgressInfo:
         assert result.started_at.month == 11
         assert (result.ended_at - result.started_at).seconds == 60
 
+    def test_timestamp_conversion_keeps_microseconds(self) -> None:
+        """Sub-second parts should be truncated to exact microseconds."""
+        lk_info = self._create_mock_egress_info(started_at=1700000000_123456_789)
+
+        result = convert_egress_info(lk_info)
+
+        assert result.started_at == datetime(2023, 11, 14, 22, 13, 20, 123456, tzinfo=UTC)
+
     def test_zero_timestamps_become_none(self) -> None:
         """Zero timestamp values should be converted to None."""
         lk_info = self._create_mock_egress_info(started_at=0, ended_at=0)
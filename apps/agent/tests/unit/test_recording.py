@@ -286,3 +286,15 @@ class TestRecording:
         recording.start_processing()
 
         assert recording.is_active is False
+
+    def test_id_str_matches_id(self) -> None:
+        """id_str should be the string form of the recording ID."""
+        recording = Recording(
+            session_id=uuid4(),
+            egress_id="egress-123",
+            storage_bucket="test-bucket",
+            storage_path="recordings/test",
+        )
+
+        assert recording.id_str == str(recording.id)
+        assert recording.id_str is recording.id_str
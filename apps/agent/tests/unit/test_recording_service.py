@@ -1,7 +1,6 @@
 """Unit tests for Recording Service."""
 
 from unittest.mock import AsyncMock
-from unittest.mock import MagicMock
 from uuid import uuid4
 
 import pytest
@@ -10,6 +9,7 @@ from src.application.ports import EgressConfig
 from src.application.ports import EgressInfo
 from src.application.ports import EgressStatus
 from src.application.ports import ObjectInfo
+from src.application.ports import RecordingRepositoryPort
 from src.application.use_cases import RecordingAlreadyExistsError
 from src.application.use_cases import RecordingNotFoundError
 from src.application.use_cases import RecordingService
@@ -21,7 +21,7 @@ from src.domain.entities import RecordingStatus
 @pytest.fixture
 def mock_recording_repo() -> AsyncMock:
     """Create mock recording repository."""
-    return AsyncMock()
+    return AsyncMock(spec=RecordingRepositoryPort)
 
 
 @pytest.fixture
@@ -67,7 +67,7 @@ class TestStartRecording:
     ) -> None:
         """Starting recording should create Recording in STARTING status."""
         session_id = uuid4()
-        mock_recording_repo.get_by_session_id.return_value = None
+        mock_recording_repo.exists_active.return_value = False
         mock_egress_port.start_room_composite.return_value = EgressInfo(
             egress_id="egress-123",
             room_name="test-room",
@@ -94,7 +94,7 @@ class TestStartRecording:
     ) -> None:
         """Starting recording should call EgressPort.start_room_composite."""
         session_id = uuid4()
-        mock_recording_repo.get_by_session_id.return_value = None
+        mock_recording_repo.exists_active.return_value = False
         mock_egress_port.start_room_composite.return_value = EgressInfo(
             egress_id="egress-123",
             room_name="test-room",
@@ -120,14 +120,7 @@ class TestStartRecording:
     ) -> None:
         """Starting recording when active recording exists should raise."""
         session_id = uuid4()
-        existing_recording = Recording(
-            session_id=session_id,
-            egress_id="existing-egress",
-            storage_bucket="test-bucket",
-            storage_path="recordings/test",
-            status=RecordingStatus.ACTIVE,
-        )
-        mock_recording_repo.get_by_session_id.return_value = existing_recording
+        mock_recording_repo.exists_active.return_value = True
 
         with pytest.raises(RecordingAlreadyExistsError):
             await recording_service.start_recording(
@@ -144,9 +137,7 @@ class TestStartRecording:
     ) -> None:
         """Starting recording should be allowed if previous recording is completed."""
         session_id = uuid4()
-        existing_recording = MagicMock()
-        existing_recording.is_terminal = True
-        mock_recording_repo.get_by_session_id.return_value = existing_recording
+        mock_recording_repo.exists_active.return_value = False
         mock_egress_port.start_room_composite.return_value = EgressInfo(
             egress_id="egress-123",
             room_name="test-room",
@@ -260,6 +251,40 @@ class TestStopRecording:
         mock_egress_port.stop_egress.assert_not_called()
         mock_recording_repo.save.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_stop_recording_keeps_state_set_while_egress_stopped(
+        self,
+        recording_service: RecordingService,
+        mock_recording_repo: AsyncMock,
+        mock_egress_port: AsyncMock,
+    ) -> None:
+        """A webhook applied while the egress was stopping should not be overwritten."""
+        session_id = uuid4()
+        recording = Recording(
+            session_id=session_id,
+            egress_id="egress-123",
+            storage_bucket="test-bucket",
+            storage_path="recordings/test",
+        )
+        recording.activate()
+        failed = Recording(
+            session_id=session_id,
+            egress_id="egress-123",
+            storage_bucket="test-bucket",
+            storage_path="recordings/test",
+            id=recording.id,
+        )
+        failed.fail("Network error")
+        mock_recording_repo.get_by_session_id.side_effect = [recording, failed]
+
+        result = await recording_service.stop_recording(session_id)
+
+        assert result is failed
+        assert result.status == RecordingStatus.FAILED
+        mock_egress_port.stop_egress.assert_awaited_once_with("egress-123")
+        mock_recording_repo.save.assert_not_called()
+        assert mock_recording_repo.transaction.call_count == 2
+
 
 class TestHandleEgressEvent:
     """Tests for handle_egress_event method."""
@@ -375,6 +400,45 @@ class TestHandleEgressEvent:
         assert result is None
 
 
+class TestHandleEgressEvents:
+    """Tests for handle_egress_events method."""
+
+    @pytest.mark.asyncio
+    async def test_saves_final_state_once(
+        self,
+        recording_service: RecordingService,
+        mock_recording_repo: AsyncMock,
+    ) -> None:
+        """Events for one recording should load and save it once."""
+        recording = Recording(
+            session_id=uuid4(),
+            egress_id="egress-123",
+            storage_bucket="test-bucket",
+            storage_path="recordings/test",
+        )
+        mock_recording_repo.get_by_egress_id.side_effect = [recording, None]
+
+        results = await recording_service.handle_egress_events(
+            [
+                EgressInfo(egress_id="egress-123", room_name="r", status=EgressStatus.ACTIVE),
+                EgressInfo(egress_id="unknown", room_name="r", status=EgressStatus.ACTIVE),
+                EgressInfo(
+                    egress_id="egress-123",
+                    room_name="r",
+                    status=EgressStatus.FAILED,
+                    error="Network error",
+                ),
+            ]
+        )
+
+        assert results == [recording, None, recording]
+        assert recording.status == RecordingStatus.FAILED
+        assert mock_recording_repo.get_by_egress_id.await_count == 2
+        mock_recording_repo.save_many.assert_awaited_once_with([recording])
+        mock_recording_repo.save.assert_not_called()
+        mock_recording_repo.transaction.assert_called_once_with()
+
+
 class TestGetPlaybackUrl:
     """Tests for get_playback_url method."""
 